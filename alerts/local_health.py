@@ -43,7 +43,10 @@ class LocalPipelineHealthMonitor:
         run_id = str(summary.get("run_id") or "unknown")
         alerts: list[LocalHealthAlert] = []
 
-        raw_count = int(summary.get("raw_headlines_collected") or 0)
+        # Fetched counts items the ingestion cursors filtered out as already seen.
+        raw_count = int(
+            summary.get("raw_headlines_fetched", summary.get("raw_headlines_collected")) or 0
+        )
         if raw_count < settings.health_min_raw_headlines_per_run:
             alerts.append(
                 self._alert(
@@ -51,11 +54,11 @@ class LocalPipelineHealthMonitor:
                     alert_type="low_headline_coverage",
                     severity="warning",
                     message=(
-                        f"Only {raw_count} raw headlines were collected; "
+                        f"Only {raw_count} raw headlines were fetched; "
                         f"expected at least {settings.health_min_raw_headlines_per_run}."
                     ),
                     details={
-                        "raw_headlines_collected": raw_count,
+                        "raw_headlines_fetched": raw_count,
                         "threshold": settings.health_min_raw_headlines_per_run,
                     },
                 )
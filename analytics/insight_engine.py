@@ -7,6 +7,7 @@ import pandas as pd
 
 from config import settings
 from config.news_topics import get_sector_for_ticker
+from models.headline_batch import HeadlineBatch
 from models.insight import Insight
 
 
@@ -31,10 +32,13 @@ class InsightEngine:
 
     def generate_insights(
         self,
-        scored_headlines: pd.DataFrame,
+        scored_headlines: pd.DataFrame | HeadlineBatch,
         as_of_date: date | None = None,
         finnhub_scores: dict[str, float] | None = None,
     ) -> list[Insight]:
+        if isinstance(scored_headlines, HeadlineBatch):
+            # Plain string columns: missing categories are filled below.
+            scored_headlines = scored_headlines.to_frame(dictionary_encoded=False)
         if scored_headlines.empty:
             return []
 
@@ -76,8 +80,9 @@ class InsightEngine:
             weighted_score = float((group["compound_score"] * weights).sum() / weights.sum())
             weighted_confidence = float((group["confidence"] * weights).sum() / weights.sum())
             finnhub_score = finnhub_scores.get(ticker_text)
+            story_count = self._story_count(group)
             signal_score = self._combine_model_scores(
-                self._apply_volume_boost(weighted_score, len(group)),
+                self._apply_volume_boost(weighted_score, story_count),
                 finnhub_score,
             )
             signal_label = self._signal_label(signal_score)
@@ -105,7 +110,7 @@ class InsightEngine:
                 confidence=weighted_confidence,
                 source_diversity_score=source_diversity_score,
                 consensus_score=consensus_score,
-                headline_count=len(group),
+                headline_count=story_count,
             )
 
             category_counts = group["category"].value_counts().to_dict()
@@ -120,7 +125,7 @@ class InsightEngine:
                     signal_label=signal_label,
                     signal_score=round(signal_score, 6),
                     confidence=round(weighted_confidence, 6),
-                    headline_count=len(group),
+                    headline_count=story_count,
                     political_headline_count=political_count,
                     financial_headline_count=financial_count,
                     category_mix=self._category_mix(category_counts),
@@ -157,6 +162,14 @@ class InsightEngine:
         category_weight = group["category"].map({"political": 1.15}).fillna(1.0)
         return group["confidence"].clip(lower=0.2) * source_weight * category_weight
 
+    @staticmethod
+    def _story_count(group: pd.DataFrame) -> int:
+        """Distinct stories: near-duplicate copies share a story_cluster_id."""
+        if "story_cluster_id" not in group.columns:
+            return len(group)
+        cluster_ids = group["story_cluster_id"].replace("", None)
+        return int(cluster_ids.nunique() + cluster_ids.isna().sum())
+
     @staticmethod
     def _apply_volume_boost(score: float, headline_count: int) -> float:
         if abs(score) < 1e-9:
@@ -625,6 +625,10 @@ def classify_policy_impact(text: str) -> str:
         for keyword in POLICY_RESTRICTIVE_KEYWORDS
         if keyword.casefold() in normalized
     )
+    return policy_impact_from_hits(supportive_hits, restrictive_hits)
+
+
+def policy_impact_from_hits(supportive_hits: int, restrictive_hits: int) -> str:
     if supportive_hits > restrictive_hits:
         return "supportive"
     if restrictive_hits > supportive_hits:
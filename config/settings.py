@@ -54,6 +54,34 @@ class Settings:
         "ProsusAI/finbert"
     )
     sentiment_backend: str = os.getenv("SENTIMENT_BACKEND", "lexicon").lower()
+    finbert_onnx_dir: str = os.getenv("FINBERT_ONNX_DIR", ".data/onnx")
+    finbert_onnx_quantize: bool = (
+        os.getenv("FINBERT_ONNX_QUANTIZE", "true").lower() == "true"
+    )
+    finbert_score_summaries: bool = (
+        os.getenv("FINBERT_SCORE_SUMMARIES", "false").lower() == "true"
+    )
+    finbert_summary_chunk_tokens: int = int(os.getenv("FINBERT_SUMMARY_CHUNK_TOKENS", "256"))
+    finbert_summary_chunk_overlap: int = int(os.getenv("FINBERT_SUMMARY_CHUNK_OVERLAP", "64"))
+    source_tiers_path: str = os.getenv("SOURCE_TIERS_PATH", "config/source_tiers.json")
+    source_tiers_reload_seconds: float = float(os.getenv("SOURCE_TIERS_RELOAD_SECONDS", "60"))
+    sentiment_cache_path: str = os.getenv(
+        "SENTIMENT_CACHE_PATH",
+        ".data/sentiment_scores.sqlite",
+    )
+    sentiment_cache_max_entries: int = int(
+        os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", "200000")
+    )
+    sentiment_cascade_backend: str = os.getenv("SENTIMENT_CASCADE_BACKEND", "finbert").lower()
+    sentiment_cascade_confidence_threshold: float = float(
+        os.getenv("SENTIMENT_CASCADE_CONFIDENCE_THRESHOLD", "0.55")
+    )
+    sentiment_warmup: bool = os.getenv("SENTIMENT_WARMUP", "true").lower() == "true"
+    sentiment_workers: int = int(os.getenv("SENTIMENT_WORKERS", "1"))
+    sentiment_worker_chunk_size: int = int(
+        os.getenv("SENTIMENT_WORKER_CHUNK_SIZE", "256")
+    )
+    sentiment_worker_start_method: str = os.getenv("SENTIMENT_WORKER_START_METHOD", "").lower()
 
     # Pipeline Behavior
     polling_interval_minutes: int = int(os.getenv("POLLING_INTERVAL_MINUTES", "30"))
@@ -67,9 +95,49 @@ class Settings:
     public_news_timeout_seconds: int = int(
         os.getenv("PUBLIC_NEWS_TIMEOUT_SECONDS", "20")
     )
+    public_news_max_workers: int = int(os.getenv("PUBLIC_NEWS_MAX_WORKERS", "1"))
+    public_news_max_requests_per_host: int = int(
+        os.getenv("PUBLIC_NEWS_MAX_REQUESTS_PER_HOST", "4")
+    )
+    feed_cache_path: str = os.getenv("FEED_CACHE_PATH", ".data/feed_validators.json")
+    ingestion_cursor_path: str = os.getenv(
+        "INGESTION_CURSOR_PATH",
+        ".data/ingestion_cursors.json",
+    )
+    async_ingestion_enabled: bool = (
+        os.getenv("ASYNC_INGESTION_ENABLED", "false").lower() == "true"
+    )
+    async_ingestion_max_concurrency: int = int(
+        os.getenv("ASYNC_INGESTION_MAX_CONCURRENCY", "100")
+    )
+    finnhub_max_concurrency: int = int(os.getenv("FINNHUB_MAX_CONCURRENCY", "8"))
+    http_pool_maxsize: int = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+    http_retries: int = int(os.getenv("HTTP_RETRIES", "3"))
+    http_backoff_seconds: float = float(os.getenv("HTTP_BACKOFF_SECONDS", "0.5"))
+    http_timeout_seconds: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "30"))
+    finnhub_requests_per_minute: float = float(
+        os.getenv("FINNHUB_REQUESTS_PER_MINUTE", "60")
+    )
+    finnhub_sentiment_ttl_minutes: float = float(
+        os.getenv("FINNHUB_SENTIMENT_TTL_MINUTES", "180")
+    )
+    finnhub_sentiment_stale_while_revalidate: bool = (
+        os.getenv("FINNHUB_SENTIMENT_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+    )
+    backfill_checkpoint_path: str = os.getenv(
+        "BACKFILL_CHECKPOINT_PATH",
+        ".data/backfill_checkpoints.jsonl",
+    )
     political_news_enabled: bool = (
         os.getenv("POLITICAL_NEWS_ENABLED", "true").lower() == "true"
     )
+    near_duplicate_enabled: bool = (
+        os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+    )
+    near_duplicate_threshold: float = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.85"))
+    near_duplicate_window_hours: float = float(
+        os.getenv("NEAR_DUPLICATE_WINDOW_HOURS", "24")
+    )
     insight_lookback_hours: int = int(os.getenv("INSIGHT_LOOKBACK_HOURS", "72"))
     insight_horizon_days: int = int(os.getenv("INSIGHT_HORIZON_DAYS", "5"))
     positive_signal_threshold: float = float(
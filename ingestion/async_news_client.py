@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Iterable, List
+from urllib.parse import urlsplit
+
+from config import settings
+from ingestion.finnhub_client import FinnhubClient
+from ingestion.ingestion_cursors import IngestionCursorStore
+from ingestion.feed_cache import FeedValidatorCache
+from ingestion.public_news_client import FeedDownload, PublicNewsClient
+from models.raw_headline import RawHeadline
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Quicksilver local research pipeline (contact: local-demo@example.com)"
+
+
+def build_async_http_client(
+    max_connections: int = 100,
+    timeout_seconds: float = 20,
+) -> Any:
+    if httpx is None:
+        raise RuntimeError(
+            "Async ingestion requires the optional httpx dependency. "
+            "Install requirements/full.txt or leave ASYNC_INGESTION_ENABLED=false "
+            "for the thread-based clients."
+        )
+
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=timeout_seconds,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
+class AsyncPublicNewsClient(PublicNewsClient):
+    """
+    Event-loop counterpart of PublicNewsClient.
+
+    Every Google News search and public feed for a run is downloaded
+    concurrently over one shared async HTTP client, then parsed and mapped to
+    tickers by the inherited sequential logic, so results match the
+    thread-based client exactly.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: int = 20,
+        max_items_per_feed: int = 8,
+        client: Any | None = None,
+        max_concurrency: int = 100,
+        max_requests_per_host: int = 4,
+        validator_cache: FeedValidatorCache | None = None,
+        cursor_store: IngestionCursorStore | None = None,
+    ) -> None:
+        super().__init__(
+            timeout_seconds=timeout_seconds,
+            max_items_per_feed=max_items_per_feed,
+            max_requests_per_host=max_requests_per_host,
+            validator_cache=validator_cache,
+            cursor_store=cursor_store,
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self._client = client
+
+    async def fetch_headlines_async(
+        self,
+        tickers: Iterable[str],
+        lookback_days: int,
+        include_financial: bool = True,
+        include_political: bool = True,
+    ) -> list[RawHeadline]:
+        ticker_list = [ticker.upper() for ticker in tickers]
+        urls = self._planned_feed_urls(ticker_list, include_financial, include_political)
+        await self._prefetch_feeds_async(urls)
+
+        try:
+            return self._build_headlines(
+                ticker_list,
+                lookback_days,
+                include_financial,
+                include_political,
+            )
+        finally:
+            self._prefetched.clear()
+
+    async def _prefetch_feeds_async(self, urls: list[str]) -> None:
+        client = self._client or build_async_http_client(
+            max_connections=self.max_concurrency,
+            timeout_seconds=self.timeout_seconds,
+        )
+        overall_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def download(url: str) -> FeedDownload | None:
+            host = urlsplit(url).netloc.lower()
+            host_limit = host_limits.setdefault(
+                host,
+                asyncio.Semaphore(self.max_requests_per_host),
+            )
+            async with overall_limit, host_limit:
+                return await self._download_feed_async(client, url)
+
+        try:
+            contents = await asyncio.gather(*(download(url) for url in urls))
+        finally:
+            if self._client is None:
+                await client.aclose()
+
+        self._prefetched = dict(zip(urls, contents))
+
+    async def _download_feed_async(self, client: Any, url: str) -> FeedDownload | None:
+        request_kwargs: dict[str, Any] = {"timeout": self.timeout_seconds}
+        if self.validator_cache is not None:
+            conditional_headers = self.validator_cache.request_headers(url)
+            if conditional_headers:
+                request_kwargs["headers"] = conditional_headers
+
+        try:
+            response = await client.get(url, **request_kwargs)
+            response.raise_for_status()
+        except Exception as error:
+            logger.warning("Skipping feed %s: %s", url, error)
+            return None
+
+        return self._feed_download_from_response(response)
+
+
+class AsyncFinnhubClient:
+    """Fetches Finnhub company news for many tickers over one event loop."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = "https://finnhub.io/api/v1",
+        client: Any | None = None,
+        max_concurrency: int = 8,
+        timeout_seconds: float = 30,
+        cursor_store: IngestionCursorStore | None = None,
+    ) -> None:
+        self.api_key = api_key or settings.finnhub_api_key
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.cursor_store = cursor_store
+        self._client = client
+
+        if not self.api_key:
+            raise ValueError("FINNHUB_API_KEY is not set.")
+
+    async def fetch_company_news(
+        self,
+        client: Any,
+        ticker: str,
+        from_date: str,
+        to_date: str,
+    ) -> List[RawHeadline]:
+        params = {
+            "symbol": ticker,
+            "from": from_date,
+            "to": to_date,
+            "token": self.api_key,
+        }
+
+        response = await client.get(
+            f"{self.base_url}/company-news",
+            params=params,
+            timeout=self.timeout_seconds,
+        )
+        FinnhubClient.raise_for_rate_limit(response)
+        response.raise_for_status()
+
+        return FinnhubClient.new_headlines_only(
+            ticker,
+            FinnhubClient.headlines_from_payload(ticker, response.json()),
+            self.cursor_store,
+        )
+
+    async def fetch_batch_news(
+        self,
+        tickers: List[str],
+        from_date: str,
+        to_date: str,
+    ) -> List[RawHeadline]:
+        client = self._client or build_async_http_client(
+            max_connections=self.max_concurrency,
+            timeout_seconds=self.timeout_seconds,
+        )
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(ticker: str) -> List[RawHeadline]:
+            async with limit:
+                try:
+                    return await self.fetch_company_news(client, ticker, from_date, to_date)
+                except Exception as error:
+                    logger.warning("Skipping Finnhub news for %s: %s", ticker, error)
+                    return []
+
+        try:
+            results = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+        finally:
+            if self._client is None:
+                await client.aclose()
+
+        all_headlines: List[RawHeadline] = []
+        for headlines in results:
+            all_headlines.extend(headlines)
+        return all_headlines
+
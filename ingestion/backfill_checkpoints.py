@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+import json
+import logging
+import os
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BackfillCheckpoint:
+    ticker: str
+    window_start: date
+    window_end: date
+    headline_count: int
+
+
+class BackfillCheckpointStore:
+    """
+    Append-only record of backfill windows that were fetched and stored.
+
+    Each completed (ticker, window) is appended as one JSON line and fsynced,
+    so a crash loses at most the line being written; that partial line is
+    truncated on the next load so later records start on a clean line.
+    Without `resume` an existing file is deleted, with a warning that names
+    how many windows are discarded. A window counts as finished when
+    completed windows for its ticker cover every day in it, which also
+    recognises windows the backfill previously split adaptively.
+    """
+
+    def __init__(self, path: str | Path, resume: bool = True) -> None:
+        self.path = Path(path)
+        self._days_by_ticker: dict[str, set[date]] = {}
+        self.checkpoints: list[BackfillCheckpoint] = []
+
+        if resume:
+            for checkpoint in self._load():
+                self._remember(checkpoint)
+        elif self.path.exists():
+            discarded = len(self._load())
+            logger.warning(
+                "Discarding %s completed backfill window(s) in %s.",
+                discarded,
+                self.path,
+            )
+            self.path.unlink()
+
+    def is_complete(self, ticker: str, window_start: date, window_end: date) -> bool:
+        completed_days = self._days_by_ticker.get(ticker)
+        if not completed_days:
+            return False
+
+        day = window_start
+        while day <= window_end:
+            if day not in completed_days:
+                return False
+            day += timedelta(days=1)
+        return True
+
+    def mark_complete(
+        self,
+        ticker: str,
+        window_start: date,
+        window_end: date,
+        headline_count: int,
+    ) -> None:
+        checkpoint = BackfillCheckpoint(ticker, window_start, window_end, headline_count)
+        self._remember(checkpoint)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = asdict(checkpoint)
+        payload["window_start"] = window_start.isoformat()
+        payload["window_end"] = window_end.isoformat()
+        with self.path.open("a") as checkpoint_file:
+            checkpoint_file.write(json.dumps(payload) + "\n")
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+    def _remember(self, checkpoint: BackfillCheckpoint) -> None:
+        self.checkpoints.append(checkpoint)
+        completed_days = self._days_by_ticker.setdefault(checkpoint.ticker, set())
+        day = checkpoint.window_start
+        while day <= checkpoint.window_end:
+            completed_days.add(day)
+            day += timedelta(days=1)
+
+    def _load(self) -> list[BackfillCheckpoint]:
+        if not self.path.exists():
+            return []
+
+        content = self.path.read_bytes()
+        if content and not content.endswith(b"\n"):
+            # A crash mid-write leaves a partial last line; drop it so the next
+            # record is not appended onto it.
+            complete_length = content.rfind(b"\n") + 1
+            logger.warning(
+                "Truncating partial last line of backfill checkpoints %s.",
+                self.path,
+            )
+            os.truncate(self.path, complete_length)
+            content = content[:complete_length]
+
+        checkpoints: list[BackfillCheckpoint] = []
+        lines = content.decode("utf-8", errors="replace").splitlines()
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+                checkpoints.append(
+                    BackfillCheckpoint(
+                        ticker=str(payload["ticker"]).upper(),
+                        window_start=date.fromisoformat(payload["window_start"]),
+                        window_end=date.fromisoformat(payload["window_end"]),
+                        headline_count=int(payload["headline_count"]),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                logger.warning(
+                    "Ignoring unreadable backfill checkpoint %s:%s: %s",
+                    self.path,
+                    line_number,
+                    error,
+                )
+        return checkpoints
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class FeedCacheStats:
+    responses: int = 0
+    not_modified: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+    parse_seconds: float = 0.0
+    parse_seconds_saved: float = 0.0
+
+
+@dataclass(slots=True)
+class FeedCacheEntry:
+    etag: str | None = None
+    last_modified: str | None = None
+    content_length: int = 0
+    parse_seconds: float = 0.0
+    items: list[dict[str, Any]] = field(default_factory=list)
+
+
+class FeedValidatorCache:
+    """
+    Persists HTTP validators and the last parsed items for each feed URL.
+
+    PublicNewsClient sends the stored ETag / Last-Modified values as
+    If-None-Match / If-Modified-Since. On a 304 it reuses the cached items
+    instead of downloading and parsing the feed again. Stats are per
+    instance, so a cache built once per pipeline run reports per-run savings.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.stats = FeedCacheStats()
+        self._entries = self._load()
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return {}
+
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def cached_items(self, url: str) -> list[dict[str, Any]] | None:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+
+        self.stats.responses += 1
+        self.stats.not_modified += 1
+        self.stats.bytes_saved += entry.content_length
+        self.stats.parse_seconds_saved += entry.parse_seconds
+        return entry.items
+
+    def store(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        content_length: int,
+        parse_seconds: float,
+        items: list[dict[str, Any]],
+    ) -> None:
+        self.stats.responses += 1
+        self.stats.bytes_downloaded += content_length
+        self.stats.parse_seconds += parse_seconds
+        if not etag and not last_modified:
+            self._entries.pop(url, None)
+            return
+
+        self._entries[url] = FeedCacheEntry(
+            etag=etag,
+            last_modified=last_modified,
+            content_length=content_length,
+            parse_seconds=parse_seconds,
+            items=items,
+        )
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temporary_path.write_text(
+            json.dumps(
+                {url: asdict(entry) for url, entry in self._entries.items()}
+            )
+        )
+        os.replace(temporary_path, self.path)
+
+    def _load(self) -> dict[str, FeedCacheEntry]:
+        if not self.path.exists():
+            return {}
+
+        try:
+            payload = json.loads(self.path.read_text())
+            return {
+                str(url): FeedCacheEntry(**entry)
+                for url, entry in payload.items()
+            }
+        except (OSError, TypeError, ValueError) as error:
+            logger.warning("Ignoring unreadable feed cache %s: %s", self.path, error)
+            return {}
+
@@ -1,21 +1,43 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, List
 
 import requests
 
 from config import settings
+from ingestion.http_sessions import shared_http_session
+from ingestion.ingestion_cursors import IngestionCursorStore
 from models.raw_headline import RawHeadline
 
 
+CURSOR_SOURCE = "finnhub"
+
+
+class FinnhubRateLimitError(RuntimeError):
+    """Raised on HTTP 429 so callers can honour Finnhub's Retry-After."""
+
+    def __init__(self, retry_after_seconds: float | None = None) -> None:
+        super().__init__(
+            "Finnhub rate limit exceeded"
+            + (f"; retry after {retry_after_seconds:.1f}s." if retry_after_seconds else ".")
+        )
+        self.retry_after_seconds = retry_after_seconds
+
+
 class FinnhubClient:
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str = "https://finnhub.io/api/v1",
+        cursor_store: IngestionCursorStore | None = None,
+        session: requests.Session | None = None,
     ):
         self.api_key = api_key or settings.finnhub_api_key
         self.base_url = base_url.rstrip("/")
+        self.cursor_store = cursor_store
+        self._session = session or shared_http_session()
 
         if not self.api_key:
             raise ValueError("FINNHUB_API_KEY is not set.")
@@ -29,11 +51,44 @@ class FinnhubClient:
             "token": self.api_key,
         }
 
-        response = requests.get(url, params=params, timeout=30)
+        response = self._session.get(url, params=params, timeout=30)
+        self.raise_for_rate_limit(response)
         response.raise_for_status()
 
-        payload = response.json()
+        return self.new_headlines_only(
+            ticker,
+            self.headlines_from_payload(ticker, response.json()),
+            self.cursor_store,
+        )
 
+    @staticmethod
+    def raise_for_rate_limit(response: Any) -> None:
+        if getattr(response, "status_code", None) != 429:
+            return
+
+        headers = getattr(response, "headers", None) or {}
+        raise FinnhubRateLimitError(
+            FinnhubClient.retry_after_seconds(headers.get("Retry-After"))
+        )
+
+    @staticmethod
+    def retry_after_seconds(value: str | None) -> float | None:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def headlines_from_payload(ticker: str, payload: Any) -> List[RawHeadline]:
         if not isinstance(payload, list):
             return []
 
@@ -63,6 +118,36 @@ class FinnhubClient:
 
         return headlines
 
+    @staticmethod
+    def new_headlines_only(
+        ticker: str,
+        headlines: List[RawHeadline],
+        cursor_store: IngestionCursorStore | None,
+    ) -> List[RawHeadline]:
+        if cursor_store is None:
+            return headlines
+
+        new_headlines: List[RawHeadline] = []
+        for headline in headlines:
+            published_at = FinnhubClient._published_at_datetime(headline.published_at_utc)
+            if published_at is None:
+                new_headlines.append(headline)
+                continue
+            item_id = headline.url or headline.headline
+            if cursor_store.is_new(CURSOR_SOURCE, ticker, published_at, item_id=item_id):
+                cursor_store.advance(CURSOR_SOURCE, ticker, published_at, item_id=item_id)
+                new_headlines.append(headline)
+        return new_headlines
+
+    @staticmethod
+    def _published_at_datetime(value: Any) -> datetime | None:
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        try:
+            return datetime.fromtimestamp(float(value), tz=timezone.utc)
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+
     def fetch_batch_news(
         self,
         tickers: List[str],
@@ -86,7 +171,8 @@ class FinnhubClient:
             "token": self.api_key,
         }
 
-        response = requests.get(url, params=params, timeout=30)
+        response = self._session.get(url, params=params, timeout=30)
+        self.raise_for_rate_limit(response)
         response.raise_for_status()
         payload = response.json()
         if not isinstance(payload, dict):
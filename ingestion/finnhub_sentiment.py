@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Callable, Iterable
+
+from ingestion.finnhub_client import FinnhubClient, FinnhubRateLimitError
+from ingestion.rate_limiter import TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SentimentCacheStats:
+    fresh_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    background_refreshes: int = 0
+
+
+@dataclass(slots=True)
+class CachedSentimentScore:
+    score: float | None
+    fetched_at: float
+
+
+class FinnhubSentimentCollector:
+    """
+    Concurrent, rate-limited `/news-sentiment` fetcher with a per-ticker TTL cache.
+
+    Scores younger than `ttl_seconds` are served from memory. Older scores
+    are either refetched before returning or, with `stale_while_revalidate`,
+    returned immediately while one background worker refreshes them for the
+    next call. Tickers without a Finnhub score are cached too; failures are
+    not, so they retry on the next call.
+    """
+
+    def __init__(
+        self,
+        client: FinnhubClient,
+        ttl_seconds: float = 3 * 60 * 60,
+        max_workers: int = 8,
+        rate_limiter: TokenBucket | None = None,
+        stale_while_revalidate: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stats = SentimentCacheStats()
+        self._clock = clock
+        self._entries: dict[str, CachedSentimentScore] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._background: ThreadPoolExecutor | None = None
+
+    def collect(self, tickers: Iterable[str]) -> dict[str, float]:
+        ticker_list = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        now = self._clock()
+        scores: dict[str, float] = {}
+        missing: list[str] = []
+        stale: list[str] = []
+
+        with self._lock:
+            for ticker in ticker_list:
+                entry = self._entries.get(ticker)
+                if entry is None:
+                    self.stats.misses += 1
+                    missing.append(ticker)
+                    continue
+                if now - entry.fetched_at < self.ttl_seconds:
+                    self.stats.fresh_hits += 1
+                elif self.stale_while_revalidate:
+                    self.stats.stale_hits += 1
+                    stale.append(ticker)
+                else:
+                    self.stats.misses += 1
+                    missing.append(ticker)
+                    continue
+                if entry.score is not None:
+                    scores[ticker] = entry.score
+
+        scores.update(self._fetch(missing))
+        if stale:
+            self._refresh_in_background(stale)
+
+        return {ticker: scores[ticker] for ticker in ticker_list if ticker in scores}
+
+    def reset_run_stats(self) -> None:
+        """Start a new per-run stats window; cached scores are kept."""
+        with self._lock:
+            self.stats = SentimentCacheStats()
+
+    def close(self) -> None:
+        if self._background is not None:
+            self._background.shutdown(wait=True)
+            self._background = None
+
+    def _fetch(self, tickers: list[str]) -> dict[str, float]:
+        if not tickers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tickers))) as executor:
+            results = list(executor.map(self._fetch_one, tickers))
+
+        return {
+            ticker: score
+            for ticker, (fetched, score) in zip(tickers, results)
+            if fetched and score is not None
+        }
+
+    def _fetch_one(self, ticker: str) -> tuple[bool, float | None]:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        try:
+            score = self.client.fetch_news_sentiment_score(ticker)
+        except FinnhubRateLimitError as error:
+            if self.rate_limiter:
+                self.rate_limiter.pause(error.retry_after_seconds or 1.0)
+            self._record_failure(ticker, error)
+            return False, None
+        except Exception as error:
+            self._record_failure(ticker, error)
+            return False, None
+
+        with self._lock:
+            self.stats.requests += 1
+            self._entries[ticker] = CachedSentimentScore(score, self._clock())
+        return True, score
+
+    def _record_failure(self, ticker: str, error: Exception) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.failed_requests += 1
+        logger.warning("Skipping Finnhub sentiment score for %s: %s", ticker, error)
+
+    def _refresh_in_background(self, tickers: list[str]) -> None:
+        with self._lock:
+            pending = [ticker for ticker in tickers if ticker not in self._refreshing]
+            if not pending:
+                return
+            self._refreshing.update(pending)
+            self.stats.background_refreshes += 1
+            if self._background is None:
+                self._background = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="finnhub-sentiment-refresh",
+                )
+            background = self._background
+
+        background.submit(self._refresh, pending)
+
+    def _refresh(self, tickers: list[str]) -> None:
+        try:
+            self._fetch(tickers)
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(tickers)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from config import settings
+
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+@dataclass(slots=True)
+class HostConnectionStats:
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        return max(0, self.requests - self.new_connections)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Keep-alive adapter with retries, a default timeout and per-host counters.
+
+    Requests are counted in `send` and TCP/TLS connections in the connection
+    pools' `_new_conn`, so `connection_stats()` shows how often a request
+    reused a pooled connection instead of paying for a new handshake. 429
+    is left to callers, which own rate limiting.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 32,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout_seconds: float = 30,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self._stats: dict[str, HostConnectionStats] = {}
+        self._stats_lock = threading.Lock()
+        super().__init__(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                raise_on_status=False,
+            ),
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._record_new_connection),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._record_new_connection),
+        }
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout_seconds
+        host = (urlsplit(request.url or "").hostname or "").lower()
+        with self._stats_lock:
+            self._stats.setdefault(host, HostConnectionStats()).requests += 1
+        return super().send(request, **kwargs)
+
+    def connection_stats(self) -> dict[str, HostConnectionStats]:
+        with self._stats_lock:
+            return {
+                host: HostConnectionStats(stats.requests, stats.new_connections)
+                for host, stats in self._stats.items()
+            }
+
+    def _record_new_connection(self, host: str) -> None:
+        with self._stats_lock:
+            self._stats.setdefault(host.lower(), HostConnectionStats()).new_connections += 1
+
+
+def _counting_pool_class(
+    base: type[HTTPConnectionPool],
+    on_new_connection: Callable[[str], None],
+) -> type[HTTPConnectionPool]:
+    class CountingConnectionPool(base):  # type: ignore[valid-type, misc]
+        def _new_conn(self):  # type: ignore[no-untyped-def]
+            on_new_connection(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+def build_pooled_session(
+    pool_maxsize: int | None = None,
+    retries: int | None = None,
+    backoff_factor: float | None = None,
+    timeout_seconds: float | None = None,
+) -> requests.Session:
+    adapter = PooledHTTPAdapter(
+        pool_maxsize=pool_maxsize if pool_maxsize is not None else settings.http_pool_maxsize,
+        retries=retries if retries is not None else settings.http_retries,
+        backoff_factor=(
+            backoff_factor if backoff_factor is not None else settings.http_backoff_seconds
+        ),
+        timeout_seconds=(
+            timeout_seconds if timeout_seconds is not None else settings.http_timeout_seconds
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_http_session() -> requests.Session:
+    """Process-wide pooled session used by API clients unless one is injected."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = build_pooled_session()
+        return _shared_session
+
+
+def session_connection_stats(session: Any) -> dict[str, HostConnectionStats]:
+    stats: dict[str, HostConnectionStats] = {}
+    adapters = getattr(session, "adapters", {}) or {}
+    for adapter in {id(adapter): adapter for adapter in adapters.values()}.values():
+        if not isinstance(adapter, PooledHTTPAdapter):
+            continue
+        for host, host_stats in adapter.connection_stats().items():
+            merged = stats.setdefault(host, HostConnectionStats())
+            merged.requests += host_stats.requests
+            merged.new_connections += host_stats.new_connections
+    return stats
+
+
+def connection_stats_summary(session: Any | None = None) -> dict[str, dict[str, int]]:
+    """JSON-friendly per-host counters; defaults to the shared session."""
+    return {
+        host: {
+            "requests": stats.requests,
+            "new_connections": stats.new_connections,
+            "reused_connections": stats.reused_connections,
+        }
+        for host, stats in sorted(
+            session_connection_stats(session or shared_http_session()).items()
+        )
+    }
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import logging
+import os
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class IngestionCursorStats:
+    new_items: int = 0
+    skipped_items: int = 0
+    cursors_advanced: int = 0
+
+    @property
+    def fetched_items(self) -> int:
+        """Items seen before cursor filtering."""
+        return self.new_items + self.skipped_items
+
+
+@dataclass(slots=True)
+class _Cursor:
+    published_at_utc: datetime
+    # Items published exactly at the cursor; feeds with minute-level
+    # timestamps often publish several distinct items in the same minute.
+    item_ids: set[str] = field(default_factory=set)
+
+
+class IngestionCursorStore:
+    """
+    Persisted high-water marks of `published_at_utc` per (source, key).
+
+    The key is a feed URL for RSS sources and a ticker for Finnhub. Clients ask
+    `is_new` before emitting an item and report what they saw with `advance`.
+    Advances stay pending until `commit`, which the pipeline calls only after
+    the headlines are saved and scored, so a failed run never skips unscored items.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.stats = IngestionCursorStats()
+        self._cursors = self._load()
+        self._pending: dict[str, _Cursor] = {}
+
+    @property
+    def has_cursors(self) -> bool:
+        return bool(self._cursors)
+
+    def cursor(self, source: str, key: str) -> datetime | None:
+        cursor = self._cursors.get(self._cursor_key(source, key))
+        return cursor.published_at_utc if cursor is not None else None
+
+    def is_new(
+        self,
+        source: str,
+        key: str,
+        published_at_utc: datetime,
+        item_id: str | None = None,
+    ) -> bool:
+        """
+        Whether an item is past the cursor.
+
+        Items older than the cursor are skipped. Items at exactly the cursor
+        are skipped only when `item_id` was already seen at that timestamp;
+        without an id they are emitted again and the content-hash unique
+        keys drop the repeat at insert time.
+        """
+        cursor = self._cursors.get(self._cursor_key(source, key))
+        if cursor is not None and (
+            published_at_utc < cursor.published_at_utc
+            or (
+                published_at_utc == cursor.published_at_utc
+                and item_id is not None
+                and item_id in cursor.item_ids
+            )
+        ):
+            self.stats.skipped_items += 1
+            return False
+
+        self.stats.new_items += 1
+        return True
+
+    def advance(
+        self,
+        source: str,
+        key: str,
+        published_at_utc: datetime,
+        item_id: str | None = None,
+    ) -> None:
+        cursor_key = self._cursor_key(source, key)
+        pending = self._pending.get(cursor_key)
+        if pending is None or published_at_utc > pending.published_at_utc:
+            pending = _Cursor(published_at_utc)
+            self._pending[cursor_key] = pending
+        if published_at_utc == pending.published_at_utc and item_id is not None:
+            pending.item_ids.add(item_id)
+
+    def commit(self) -> None:
+        for cursor_key, pending in self._pending.items():
+            current = self._cursors.get(cursor_key)
+            if current is None or pending.published_at_utc > current.published_at_utc:
+                self._cursors[cursor_key] = pending
+                self.stats.cursors_advanced += 1
+            elif pending.published_at_utc == current.published_at_utc:
+                current.item_ids |= pending.item_ids
+        self._pending.clear()
+        self._save()
+
+    @staticmethod
+    def _cursor_key(source: str, key: str) -> str:
+        return f"{source}|{key}"
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temporary_path.write_text(
+            json.dumps(
+                {
+                    cursor_key: {
+                        "published_at_utc": cursor.published_at_utc.isoformat(),
+                        "item_ids": sorted(cursor.item_ids),
+                    }
+                    for cursor_key, cursor in self._cursors.items()
+                }
+            )
+        )
+        os.replace(temporary_path, self.path)
+
+    def _load(self) -> dict[str, _Cursor]:
+        if not self.path.exists():
+            return {}
+
+        try:
+            payload = json.loads(self.path.read_text())
+            cursors: dict[str, _Cursor] = {}
+            for cursor_key, value in payload.items():
+                # Older files store a bare timestamp per cursor.
+                if not isinstance(value, dict):
+                    value = {"published_at_utc": value}
+                parsed = datetime.fromisoformat(str(value["published_at_utc"]))
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                cursors[str(cursor_key)] = _Cursor(
+                    parsed,
+                    {str(item_id) for item_id in value.get("item_ids", [])},
+                )
+            return cursors
+        except (OSError, AttributeError, KeyError, TypeError, ValueError) as error:
+            logger.warning("Ignoring unreadable ingestion cursors %s: %s", self.path, error)
+            return {}
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+def build_trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Build one regex alternation shaped like a trie of `phrases`.
+
+    Shared prefixes are factored out, so the regex engine tests each input
+    position against the trie instead of every phrase in turn. Optional
+    branches are greedy, so the longest phrase starting at a position wins.
+    """
+    trie: dict[str, dict] = {}
+    for phrase in phrases:
+        if not phrase:
+            continue
+        node = trie
+        for character in phrase:
+            node = node.setdefault(character, {})
+        node[""] = {}
+
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: dict[str, dict]) -> str:
+    is_terminal = "" in node
+    branches = [
+        re.escape(character) + _trie_node_pattern(child)
+        for character, child in sorted(node.items())
+        if character
+    ]
+    if not branches:
+        return ""
+
+    if len(branches) == 1:
+        pattern = branches[0]
+        if is_terminal:
+            return f"(?:{pattern})?"
+        return pattern
+
+    pattern = "(?:" + "|".join(branches) + ")"
+    if is_terminal:
+        return pattern + "?"
+    return pattern
+
+
+class KeywordMatcher:
+    """
+    Reports every phrase that occurs as a substring of a text in one scan.
+
+    The phrases are compiled once into a trie-shaped regex. A zero-width
+    lookahead tries it at every position, so overlapping phrases are found.
+    Shorter phrases that are prefixes of the longest match at a position are
+    added from a precomputed table. The result equals
+    `{phrase for phrase in phrases if phrase in text}`.
+    """
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases = frozenset(phrase for phrase in phrases if phrase)
+        self._phrases_by_longest_match = {
+            phrase: tuple(other for other in self.phrases if phrase.startswith(other))
+            for phrase in self.phrases
+        }
+        pattern = build_trie_pattern(self.phrases)
+        self._pattern = re.compile(f"(?=({pattern}))") if pattern else None
+
+    def matches(self, text: str) -> set[str]:
+        if self._pattern is None:
+            return set()
+
+        matched: set[str] = set()
+        for longest_match in {match.group(1) for match in self._pattern.finditer(text)}:
+            matched.update(self._phrases_by_longest_match[longest_match])
+        return matched
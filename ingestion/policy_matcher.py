@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from config.news_topics import (
+    POLICY_RESTRICTIVE_KEYWORDS,
+    POLICY_SUPPORTIVE_KEYWORDS,
+    POLITICAL_INDUSTRY_TOPICS,
+    policy_impact_from_hits,
+)
+from ingestion.keyword_matcher import KeywordMatcher
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyScan:
+    topics: tuple[dict[str, object], ...]
+    supportive_hits: int
+    restrictive_hits: int
+
+    @property
+    def impact(self) -> str:
+        return policy_impact_from_hits(self.supportive_hits, self.restrictive_hits)
+
+
+class PolicyKeywordMatcher:
+    """
+    One keyword automaton over every policy topic and impact keyword.
+
+    A single scan reports the matching POLITICAL_INDUSTRY_TOPICS entries, in
+    their configured order, together with the supportive and restrictive
+    keyword hit counts that `classify_policy_impact` computes.
+    """
+
+    def __init__(
+        self,
+        topics: tuple[dict[str, object], ...] = POLITICAL_INDUSTRY_TOPICS,
+        supportive_keywords: tuple[str, ...] = POLICY_SUPPORTIVE_KEYWORDS,
+        restrictive_keywords: tuple[str, ...] = POLICY_RESTRICTIVE_KEYWORDS,
+    ) -> None:
+        self.topics = topics
+        self._topic_keywords = [
+            frozenset(str(keyword).casefold() for keyword in topic.get("keywords", ()))
+            for topic in topics
+        ]
+        self._supportive_keywords = frozenset(
+            keyword.casefold() for keyword in supportive_keywords
+        )
+        self._restrictive_keywords = frozenset(
+            keyword.casefold() for keyword in restrictive_keywords
+        )
+        self._matcher = KeywordMatcher(
+            set().union(
+                *self._topic_keywords,
+                self._supportive_keywords,
+                self._restrictive_keywords,
+            )
+        )
+
+    def scan(self, text: str) -> PolicyScan:
+        matched = self._matcher.matches(text.casefold())
+        return PolicyScan(
+            topics=tuple(
+                topic
+                for topic, keywords in zip(self.topics, self._topic_keywords)
+                if not keywords.isdisjoint(matched)
+            ),
+            supportive_hits=len(matched & self._supportive_keywords),
+            restrictive_hits=len(matched & self._restrictive_keywords),
+        )
+
+
+POLICY_KEYWORD_MATCHER = PolicyKeywordMatcher()
+
+
+@lru_cache(maxsize=4096)
+def scan_policy_text(text: str) -> PolicyScan:
+    return POLICY_KEYWORD_MATCHER.scan(text)
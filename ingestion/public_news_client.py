@@ -1,27 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from io import BytesIO
 import logging
+import threading
+import time
 from typing import Iterable
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit
 import xml.etree.ElementTree as ET
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from config.news_topics import (
     POLITICAL_INDUSTRY_TOPICS,
     PUBLIC_FINANCIAL_FEEDS,
     PUBLIC_POLICY_FEEDS,
     TICKER_COMPANY_NAMES,
-    classify_policy_impact,
     get_sector_for_ticker,
 )
+from ingestion.feed_cache import FeedValidatorCache
+from ingestion.ingestion_cursors import IngestionCursorStore
+from ingestion.policy_matcher import scan_policy_text
+from ingestion.ticker_matcher import TickerMatcher, ticker_matcher_for
 from models.raw_headline import RawHeadline
 
 
 GOOGLE_NEWS_RSS_URL = "https://news.google.com/rss/search"
+CURSOR_SOURCE = "public_rss"
+FEED_ENTRY_TAGS = frozenset({"item", "entry"})
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +44,14 @@ class ParsedFeedItem:
     summary: str | None = None
 
 
+@dataclass(slots=True)
+class FeedDownload:
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+
+
 class PublicNewsClient:
     """
     Fetches financial and political headlines from public RSS endpoints.
@@ -41,6 +59,16 @@ class PublicNewsClient:
     This client intentionally avoids paid API credentials. It is not a market
     data entitlement layer; it is a pragmatic local feed collector for the
     Quicksilver demo pipeline.
+
+    With `max_workers > 1` every feed URL needed for a run is downloaded up
+    front on a bounded thread pool, capped at `max_requests_per_host` in-flight
+    requests per host. Parsing and ticker mapping still run in the original
+    sequential order, so the returned headlines are identical to a serial run.
+
+    An optional FeedValidatorCache turns every feed request into a conditional
+    GET; feeds answering 304 Not Modified reuse their previously parsed items.
+    An optional IngestionCursorStore drops items older than the newest item
+    already seen on the same feed URL.
     """
 
     def __init__(
@@ -48,10 +76,27 @@ class PublicNewsClient:
         timeout_seconds: int = 20,
         max_items_per_feed: int = 8,
         session: requests.Session | None = None,
+        max_workers: int = 1,
+        max_requests_per_host: int = 4,
+        validator_cache: FeedValidatorCache | None = None,
+        cursor_store: IngestionCursorStore | None = None,
     ) -> None:
         self.timeout_seconds = timeout_seconds
+        self.validator_cache = validator_cache
+        self.cursor_store = cursor_store
         self.max_items_per_feed = max_items_per_feed
-        self._session = session or requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.max_requests_per_host = max(1, max_requests_per_host)
+        self._prefetched: dict[str, FeedDownload | None] = {}
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._host_limits_lock = threading.Lock()
+        if session is None:
+            session = requests.Session()
+            if self.max_workers > 1:
+                adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+        self._session = session
         if hasattr(self._session, "headers"):
             self._session.headers.update(
                 {
@@ -70,6 +115,29 @@ class PublicNewsClient:
         include_political: bool = True,
     ) -> list[RawHeadline]:
         ticker_list = [ticker.upper() for ticker in tickers]
+
+        if self.max_workers > 1:
+            self._prefetch_feeds(
+                self._planned_feed_urls(ticker_list, include_financial, include_political)
+            )
+
+        try:
+            return self._build_headlines(
+                ticker_list,
+                lookback_days,
+                include_financial,
+                include_political,
+            )
+        finally:
+            self._prefetched.clear()
+
+    def _build_headlines(
+        self,
+        ticker_list: list[str],
+        lookback_days: int,
+        include_financial: bool,
+        include_political: bool,
+    ) -> list[RawHeadline]:
         since = datetime.now(timezone.utc) - timedelta(days=lookback_days)
         headlines: list[RawHeadline] = []
 
@@ -83,6 +151,48 @@ class PublicNewsClient:
 
         return self._dedupe_preserving_order(headlines)
 
+    def _planned_feed_urls(
+        self,
+        tickers: list[str],
+        include_financial: bool,
+        include_political: bool,
+    ) -> list[str]:
+        urls: list[str] = []
+        selected_tickers = set(tickers)
+
+        if include_financial:
+            urls.extend(self._company_search_url(ticker) for ticker in tickers)
+            urls.extend(str(feed["url"]) for feed in PUBLIC_FINANCIAL_FEEDS)
+
+        if include_political:
+            urls.extend(
+                self._google_news_url(str(topic["query"]))
+                for topic in POLITICAL_INDUSTRY_TOPICS
+                if any(str(ticker).upper() in selected_tickers for ticker in topic["tickers"])
+            )
+            urls.extend(str(feed["url"]) for feed in PUBLIC_POLICY_FEEDS)
+
+        return list(dict.fromkeys(urls))
+
+    def _prefetch_feeds(self, urls: list[str]) -> None:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            contents = list(executor.map(self._download_feed_limited, urls))
+
+        self._prefetched = dict(zip(urls, contents))
+
+    def _download_feed_limited(self, url: str) -> FeedDownload | None:
+        with self._host_limit(url):
+            return self._download_feed(url)
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._host_limits_lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = threading.BoundedSemaphore(self.max_requests_per_host)
+                self._host_limits[host] = limit
+        return limit
+
     def _fetch_company_search_headlines(
         self,
         tickers: list[str],
@@ -91,11 +201,9 @@ class PublicNewsClient:
         headlines: list[RawHeadline] = []
 
         for ticker in tickers:
-            company_name = TICKER_COMPANY_NAMES.get(ticker, ticker)
-            query = f'"{company_name}" OR "{ticker}" stock market news'
-            url = self._google_news_url(query)
+            url = self._company_search_url(ticker)
 
-            for item in self._fetch_feed_items(url, fallback_source="Google News"):
+            for item in self._fetch_feed_items(url, fallback_source="Google News", since=since):
                 if item.published_at_utc < since:
                     continue
 
@@ -121,16 +229,19 @@ class PublicNewsClient:
         since: datetime,
     ) -> list[RawHeadline]:
         headlines: list[RawHeadline] = []
+        # Built (or fetched from the cache) once per call, not per feed item.
+        matcher = ticker_matcher_for(tuple(tickers))
 
         for feed in PUBLIC_FINANCIAL_FEEDS:
             for item in self._fetch_feed_items(
                 str(feed["url"]),
                 fallback_source=str(feed["name"]),
+                since=since,
             ):
                 if item.published_at_utc < since:
                     continue
 
-                matched_tickers = self._match_tickers(item, tickers)
+                matched_tickers = self._match_tickers(item, matcher)
                 for ticker in matched_tickers:
                     headlines.append(
                         RawHeadline(
@@ -159,6 +270,7 @@ class PublicNewsClient:
             for item in self._fetch_feed_items(
                 str(feed["url"]),
                 fallback_source=str(feed["name"]),
+                since=since,
             ):
                 if item.published_at_utc < since:
                     continue
@@ -203,7 +315,11 @@ class PublicNewsClient:
                 continue
 
             url = self._google_news_url(str(topic["query"]))
-            for item in self._fetch_feed_items(url, fallback_source="Google News Politics"):
+            for item in self._fetch_feed_items(
+                url,
+                fallback_source="Google News Politics",
+                since=since,
+            ):
                 if item.published_at_utc < since:
                     continue
 
@@ -228,51 +344,189 @@ class PublicNewsClient:
         self,
         url: str,
         fallback_source: str,
+        since: datetime | None = None,
+    ) -> list[ParsedFeedItem]:
+        if url in self._prefetched:
+            download = self._prefetched[url]
+        else:
+            download = self._download_feed(url)
+
+        if download is None:
+            return []
+
+        if download.not_modified and self.validator_cache is not None:
+            cached_items = self.validator_cache.cached_items(url) or []
+            return self._new_items_only(
+                url,
+                [self._item_from_cache(row) for row in cached_items],
+            )
+
+        parse_started = time.perf_counter()
+        items = self._parse_feed_items(download.content, url, fallback_source, since)
+        if self.validator_cache is not None:
+            self.validator_cache.store(
+                url,
+                etag=download.etag,
+                last_modified=download.last_modified,
+                content_length=len(download.content),
+                parse_seconds=time.perf_counter() - parse_started,
+                items=[self._item_to_cache(item) for item in items],
+            )
+        return self._new_items_only(url, items)
+
+    def _new_items_only(
+        self,
+        url: str,
+        items: list[ParsedFeedItem],
     ) -> list[ParsedFeedItem]:
+        if self.cursor_store is None:
+            return items
+
+        new_items = [
+            item
+            for item in items
+            if self.cursor_store.is_new(
+                CURSOR_SOURCE,
+                url,
+                item.published_at_utc,
+                item_id=self._cursor_item_id(item),
+            )
+        ]
+        for item in new_items:
+            self.cursor_store.advance(
+                CURSOR_SOURCE,
+                url,
+                item.published_at_utc,
+                item_id=self._cursor_item_id(item),
+            )
+        return new_items
+
+    @staticmethod
+    def _cursor_item_id(item: ParsedFeedItem) -> str:
+        return item.link or item.title
+
+    def _download_feed(self, url: str) -> FeedDownload | None:
+        request_kwargs: dict[str, object] = {"timeout": self.timeout_seconds}
+        if self.validator_cache is not None:
+            conditional_headers = self.validator_cache.request_headers(url)
+            if conditional_headers:
+                request_kwargs["headers"] = conditional_headers
+
         try:
-            response = self._session.get(url, timeout=self.timeout_seconds)
+            response = self._session.get(url, **request_kwargs)
             response.raise_for_status()
         except requests.RequestException as error:
             logger.warning("Skipping feed %s: %s", url, error)
-            return []
+            return None
+
+        return self._feed_download_from_response(response)
+
+    @staticmethod
+    def _feed_download_from_response(response: object) -> FeedDownload:
+        headers = getattr(response, "headers", None) or {}
+        return FeedDownload(
+            content=getattr(response, "content", b"") or b"",
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            not_modified=getattr(response, "status_code", 200) == 304,
+        )
+
+    @staticmethod
+    def _item_to_cache(item: ParsedFeedItem) -> dict[str, object]:
+        row = asdict(item)
+        row["published_at_utc"] = item.published_at_utc.isoformat()
+        return row
+
+    @staticmethod
+    def _item_from_cache(row: dict[str, object]) -> ParsedFeedItem:
+        return ParsedFeedItem(
+            title=str(row["title"]),
+            link=str(row["link"]),
+            source=str(row["source"]),
+            published_at_utc=datetime.fromisoformat(str(row["published_at_utc"])),
+            summary=row.get("summary"),  # type: ignore[arg-type]
+        )
+
+    def _parse_feed_items(
+        self,
+        content: bytes,
+        url: str,
+        fallback_source: str,
+        since: datetime | None = None,
+    ) -> list[ParsedFeedItem]:
+        """
+        Stream RSS `<item>` / Atom `<entry>` elements and stop after the first
+        `max_items_per_feed` entries, clearing each one once it is mapped so
+        large feeds parse in constant memory. Entries older than `since` are
+        dropped without building an item; parsing does not stop at them
+        because Google News search feeds are ordered by relevance, not date.
+        """
+        parsed_items: list[ParsedFeedItem] = []
+        open_elements: list[ET.Element] = []
+        entries_seen = 0
 
         try:
-            root = ET.fromstring(response.content)
+            for event, element in ET.iterparse(BytesIO(content), events=("start", "end")):
+                if event == "start":
+                    open_elements.append(element)
+                    continue
+
+                open_elements.pop()
+                if element.tag.rsplit("}", 1)[-1] not in FEED_ENTRY_TAGS:
+                    continue
+
+                entries_seen += 1
+                item = self._parsed_feed_item(element, fallback_source)
+                if item is not None and (since is None or item.published_at_utc >= since):
+                    parsed_items.append(item)
+
+                element.clear()
+                if open_elements:
+                    open_elements[-1].remove(element)
+                if entries_seen >= self.max_items_per_feed:
+                    break
         except ET.ParseError as error:
             logger.warning("Skipping malformed RSS feed %s: %s", url, error)
             return []
 
-        parsed_items: list[ParsedFeedItem] = []
-        for item_element in self._feed_entries(root)[: self.max_items_per_feed]:
-            title = self._child_text(item_element, "title")
-            published_at = self._parse_datetime(
-                self._child_text(item_element, "pubDate")
-                or self._child_text(item_element, "published")
-                or self._child_text(item_element, "updated")
-            )
+        return parsed_items
 
-            if not title or not published_at:
-                continue
+    def _parsed_feed_item(
+        self,
+        item_element: ET.Element,
+        fallback_source: str,
+    ) -> ParsedFeedItem | None:
+        title = self._child_text(item_element, "title")
+        published_at = self._parse_datetime(
+            self._child_text(item_element, "pubDate")
+            or self._child_text(item_element, "published")
+            or self._child_text(item_element, "updated")
+        )
 
-            parsed_items.append(
-                ParsedFeedItem(
-                    title=title,
-                    link=(
-                        self._child_text(item_element, "link")
-                        or self._link_href(item_element)
-                        or ""
-                    ),
-                    source=self._child_text(item_element, "source") or fallback_source,
-                    published_at_utc=published_at,
-                    summary=(
-                        self._child_text(item_element, "description")
-                        or self._child_text(item_element, "summary")
-                        or self._child_text(item_element, "content")
-                    ),
-                )
-            )
+        if not title or not published_at:
+            return None
 
-        return parsed_items
+        return ParsedFeedItem(
+            title=title,
+            link=(
+                self._child_text(item_element, "link")
+                or self._link_href(item_element)
+                or ""
+            ),
+            source=self._child_text(item_element, "source") or fallback_source,
+            published_at_utc=published_at,
+            summary=(
+                self._child_text(item_element, "description")
+                or self._child_text(item_element, "summary")
+                or self._child_text(item_element, "content")
+            ),
+        )
+
+    @classmethod
+    def _company_search_url(cls, ticker: str) -> str:
+        company_name = TICKER_COMPANY_NAMES.get(ticker, ticker)
+        query = f'"{company_name}" OR "{ticker}" stock market news'
+        return cls._google_news_url(query)
 
     @staticmethod
     def _google_news_url(query: str) -> str:
@@ -289,19 +543,6 @@ class PublicNewsClient:
                 return " ".join(child.text.split())
         return None
 
-    @staticmethod
-    def _feed_entries(root: ET.Element) -> list[ET.Element]:
-        rss_items = root.findall(".//item")
-        if rss_items:
-            return rss_items
-
-        atom_entries = [
-            element
-            for element in root.iter()
-            if element.tag.rsplit("}", 1)[-1] == "entry"
-        ]
-        return atom_entries
-
     @staticmethod
     def _link_href(element: ET.Element) -> str | None:
         for child in list(element):
@@ -330,54 +571,19 @@ class PublicNewsClient:
         return parsed.astimezone(timezone.utc)
 
     @staticmethod
-    def _match_tickers(item: ParsedFeedItem, tickers: list[str]) -> list[str]:
+    def _match_tickers(item: ParsedFeedItem, matcher: TickerMatcher) -> list[str]:
         search_text = f"{item.title} {item.summary or ''}".lower()
-        matched: list[str] = []
-
-        for ticker in tickers:
-            company_name = TICKER_COMPANY_NAMES.get(ticker, ticker)
-            ticker_token = ticker.replace(".", "").lower()
-
-            if (
-                company_name.lower() in search_text
-                or PublicNewsClient._ticker_symbol_mentioned(search_text, ticker)
-                or (
-                    len(ticker_token) > 2
-                    and f" {ticker_token} " in f" {search_text} "
-                )
-            ):
-                matched.append(ticker)
-
-        return matched
-
-    @staticmethod
-    def _ticker_symbol_mentioned(search_text: str, ticker: str) -> bool:
-        normalized_ticker = ticker.lower()
-        compact_ticker = normalized_ticker.replace(".", "")
-        if len(compact_ticker) <= 2:
-            return f"${compact_ticker}" in search_text
-
-        return (
-            f" {normalized_ticker} " in f" {search_text} "
-            or f"${compact_ticker}" in search_text
-        )
+        return matcher.match(search_text)
 
     @staticmethod
     def _matching_policy_topics(item: ParsedFeedItem) -> list[dict[str, object]]:
-        search_text = f"{item.title} {item.summary or ''}".casefold()
-        matched_topics: list[dict[str, object]] = []
-
-        for topic in POLITICAL_INDUSTRY_TOPICS:
-            keywords = tuple(str(keyword).casefold() for keyword in topic.get("keywords", ()))
-            if any(keyword in search_text for keyword in keywords):
-                matched_topics.append(topic)
-
-        return matched_topics
+        search_text = f"{item.title} {item.summary or ''}"
+        return list(scan_policy_text(search_text).topics)
 
     @staticmethod
     def _policy_summary(item: ParsedFeedItem, topic: dict[str, object]) -> str | None:
         search_text = f"{item.title} {item.summary or ''}"
-        impact = classify_policy_impact(search_text)
+        impact = scan_policy_text(search_text).impact
         summary = item.summary or ""
         policy_context = (
             f"Policy catalyst: {topic['topic']} for {topic['industry']}; "
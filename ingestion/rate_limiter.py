@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every worker that calls one API.
+
+    `acquire` reserves a token and sleeps until it is available, so a pool of
+    workers together never exceeds `rate_per_second` beyond the initial
+    `capacity` burst. `pause` pushes the whole bucket back, which is how a
+    429 Retry-After seen by one worker slows down all of them.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive.")
+
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1.0, capacity if capacity is not None else rate_per_second)
+        self.pauses = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: float | None = None) -> TokenBucket:
+        return cls(rate_per_second=requests_per_minute / 60.0, capacity=burst)
+
+    def acquire(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait_seconds = max(0.0, self._updated_at - now) + (
+                max(0.0, -self._tokens) / self.rate_per_second
+            )
+
+        if wait_seconds > 0:
+            self._sleep(wait_seconds)
+        return wait_seconds
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.pauses += 1
+            resume_at = now + max(0.0, seconds)
+            if resume_at > self._updated_at:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated_at = resume_at
+
+    def _refill(self, now: float) -> None:
+        if now <= self._updated_at:
+            return
+
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated_at) * self.rate_per_second,
+        )
+        self._updated_at = now
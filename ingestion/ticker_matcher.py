@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+from config.news_topics import TICKER_COMPANY_NAMES
+from ingestion.keyword_matcher import KeywordMatcher
+
+
+class TickerMatcher:
+    """
+    Matches a fixed ticker universe against lowercased feed text in one pass.
+
+    It reproduces PublicNewsClient's three rules exactly:
+
+    - the company name (or the ticker itself when no name is configured)
+      appears anywhere in the text,
+    - `$TICK` appears anywhere in the text,
+    - for symbols longer than two characters, the symbol appears as a
+      space-delimited token.
+    """
+
+    def __init__(self, tickers: Iterable[str]) -> None:
+        self.tickers = tuple(tickers)
+        self._tickers_by_name: dict[str, list[str]] = {}
+        self._tickers_by_token: dict[str, list[str]] = {}
+        self._tickers_by_dollar_symbol: dict[str, list[str]] = {}
+
+        for ticker in self.tickers:
+            company_name = TICKER_COMPANY_NAMES.get(ticker, ticker).lower()
+            normalized_ticker = ticker.lower()
+            compact_ticker = normalized_ticker.replace(".", "")
+
+            self._tickers_by_name.setdefault(company_name, []).append(ticker)
+            self._tickers_by_dollar_symbol.setdefault(compact_ticker, []).append(ticker)
+            if len(compact_ticker) > 2:
+                for token in {normalized_ticker, compact_ticker}:
+                    self._tickers_by_token.setdefault(token, []).append(ticker)
+
+        self._max_dollar_symbol_length = max(
+            (len(symbol) for symbol in self._tickers_by_dollar_symbol),
+            default=0,
+        )
+        self._name_matcher = KeywordMatcher(self._tickers_by_name)
+
+    def match(self, search_text: str) -> list[str]:
+        matched: set[str] = set()
+
+        for name in self._name_matcher.matches(search_text):
+            matched.update(self._tickers_by_name[name])
+
+        for token in set(search_text.split(" ")) & self._tickers_by_token.keys():
+            matched.update(self._tickers_by_token[token])
+
+        dollar_index = search_text.find("$")
+        while dollar_index != -1:
+            symbol_start = dollar_index + 1
+            for length in range(1, self._max_dollar_symbol_length + 1):
+                symbol = search_text[symbol_start : symbol_start + length]
+                if len(symbol) < length:
+                    break
+                matched.update(self._tickers_by_dollar_symbol.get(symbol, ()))
+            dollar_index = search_text.find("$", symbol_start)
+
+        return [ticker for ticker in self.tickers if ticker in matched]
+
+
+@lru_cache(maxsize=32)
+def ticker_matcher_for(tickers: tuple[str, ...]) -> TickerMatcher:
+    return TickerMatcher(tickers)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_story_cluster_ids"
+down_revision = "0001_local_mysql_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table_name in ("raw_headlines", "scored_headlines"):
+        op.add_column(table_name, sa.Column("story_cluster_id", sa.String(length=64)))
+
+
+def downgrade() -> None:
+    for table_name in ("scored_headlines", "raw_headlines"):
+        op.drop_column(table_name, "story_cluster_id")
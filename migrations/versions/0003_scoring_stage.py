@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_scoring_stage"
+down_revision = "0002_story_cluster_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("scored_headlines", sa.Column("scoring_stage", sa.String(length=32)))
+
+
+def downgrade() -> None:
+    op.drop_column("scored_headlines", "scoring_stage")
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, fields
+import sys
+from typing import Any, Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from models.raw_headline import RawHeadline
+from models.scored_headline import ScoredHeadline
+
+# Low-cardinality strings repeated on every row are stored once per batch.
+DICTIONARY_COLUMNS = frozenset(
+    {"ticker", "source", "category", "topic", "industry", "sentiment_label", "scoring_stage"}
+)
+FLOAT_COLUMNS = frozenset(
+    {
+        "positive_score",
+        "neutral_score",
+        "negative_score",
+        "compound_score",
+        "confidence",
+        "headline_age_hours",
+    }
+)
+INTEGER_COLUMNS = frozenset({"source_tier"})
+TIMESTAMP_COLUMNS = frozenset({"published_at_utc"})
+# SHA-256 hex digests as fixed-width bytes; b"" stands for None.
+HASH_COLUMNS = frozenset({"content_hash"})
+
+
+@dataclass(slots=True)
+class DictionaryColumn:
+    """Strings as int32 codes into a table of distinct values; code -1 is None."""
+
+    codes: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def encode(cls, values: Sequence[str | None]) -> DictionaryColumn:
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=True)
+        # A trailing None lets code -1 decode by plain fancy indexing.
+        table = np.empty(len(uniques) + 1, dtype=object)
+        table[:-1] = uniques
+        table[-1] = None
+        return cls(codes=codes.astype(np.int32), values=table)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def take(self, positions: np.ndarray | slice) -> DictionaryColumn:
+        return DictionaryColumn(codes=self.codes[positions], values=self.values)
+
+    def tolist(self) -> list[str | None]:
+        return self.values[self.codes].tolist()
+
+    def to_categorical(self) -> pd.Categorical:
+        return pd.Categorical.from_codes(self.codes, categories=self.values[:-1])
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.values.nbytes + sum(
+            sys.getsizeof(value) for value in self.values[:-1]
+        )
+
+
+class HeadlineBatch:
+    """
+    Column-oriented batch of RawHeadline or ScoredHeadline rows.
+
+    Repeated strings (ticker, source, category, topic, industry, labels) are
+    dictionary-encoded, scores are float64 arrays, timestamps are int64
+    microseconds since the epoch in UTC and content hashes are 64-byte
+    fixed-width bytes. SQL rows and DataFrames are built
+    straight from the columns. Iterating or indexing yields the usual
+    dataclasses, so code written for `list[RawHeadline]` keeps working.
+    """
+
+    def __init__(self, row_type: type, columns: dict[str, Any], length: int) -> None:
+        self.row_type = row_type
+        self.field_names = tuple(field.name for field in fields(row_type))
+        self._columns = columns
+        self._length = length
+
+    @classmethod
+    def from_headlines(
+        cls,
+        headlines: Iterable[RawHeadline | ScoredHeadline],
+        row_type: type | None = None,
+    ) -> HeadlineBatch:
+        headline_list = list(headlines)
+        selected_type = row_type or (type(headline_list[0]) if headline_list else RawHeadline)
+        return cls.from_columns(
+            {
+                field.name: [getattr(headline, field.name) for headline in headline_list]
+                for field in fields(selected_type)
+            },
+            row_type=selected_type,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: dict[str, Sequence[Any]],
+        row_type: type = RawHeadline,
+    ) -> HeadlineBatch:
+        """Build from equal-length columns; missing optional fields use their defaults."""
+        length = len(columns["ticker"])
+        encoded: dict[str, Any] = {}
+        for field in fields(row_type):
+            values = columns.get(field.name)
+            if values is None:
+                if field.default is MISSING:
+                    raise ValueError(f"HeadlineBatch column {field.name!r} is required.")
+                values = [field.default] * length
+            encoded[field.name] = cls._encode_column(field.name, values)
+        return cls(row_type, encoded, length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[RawHeadline | ScoredHeadline]:
+        # Positional construction: columns are kept in dataclass field order.
+        return (
+            self.row_type(*row)
+            for row in zip(*(self.column(name) for name in self.field_names))
+        )
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return self.take(np.arange(self._length)[index])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("HeadlineBatch index out of range")
+        return self.take(np.array([index])).to_headlines()[0]
+
+    def take(self, positions: np.ndarray | Sequence[int]) -> HeadlineBatch:
+        indexer = np.asarray(positions, dtype=np.int64)
+        return HeadlineBatch(
+            self.row_type,
+            {
+                name: column.take(indexer) if isinstance(column, DictionaryColumn)
+                else column[indexer]
+                for name, column in self._columns.items()
+            },
+            len(indexer),
+        )
+
+    def with_column(self, name: str, values: Sequence[Any]) -> HeadlineBatch:
+        """Copy of the batch with one field's values replaced."""
+        if name not in self.field_names:
+            raise ValueError(f"{self.row_type.__name__} has no field {name!r}.")
+        if len(values) != self._length:
+            raise ValueError("Column length does not match the batch.")
+        columns = dict(self._columns)
+        columns[name] = self._encode_column(name, values)
+        return HeadlineBatch(self.row_type, columns, self._length)
+
+    def with_columns_from(self, other: HeadlineBatch, names: Sequence[str]) -> HeadlineBatch:
+        """Copy of the batch with fields taken, still encoded, from an equal-length batch."""
+        if len(other) != self._length:
+            raise ValueError("Column length does not match the batch.")
+        columns = dict(self._columns)
+        for name in names:
+            columns[name] = other._columns[name]
+        return HeadlineBatch(self.row_type, columns, self._length)
+
+    def column(self, name: str) -> list[Any]:
+        column = self._columns[name]
+        if name in TIMESTAMP_COLUMNS:
+            return list(pd.to_datetime(column, unit="us", utc=True).to_pydatetime())
+        if name in HASH_COLUMNS:
+            return [value.decode("ascii") or None for value in column.tolist()]
+        return column.tolist()
+
+    def to_headlines(self) -> list[RawHeadline | ScoredHeadline]:
+        return list(self)
+
+    def to_records(self, columns: Sequence[str] | None = None) -> list[dict[str, Any]]:
+        """Row dicts for SQL inserts, built from whole columns at a time."""
+        names = tuple(columns or self.field_names)
+        return [dict(zip(names, row)) for row in zip(*(self.column(name) for name in names))]
+
+    def to_frame(self, dictionary_encoded: bool = True) -> pd.DataFrame:
+        """
+        DataFrame view of the batch; repeated strings become categoricals.
+
+        Pass `dictionary_encoded=False` for consumers that fill or compare
+        those columns with values outside the batch's categories.
+        """
+        data: dict[str, Any] = {}
+        for name, column in self._columns.items():
+            if isinstance(column, DictionaryColumn):
+                data[name] = column.to_categorical() if dictionary_encoded else column.tolist()
+            elif name in TIMESTAMP_COLUMNS:
+                data[name] = pd.to_datetime(column, unit="us", utc=True)
+            elif name in HASH_COLUMNS:
+                data[name] = self.column(name)
+            else:
+                data[name] = column
+        return pd.DataFrame(data, columns=list(self.field_names))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the batch, including string payloads."""
+        total = 0
+        for column in self._columns.values():
+            if isinstance(column, DictionaryColumn):
+                total += column.nbytes
+            elif column.dtype == object:
+                total += column.nbytes + sum(
+                    sys.getsizeof(value) for value in column if value is not None
+                )
+            else:
+                total += column.nbytes
+        return total
+
+    @staticmethod
+    def _encode_column(name: str, values: Sequence[Any]) -> Any:
+        if name in DICTIONARY_COLUMNS:
+            return DictionaryColumn.encode(values)
+        if name in FLOAT_COLUMNS:
+            return np.asarray(values, dtype=np.float64)
+        if name in INTEGER_COLUMNS:
+            return np.asarray(values, dtype=np.int16)
+        if name in TIMESTAMP_COLUMNS:
+            return pd.to_datetime(list(values), utc=True).as_unit("us").asi8
+        if name in HASH_COLUMNS:
+            return np.array(
+                [value.encode("ascii") if value else b"" for value in values],
+                dtype="S64",
+            )
+        column = np.empty(len(values), dtype=object)
+        column[:] = list(values)
+        return column
+
+
+def as_headline_list(
+    headlines: HeadlineBatch | Sequence[RawHeadline | ScoredHeadline],
+) -> list[Any]:
+    """Materialize a batch once for code that indexes or iterates repeatedly."""
+    if isinstance(headlines, list):
+        return headlines
+    return list(headlines)
@@ -17,3 +17,5 @@ class RawHeadline:
     category: str = "financial"
     topic: str | None = None
     industry: str | None = None
+    content_hash: str | None = None
+    story_cluster_id: str | None = None
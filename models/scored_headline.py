@@ -28,3 +28,5 @@ class ScoredHeadline:
     category: str = "financial"
     topic: str | None = None
     industry: str | None = None
+    scoring_stage: str | None = None
+    story_cluster_id: str | None = None
@@ -5,10 +5,11 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import pandas as pd
 from dotenv import load_dotenv
@@ -22,12 +23,16 @@ load_dotenv(PROJECT_ROOT / ".env", override=False)
 from analytics.insight_engine import InsightEngine
 from config import settings
 from config.watchlist import filter_to_sp500_tickers, get_default_watchlist
-from ingestion.finnhub_client import FinnhubClient
+from ingestion.backfill_checkpoints import BackfillCheckpointStore
+from ingestion.finnhub_client import FinnhubClient, FinnhubRateLimitError
+from ingestion.http_sessions import connection_stats_summary
+from ingestion.rate_limiter import TokenBucket
 from models.raw_headline import RawHeadline
 from simulation.insight_evaluator import InsightPerformanceEvaluator
 from simulation.mock_exchange import MockExchange
 from simulation.price_provider import build_price_provider
 from sentiment.finbert_scorer import FinBERTScorer
+from sentiment.scorer_factory import build_score_cache, build_scorer_pool
 from storage.factory import build_storage
 from streaming.news_producer import NewsProducer
 from transformations.normalize_headlines import normalize_headlines
@@ -64,6 +69,10 @@ class BackfillStats:
     insights_generated: int = 0
     backtest_days: int = 0
     evaluations_saved: int = 0
+    rate_limited_responses: int = 0
+    elapsed_seconds: float = 0.0
+    requests_per_second: float = 0.0
+    windows_resumed: int = 0
 
 
 def parse_date(value: str) -> date:
@@ -176,7 +185,7 @@ def dedupe_headlines(headlines: list[RawHeadline]) -> list[RawHeadline]:
     unique_headlines: list[RawHeadline] = []
 
     for headline in headlines:
-        content_hash = normalizer.build_content_hash(headline)
+        content_hash = headline.content_hash or normalizer.build_content_hash(headline)
         if content_hash in seen_hashes:
             continue
 
@@ -187,21 +196,12 @@ def dedupe_headlines(headlines: list[RawHeadline]) -> list[RawHeadline]:
 
 
 def attach_content_hashes(scored_headlines) -> None:
+    """Fill in hashes for scored headlines that did not inherit one from normalization."""
     normalizer = HeadlineNormalizer()
 
     for scored_headline in scored_headlines:
-        raw_headline = RawHeadline(
-            ticker=scored_headline.ticker,
-            headline=scored_headline.headline,
-            source=scored_headline.source,
-            url=scored_headline.url,
-            published_at_utc=scored_headline.published_at_utc,
-            summary=scored_headline.summary,
-            category=scored_headline.category,
-            topic=scored_headline.topic,
-            industry=scored_headline.industry,
-        )
-        scored_headline.content_hash = normalizer.build_content_hash(raw_headline)
+        if not scored_headline.content_hash:
+            scored_headline.content_hash = normalizer.build_content_hash(scored_headline)
 
 
 def fetch_with_retries(
@@ -211,16 +211,35 @@ def fetch_with_retries(
     to_date: date,
     retry_attempts: int,
     retry_sleep_seconds: float,
+    rate_limiter: TokenBucket | None = None,
 ) -> list[RawHeadline]:
     last_error: Exception | None = None
 
     for attempt in range(1, retry_attempts + 1):
+        if rate_limiter:
+            rate_limiter.acquire()
         try:
             return client.fetch_company_news(
                 ticker=ticker,
                 from_date=from_date.isoformat(),
                 to_date=to_date.isoformat(),
             )
+        except FinnhubRateLimitError as error:
+            last_error = error
+            retry_after = error.retry_after_seconds or retry_sleep_seconds
+            logging.warning(
+                "Rate limited on %s %s..%s (attempt %s/%s); backing off %.1fs.",
+                ticker,
+                from_date,
+                to_date,
+                attempt,
+                retry_attempts,
+                retry_after,
+            )
+            if rate_limiter:
+                rate_limiter.pause(retry_after)
+            elif attempt < retry_attempts:
+                time.sleep(retry_after)
         except Exception as error:
             last_error = error
             logging.warning(
@@ -240,72 +259,108 @@ def fetch_with_retries(
     ) from last_error
 
 
-def fetch_adaptive_windows(
+def split_window(from_date: date, to_date: date) -> list[tuple[date, date]]:
+    window_days = (to_date - from_date).days + 1
+    midpoint = from_date + timedelta(days=(window_days // 2) - 1)
+    return [(from_date, midpoint), (midpoint + timedelta(days=1), to_date)]
+
+
+def schedule_backfill_windows(
     client: FinnhubClient,
-    ticker: str,
-    from_date: date,
-    to_date: date,
+    tickers: list[str],
+    windows: list[tuple[date, date]],
     retry_attempts: int,
     retry_sleep_seconds: float,
     split_threshold: int,
     stats: BackfillStats,
-) -> list[tuple[date, date, list[RawHeadline]]]:
-    stats.requests_attempted += 1
-
-    try:
-        headlines = fetch_with_retries(
-            client=client,
-            ticker=ticker,
-            from_date=from_date,
-            to_date=to_date,
-            retry_attempts=retry_attempts,
-            retry_sleep_seconds=retry_sleep_seconds,
-        )
-    except Exception:
-        stats.failed_requests += 1
-        logging.exception(
-            "Skipping failed window for %s %s..%s.",
-            ticker,
-            from_date,
-            to_date,
-        )
-        return []
-
-    window_days = (to_date - from_date).days + 1
-    if split_threshold and len(headlines) >= split_threshold and window_days > 1:
-        midpoint = from_date + timedelta(days=(window_days // 2) - 1)
-        next_start = midpoint + timedelta(days=1)
-        logging.info(
-            "%s %s..%s fetched=%s, splitting window to avoid API caps.",
-            ticker,
-            from_date,
-            to_date,
-            len(headlines),
-        )
-        return (
-            fetch_adaptive_windows(
+    rate_limiter: TokenBucket | None = None,
+    max_workers: int = 1,
+    max_requests: int | None = None,
+    checkpoints: BackfillCheckpointStore | None = None,
+) -> Iterator[tuple[str, date, date, list[RawHeadline]]]:
+    """
+    Fetch every (ticker, window) pair on a worker pool and yield finished windows.
+
+    Requests are paced by the shared token bucket rather than fixed sleeps.
+    A window that hits `split_threshold` is split in half and both halves are
+    queued immediately, so adaptive splits run in parallel with other work.
+    Results arrive in completion order; stats are only touched on the calling
+    thread. Windows, including split halves, already covered by `checkpoints`
+    are skipped without a request.
+    """
+    planned = iter([(ticker, start, end) for ticker in tickers for start, end in windows])
+    max_workers = max(1, max_workers)
+    max_in_flight = max_workers * 2
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: dict[Future[list[RawHeadline]], tuple[str, date, date]] = {}
+
+        def submit(ticker: str, from_date: date, to_date: date) -> None:
+            if checkpoints and checkpoints.is_complete(ticker, from_date, to_date):
+                stats.windows_resumed += 1
+                return
+
+            stats.requests_attempted += 1
+            future = executor.submit(
+                fetch_with_retries,
                 client=client,
                 ticker=ticker,
                 from_date=from_date,
-                to_date=midpoint,
-                retry_attempts=retry_attempts,
-                retry_sleep_seconds=retry_sleep_seconds,
-                split_threshold=split_threshold,
-                stats=stats,
-            )
-            + fetch_adaptive_windows(
-                client=client,
-                ticker=ticker,
-                from_date=next_start,
                 to_date=to_date,
                 retry_attempts=retry_attempts,
                 retry_sleep_seconds=retry_sleep_seconds,
-                split_threshold=split_threshold,
-                stats=stats,
+                rate_limiter=rate_limiter,
             )
-        )
+            pending[future] = (ticker, from_date, to_date)
+
+        def refill() -> None:
+            while len(pending) < max_in_flight:
+                if max_requests and stats.requests_attempted >= max_requests:
+                    return
+                next_window = next(planned, None)
+                if next_window is None:
+                    return
+                submit(*next_window)
+
+        refill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker, from_date, to_date = pending.pop(future)
+                try:
+                    headlines = future.result()
+                except Exception:
+                    stats.failed_requests += 1
+                    logging.exception(
+                        "Skipping failed window for %s %s..%s.",
+                        ticker,
+                        from_date,
+                        to_date,
+                    )
+                    continue
+
+                window_days = (to_date - from_date).days + 1
+                if split_threshold and len(headlines) >= split_threshold and window_days > 1:
+                    logging.info(
+                        "%s %s..%s fetched=%s, splitting window to avoid API caps.",
+                        ticker,
+                        from_date,
+                        to_date,
+                        len(headlines),
+                    )
+                    for split_start, split_end in split_window(from_date, to_date):
+                        submit(ticker, split_start, split_end)
+                    continue
+
+                yield ticker, from_date, to_date, headlines
+            refill()
 
-    return [(from_date, to_date, headlines)]
+    stats.elapsed_seconds = time.perf_counter() - started_at
+    if stats.elapsed_seconds > 0:
+        stats.requests_per_second = stats.requests_attempted / stats.elapsed_seconds
+    if rate_limiter:
+        stats.rate_limited_responses = rate_limiter.pauses
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -329,10 +384,42 @@ def build_parser() -> argparse.ArgumentParser:
         help="Compatibility alias; selects the static S&P 500 universe.",
     )
     parser.add_argument("--max-requests", type=int)
-    parser.add_argument("--sleep-seconds", type=float, default=0.5)
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        default=settings.finnhub_requests_per_minute,
+        help="Token-bucket limit shared by all workers; match your Finnhub quota.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=settings.finnhub_max_concurrency,
+        help="Concurrent Finnhub requests across tickers and split windows.",
+    )
+    parser.add_argument(
+        "--sleep-seconds",
+        type=float,
+        default=0.0,
+        help="Optional extra pause after each stored window; pacing uses the rate limit.",
+    )
     parser.add_argument("--retry-attempts", type=int, default=3)
     parser.add_argument("--retry-sleep-seconds", type=float, default=3.0)
     parser.add_argument("--split-threshold", type=int, default=240)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip windows recorded as complete in --checkpoint-path.",
+    )
+    parser.add_argument(
+        "--reset-checkpoints",
+        action="store_true",
+        help="Delete --checkpoint-path and backfill every window again.",
+    )
+    parser.add_argument(
+        "--checkpoint-path",
+        type=Path,
+        default=PROJECT_ROOT / settings.backfill_checkpoint_path,
+    )
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--plan-only", action="store_true")
     parser.add_argument("--create-tables", action="store_true")
@@ -343,6 +430,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--publish-kafka", action="store_true")
     parser.add_argument("--score-and-save", action="store_true")
+    parser.add_argument(
+        "--score-workers",
+        type=int,
+        default=settings.sentiment_workers,
+        help="FinBERT worker processes for --score-and-save; 1 scores in-process.",
+    )
     parser.add_argument(
         "--skip-backtest",
         action="store_true",
@@ -366,6 +459,19 @@ def main() -> None:
         raise ValueError("--chunk-days must be at least 1.")
     if args.from_date > args.to_date:
         raise ValueError("--from-date must be earlier than or equal to --to-date.")
+    if args.resume and args.reset_checkpoints:
+        raise ValueError("--resume and --reset-checkpoints cannot be combined.")
+    if (
+        not args.dry_run
+        and not args.plan_only
+        and not args.resume
+        and not args.reset_checkpoints
+        and args.checkpoint_path.exists()
+    ):
+        raise ValueError(
+            f"{args.checkpoint_path} holds progress from an earlier backfill; "
+            "pass --resume to continue it or --reset-checkpoints to start over."
+        )
 
     tickers = resolve_tickers(args)
     validate_environment(args)
@@ -412,66 +518,78 @@ def main() -> None:
             )
 
         if args.score_and_save and not args.dry_run:
-            scorer = FinBERTScorer(model_name=settings.finbert_model_name)
-
-        stop_requested = False
-
-        for ticker in tickers:
-            if stop_requested:
-                break
-
-            for window_start, window_end in date_windows(
-                args.from_date,
-                args.to_date,
-                args.chunk_days,
-            ):
-                if args.max_requests and stats.requests_attempted >= args.max_requests:
-                    stop_requested = True
-                    break
-
-                window_results = fetch_adaptive_windows(
-                    client=client,
-                    ticker=ticker,
-                    from_date=window_start,
-                    to_date=window_end,
-                    retry_attempts=args.retry_attempts,
-                    retry_sleep_seconds=args.retry_sleep_seconds,
-                    split_threshold=args.split_threshold,
-                    stats=stats,
+            if args.score_workers > 1:
+                scorer = build_scorer_pool(
+                    "finbert",
+                    args.score_workers,
+                    score_cache=build_score_cache(),
+                )
+            else:
+                scorer = FinBERTScorer(
+                    model_name=settings.finbert_model_name,
+                    score_cache=build_score_cache(),
                 )
 
-                for result_start, result_end, raw_headlines in window_results:
-                    normalized_headlines = normalize_headlines(raw_headlines)
-                    unique_headlines = dedupe_headlines(normalized_headlines)
-
-                    stats.headlines_fetched += len(raw_headlines)
-                    stats.headlines_after_dedupe += len(unique_headlines)
-
-                    if not args.dry_run and storage:
-                        storage.save_raw_headlines(unique_headlines)
-                        stats.raw_saved += len(unique_headlines)
-
-                    if producer:
-                        producer.publish_batch(unique_headlines)
-                        stats.kafka_published += len(unique_headlines)
+        windows = list(date_windows(args.from_date, args.to_date, args.chunk_days))
+        rate_limiter = TokenBucket.per_minute(args.requests_per_minute)
+        checkpoints = (
+            None
+            if args.dry_run
+            else BackfillCheckpointStore(args.checkpoint_path, resume=args.resume)
+        )
 
-                    if scorer and storage:
-                        scored_headlines = scorer.score_batch(unique_headlines)
-                        attach_content_hashes(scored_headlines)
-                        storage.save_scored_headlines(scored_headlines)
-                        stats.scored_saved += len(scored_headlines)
+        for ticker, result_start, result_end, raw_headlines in schedule_backfill_windows(
+            client=client,
+            tickers=tickers,
+            windows=windows,
+            retry_attempts=args.retry_attempts,
+            retry_sleep_seconds=args.retry_sleep_seconds,
+            split_threshold=args.split_threshold,
+            stats=stats,
+            rate_limiter=rate_limiter,
+            max_workers=args.max_workers,
+            max_requests=args.max_requests,
+            checkpoints=checkpoints,
+        ):
+            normalized_headlines = normalize_headlines(raw_headlines)
+            unique_headlines = dedupe_headlines(normalized_headlines)
+
+            stats.headlines_fetched += len(raw_headlines)
+            stats.headlines_after_dedupe += len(unique_headlines)
+
+            if not args.dry_run and storage:
+                storage.save_raw_headlines(unique_headlines)
+                stats.raw_saved += len(unique_headlines)
+
+            if producer:
+                producer.publish_batch(unique_headlines)
+                stats.kafka_published += len(unique_headlines)
+
+            if scorer and storage:
+                scored_headlines = scorer.score_batch(unique_headlines)
+                attach_content_hashes(scored_headlines)
+                storage.save_scored_headlines(scored_headlines)
+                stats.scored_saved += len(scored_headlines)
+
+            if checkpoints:
+                checkpoints.mark_complete(
+                    ticker,
+                    result_start,
+                    result_end,
+                    len(raw_headlines),
+                )
 
-                    logging.info(
-                        "%s %s..%s fetched=%s unique=%s",
-                        ticker,
-                        result_start,
-                        result_end,
-                        len(raw_headlines),
-                        len(unique_headlines),
-                    )
+            logging.info(
+                "%s %s..%s fetched=%s unique=%s",
+                ticker,
+                result_start,
+                result_end,
+                len(raw_headlines),
+                len(unique_headlines),
+            )
 
-                    if args.sleep_seconds:
-                        time.sleep(args.sleep_seconds)
+            if args.sleep_seconds:
+                time.sleep(args.sleep_seconds)
 
         if (
             storage
@@ -491,13 +609,16 @@ def main() -> None:
             logging.info("Historical backtest summary: %s", backtest_summary)
 
     finally:
+        if scorer and hasattr(scorer, "close"):
+            scorer.close()
         if storage:
             storage.close()
 
     logging.info(
         "Backfill complete: requests=%s failed_requests=%s fetched=%s "
         "unique=%s raw_saved=%s kafka_published=%s scored_saved=%s "
-        "insights_generated=%s backtest_days=%s evaluations_saved=%s",
+        "insights_generated=%s backtest_days=%s evaluations_saved=%s "
+        "rate_limited=%s requests_per_second=%.2f windows_resumed=%s",
         stats.requests_attempted,
         stats.failed_requests,
         stats.headlines_fetched,
@@ -508,7 +629,11 @@ def main() -> None:
         stats.insights_generated,
         stats.backtest_days,
         stats.evaluations_saved,
+        stats.rate_limited_responses,
+        stats.requests_per_second,
+        stats.windows_resumed,
     )
+    logging.info("HTTP connection reuse by host: %s", connection_stats_summary())
 
 
 def is_local_storage_backend(storage_backend: str) -> bool:
@@ -43,6 +43,8 @@ def main() -> None:
         print(f"Saved {len(scored_headlines)} scored headlines")
 
     finally:
+        if hasattr(scorer, "close"):
+            scorer.close()
         storage.close()
 
 if __name__ == "__main__":
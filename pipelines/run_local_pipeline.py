@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import sys
 import time
@@ -24,15 +25,31 @@ from alerts.local_health import (
 )
 from config import settings
 from config.watchlist import filter_to_sp500_tickers, get_default_watchlist
+from ingestion.async_news_client import (
+    AsyncFinnhubClient,
+    AsyncPublicNewsClient,
+    build_async_http_client,
+)
+from ingestion.feed_cache import FeedValidatorCache
 from ingestion.finnhub_client import FinnhubClient
+from ingestion.finnhub_sentiment import FinnhubSentimentCollector
+from ingestion.http_sessions import connection_stats_summary
+from ingestion.ingestion_cursors import IngestionCursorStore
 from ingestion.public_news_client import PublicNewsClient
+from ingestion.rate_limiter import TokenBucket
 from models.raw_headline import RawHeadline
-from sentiment.scorer_factory import build_sentiment_scorer
+from sentiment.headline_scoring import TextDedupStats, score_unique_headlines
+from sentiment.scorer_registry import close_sentiment_scorers, get_sentiment_scorer
 from simulation.insight_evaluator import InsightPerformanceEvaluator
 from simulation.mock_exchange import MockExchange
 from simulation.price_provider import build_price_provider
 from storage.local_mysql_storage import LocalMySQLStorage
-from transformations.normalize_headlines import normalize_headlines
+from transformations.near_duplicates import (
+    NearDuplicateIndex,
+    NearDuplicateStats,
+    cluster_headline_batch,
+)
+from transformations.normalize_headlines import normalize_headline_batch
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -59,6 +76,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--include-finnhub", action="store_true", default=settings.finnhub_enabled)
     parser.add_argument("--skip-public-news", action="store_true")
     parser.add_argument("--skip-political-news", action="store_true")
+    parser.add_argument(
+        "--async-ingestion",
+        action="store_true",
+        default=settings.async_ingestion_enabled,
+        help="Fetch public feeds and Finnhub news concurrently on one event loop.",
+    )
     parser.add_argument("--sentiment-backend", default=settings.sentiment_backend)
     parser.add_argument("--skip-simulation", action="store_true")
     parser.add_argument("--skip-evaluation", action="store_true")
@@ -80,13 +103,16 @@ def main() -> None:
         format="%(asctime)s %(levelname)s %(message)s",
     )
 
-    while True:
-        run_once(args)
-        if not args.loop:
-            break
-        sleep_seconds = max(args.interval_minutes, 1) * 60
-        logging.info("Sleeping %.0f seconds before next local pipeline run.", sleep_seconds)
-        time.sleep(sleep_seconds)
+    try:
+        while True:
+            run_once(args)
+            if not args.loop:
+                break
+            sleep_seconds = max(args.interval_minutes, 1) * 60
+            logging.info("Sleeping %.0f seconds before next local pipeline run.", sleep_seconds)
+            time.sleep(sleep_seconds)
+    finally:
+        close_sentiment_scorers()
 
 
 def run_once(args: argparse.Namespace) -> dict[str, object]:
@@ -94,20 +120,51 @@ def run_once(args: argparse.Namespace) -> dict[str, object]:
     run_id = uuid4().hex
     tickers = resolve_tickers(args)
     storage = LocalMySQLStorage(database_url=args.database_url)
+    scorer = get_sentiment_scorer(args.sentiment_backend)
+    scorer.reset_run_stats()
+    if settings.sentiment_warmup:
+        # Load the model while ingestion runs; resident after the first run.
+        scorer.warm_up_in_background()
 
     try:
         storage.create_tables()
-        raw_headlines = collect_headlines(args, tickers)
+        feed_cache = build_feed_cache()
+        cursor_store = build_cursor_store()
+        raw_headlines = collect_headlines(
+            args,
+            tickers,
+            feed_cache=feed_cache,
+            cursor_store=cursor_store,
+        )
 
-        if not raw_headlines and args.seed_demo_if_empty:
+        fetched_count = len(raw_headlines)
+        if cursor_store is not None:
+            fetched_count = cursor_store.stats.fetched_items
+        # A quiet run whose items were all behind the cursors is not empty.
+        if fetched_count == 0 and args.seed_demo_if_empty:
             raw_headlines = build_demo_headlines(tickers[: min(len(tickers), 8)])
 
-        normalized_headlines = normalize_headlines(raw_headlines)
+        normalized_headlines = normalize_headline_batch(raw_headlines)
+        story_headlines = normalized_headlines
+        near_duplicate_index = near_duplicates()
+        if near_duplicate_index is not None:
+            near_duplicate_index.stats = NearDuplicateStats()
+            normalized_headlines, story_headlines = cluster_headline_batch(
+                normalized_headlines,
+                near_duplicate_index,
+            )
         storage.save_raw_headlines(normalized_headlines)
 
-        scorer = build_sentiment_scorer(args.sentiment_backend)
-        scored_headlines = scorer.score_batch(normalized_headlines)
+        dedup_stats = TextDedupStats()
+        scored_headlines = score_unique_headlines(
+            story_headlines,
+            scorer.score_batch,
+            stats=dedup_stats,
+        )
         storage.save_scored_headlines(scored_headlines)
+        # Only after scoring succeeds; a failed run fetches the same items again.
+        if cursor_store is not None:
+            cursor_store.commit()
 
         finnhub_scores = collect_finnhub_sentiment_scores(args, tickers)
         since_utc = started_at - timedelta(hours=settings.insight_lookback_hours)
@@ -147,10 +204,33 @@ def run_once(args: argparse.Namespace) -> dict[str, object]:
         summary = {
             "run_id": run_id,
             "tickers": len(tickers),
+            "raw_headlines_fetched": fetched_count,
             "raw_headlines_collected": len(raw_headlines),
             "raw_headlines_saved_attempted": len(normalized_headlines),
             "scored_headlines_saved_attempted": len(scored_headlines),
+            "sentiment_scorer": asdict(scorer.stats),
+            "sentiment_dedup": dedup_stats.as_dict(),
+            "near_duplicates": (
+                near_duplicate_index.stats.as_dict() if near_duplicate_index else None
+            ),
+            "sentiment_cache": (
+                scorer.score_cache.stats.as_dict() if scorer.score_cache else None
+            ),
+            "sentiment_batching": (
+                scorer.batch_stats.as_dict() if scorer.batch_stats else None
+            ),
+            "sentiment_cascade": (
+                scorer.cascade_stats.as_dict() if scorer.cascade_stats else None
+            ),
             "finnhub_scores_collected": len(finnhub_scores),
+            "finnhub_sentiment_cache": (
+                asdict(_finnhub_sentiment_collector.stats)
+                if _finnhub_sentiment_collector
+                else None
+            ),
+            "feed_cache": asdict(feed_cache.stats) if feed_cache else None,
+            "ingestion_cursors": asdict(cursor_store.stats) if cursor_store else None,
+            "http_connections": connection_stats_summary(),
             "recent_scored_headlines": len(recent_scored),
             "insights_generated": len(insights),
             "simulation": asdict(simulation_result) if simulation_result else None,
@@ -202,7 +282,34 @@ def run_once(args: argparse.Namespace) -> dict[str, object]:
         storage.close()
 
 
-def collect_headlines(args: argparse.Namespace, tickers: list[str]) -> list[RawHeadline]:
+def build_feed_cache() -> FeedValidatorCache | None:
+    if not settings.feed_cache_path:
+        return None
+    return FeedValidatorCache(PROJECT_ROOT / settings.feed_cache_path)
+
+
+def build_cursor_store() -> IngestionCursorStore | None:
+    if not settings.ingestion_cursor_path:
+        return None
+    return IngestionCursorStore(PROJECT_ROOT / settings.ingestion_cursor_path)
+
+
+def collect_headlines(
+    args: argparse.Namespace,
+    tickers: list[str],
+    feed_cache: FeedValidatorCache | None = None,
+    cursor_store: IngestionCursorStore | None = None,
+) -> list[RawHeadline]:
+    if args.async_ingestion:
+        return asyncio.run(
+            collect_headlines_async(
+                args,
+                tickers,
+                feed_cache=feed_cache,
+                cursor_store=cursor_store,
+            )
+        )
+
     headlines: list[RawHeadline] = []
     today = date.today()
     from_date = today - timedelta(days=args.lookback_days)
@@ -211,6 +318,10 @@ def collect_headlines(args: argparse.Namespace, tickers: list[str]) -> list[RawH
         public_client = PublicNewsClient(
             timeout_seconds=settings.public_news_timeout_seconds,
             max_items_per_feed=settings.public_news_max_items_per_feed,
+            max_workers=settings.public_news_max_workers,
+            max_requests_per_host=settings.public_news_max_requests_per_host,
+            validator_cache=feed_cache,
+            cursor_store=cursor_store,
         )
         headlines.extend(
             public_client.fetch_headlines(
@@ -222,9 +333,13 @@ def collect_headlines(args: argparse.Namespace, tickers: list[str]) -> list[RawH
                 ),
             )
         )
+        save_feed_cache(feed_cache)
 
     if args.include_finnhub and settings.finnhub_api_key:
-        client = FinnhubClient(api_key=settings.finnhub_api_key)
+        client = FinnhubClient(
+            api_key=settings.finnhub_api_key,
+            cursor_store=cursor_store,
+        )
         headlines.extend(
             client.fetch_batch_news(
                 tickers=tickers,
@@ -238,6 +353,93 @@ def collect_headlines(args: argparse.Namespace, tickers: list[str]) -> list[RawH
     return headlines
 
 
+async def collect_headlines_async(
+    args: argparse.Namespace,
+    tickers: list[str],
+    feed_cache: FeedValidatorCache | None = None,
+    cursor_store: IngestionCursorStore | None = None,
+) -> list[RawHeadline]:
+    today = date.today()
+    from_date = today - timedelta(days=args.lookback_days)
+    include_public = not args.skip_public_news and settings.public_news_enabled
+    include_finnhub = args.include_finnhub and bool(settings.finnhub_api_key)
+    if args.include_finnhub and not include_finnhub:
+        logging.warning("FINNHUB_API_KEY is missing, skipping Finnhub ingestion.")
+
+    client = build_async_http_client(
+        max_connections=settings.async_ingestion_max_concurrency,
+        timeout_seconds=settings.public_news_timeout_seconds,
+    )
+    try:
+        tasks = []
+        if include_public:
+            public_client = AsyncPublicNewsClient(
+                timeout_seconds=settings.public_news_timeout_seconds,
+                max_items_per_feed=settings.public_news_max_items_per_feed,
+                client=client,
+                max_concurrency=settings.async_ingestion_max_concurrency,
+                max_requests_per_host=settings.public_news_max_requests_per_host,
+                validator_cache=feed_cache,
+                cursor_store=cursor_store,
+            )
+            tasks.append(
+                public_client.fetch_headlines_async(
+                    tickers=tickers,
+                    lookback_days=args.lookback_days,
+                    include_financial=True,
+                    include_political=(
+                        settings.political_news_enabled and not args.skip_political_news
+                    ),
+                )
+            )
+        if include_finnhub:
+            finnhub_client = AsyncFinnhubClient(
+                api_key=settings.finnhub_api_key,
+                client=client,
+                max_concurrency=settings.finnhub_max_concurrency,
+                cursor_store=cursor_store,
+            )
+            tasks.append(
+                finnhub_client.fetch_batch_news(
+                    tickers=tickers,
+                    from_date=from_date.isoformat(),
+                    to_date=today.isoformat(),
+                )
+            )
+        results = await asyncio.gather(*tasks)
+    finally:
+        await client.aclose()
+    if include_public:
+        save_feed_cache(feed_cache)
+
+    headlines: list[RawHeadline] = []
+    for source_headlines in results:
+        headlines.extend(source_headlines)
+    return headlines
+
+
+def save_feed_cache(feed_cache: FeedValidatorCache | None) -> None:
+    if feed_cache is None:
+        return
+
+    try:
+        feed_cache.save()
+    except OSError as error:
+        logging.warning("Could not persist feed validator cache: %s", error)
+        return
+
+    logging.info(
+        "Feed cache: %s of %s feed(s) not modified, saved %s bytes and %.3fs of parsing.",
+        feed_cache.stats.not_modified,
+        feed_cache.stats.responses,
+        feed_cache.stats.bytes_saved,
+        feed_cache.stats.parse_seconds_saved,
+    )
+
+
+_finnhub_sentiment_collector: FinnhubSentimentCollector | None = None
+
+
 def collect_finnhub_sentiment_scores(
     args: argparse.Namespace,
     tickers: list[str],
@@ -245,17 +447,39 @@ def collect_finnhub_sentiment_scores(
     if not args.include_finnhub or not settings.finnhub_api_key:
         return {}
 
-    client = FinnhubClient(api_key=settings.finnhub_api_key)
-    scores: dict[str, float] = {}
-    for ticker in tickers:
-        try:
-            score = client.fetch_news_sentiment_score(ticker)
-        except Exception as error:
-            logging.warning("Skipping Finnhub sentiment score for %s: %s", ticker, error)
-            continue
-        if score is not None:
-            scores[ticker] = score
-    return scores
+    collector = finnhub_sentiment_collector()
+    collector.reset_run_stats()
+    return collector.collect(tickers)
+
+
+def finnhub_sentiment_collector() -> FinnhubSentimentCollector:
+    """Built once per process so --loop runs reuse cached ticker scores."""
+    global _finnhub_sentiment_collector
+    if _finnhub_sentiment_collector is None:
+        _finnhub_sentiment_collector = FinnhubSentimentCollector(
+            client=FinnhubClient(api_key=settings.finnhub_api_key),
+            ttl_seconds=settings.finnhub_sentiment_ttl_minutes * 60,
+            max_workers=settings.finnhub_max_concurrency,
+            rate_limiter=TokenBucket.per_minute(settings.finnhub_requests_per_minute),
+            stale_while_revalidate=settings.finnhub_sentiment_stale_while_revalidate,
+        )
+    return _finnhub_sentiment_collector
+
+
+_near_duplicate_index: NearDuplicateIndex | None = None
+
+
+def near_duplicates() -> NearDuplicateIndex | None:
+    """Process-wide story index, so --loop runs cluster against earlier runs."""
+    global _near_duplicate_index
+    if not settings.near_duplicate_enabled:
+        return None
+    if _near_duplicate_index is None:
+        _near_duplicate_index = NearDuplicateIndex(
+            threshold=settings.near_duplicate_threshold,
+            window_hours=settings.near_duplicate_window_hours,
+        )
+    return _near_duplicate_index
 
 
 def resolve_tickers(args: argparse.Namespace) -> list[str]:
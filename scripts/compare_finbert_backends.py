@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import json
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+load_dotenv(PROJECT_ROOT / ".env", override=False)
+
+from config import settings  # noqa: E402
+from sentiment.finbert_onnx import FinBERTOnnxScorer, compare_backends  # noqa: E402
+from sentiment.finbert_scorer import FinBERTScorer  # noqa: E402
+from storage.local_mysql_storage import LocalMySQLStorage  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare FinBERT on PyTorch with the ONNX Runtime backend: label "
+            "agreement, compound-score drift and texts per second."
+        )
+    )
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument(
+        "--input-file",
+        type=Path,
+        help="One headline per line; defaults to stored raw_headlines.",
+    )
+    parser.add_argument("--limit", type=int, default=2000)
+    parser.add_argument(
+        "--no-quantize",
+        action="store_true",
+        help="Compare against the fp32 ONNX graph instead of int8.",
+    )
+    parser.add_argument("--output", type=Path, help="Optional JSON output path.")
+    return parser
+
+
+def load_texts(args: argparse.Namespace) -> list[str]:
+    if args.input_file:
+        lines = args.input_file.read_text().splitlines()
+    else:
+        storage = LocalMySQLStorage(args.database_url)
+        try:
+            headlines = storage.fetch_dashboard_table("raw_headlines")
+        finally:
+            storage.close()
+        lines = headlines["headline"].astype(str).tolist() if not headlines.empty else []
+
+    return [line.strip() for line in lines if line.strip()][: args.limit]
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    texts = load_texts(args)
+    if not texts:
+        raise SystemExit("No headlines to compare; pass --input-file or run the pipeline first.")
+
+    reference = FinBERTScorer(model_name=settings.finbert_model_name)
+    candidate = FinBERTOnnxScorer(
+        model_name=settings.finbert_model_name,
+        quantize=not args.no_quantize,
+    )
+    comparison = compare_backends(reference.score_texts, candidate.score_texts, texts)
+    summary = {
+        **asdict(comparison),
+        "candidate_backend": candidate.backend_name,
+        "reference_texts_per_second": round(comparison.reference_texts_per_second, 1),
+        "candidate_texts_per_second": round(comparison.candidate_texts_per_second, 1),
+        "speedup": round(comparison.speedup, 2),
+    }
+
+    output = json.dumps(summary, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
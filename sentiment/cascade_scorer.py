@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any, Callable
+
+from models.headline_batch import HeadlineBatch, as_headline_list
+from models.raw_headline import RawHeadline
+from models.scored_headline import ScoredHeadline
+from models.sentiment_result import SentimentResult
+from sentiment.headline_scoring import build_scored_headline
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+from sentiment.score_cache import SentimentScoreCache, score_texts_with_cache
+
+
+logger = logging.getLogger(__name__)
+
+LEXICON_STAGE = "lexicon"
+
+
+@dataclass(slots=True)
+class CascadeStats:
+    headlines: int = 0
+    lexicon_accepted: int = 0
+    escalated: int = 0
+    conflicting: int = 0
+    escalation_failures: int = 0
+
+    @property
+    def escalation_rate_pct(self) -> float:
+        return round(100 * self.escalated / self.headlines, 2) if self.headlines else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "headlines": self.headlines,
+            "lexicon_accepted": self.lexicon_accepted,
+            "escalated": self.escalated,
+            "conflicting": self.conflicting,
+            "escalation_failures": self.escalation_failures,
+            "escalation_rate_pct": self.escalation_rate_pct,
+        }
+
+
+class CascadeSentimentScorer:
+    """
+    Score with the lexicon first and send only uncertain headlines to FinBERT.
+
+    A headline is escalated when the lexicon's confidence is below
+    `confidence_threshold` or when it matched both positive and negative
+    terms. The transformer scorer is built on the first escalation, so
+    batches the lexicon settles never load it; if that build fails, the
+    failure is remembered and later batches keep lexicon scores without
+    retrying the load. Each `ScoredHeadline`
+    records the stage that produced it in `scoring_stage`.
+    """
+
+    backend_name = "cascade"
+
+    def __init__(
+        self,
+        finbert_factory: Callable[[], Any],
+        confidence_threshold: float = 0.55,
+        score_cache: SentimentScoreCache | None = None,
+        lexicon: LexiconSentimentScorer | None = None,
+    ) -> None:
+        self.confidence_threshold = confidence_threshold
+        self.score_cache = score_cache
+        self.lexicon = lexicon or LexiconSentimentScorer()
+        self.model_name = self.lexicon.model_name
+        self.cascade_stats = CascadeStats()
+        self._finbert_factory = finbert_factory
+        self._finbert: Any | None = None
+        self._finbert_load_error: Exception | None = None
+
+    @property
+    def batch_stats(self) -> Any | None:
+        return getattr(self._finbert, "batch_stats", None)
+
+    @batch_stats.setter
+    def batch_stats(self, value: Any) -> None:
+        if self._finbert is not None:
+            self._finbert.batch_stats = value
+
+    def score_texts(self, texts: list[str]) -> list[SentimentResult | None]:
+        results, escalate = self._lexicon_stage(texts)
+        for position, result in zip(
+            escalate,
+            self._finbert_stage([texts[position] for position in escalate]),
+        ):
+            if result is not None:
+                results[position] = result
+        return results
+
+    def score_batch(
+        self,
+        headlines: list[RawHeadline] | HeadlineBatch,
+    ) -> list[ScoredHeadline]:
+        headlines = as_headline_list(headlines)
+        results, escalate = self._lexicon_stage(
+            [self.lexicon.scoring_text(headline) for headline in headlines]
+        )
+        stages = [LEXICON_STAGE] * len(headlines)
+
+        # FinBERT scores the headline alone; a summary-only item keeps its lexicon score.
+        escalated_positions = [
+            position
+            for position in escalate
+            if headlines[position].headline and headlines[position].headline.strip()
+        ]
+        finbert_results = self._finbert_stage(
+            [headlines[position].headline for position in escalated_positions]
+        )
+        for position, result in zip(escalated_positions, finbert_results):
+            if result is not None:
+                results[position] = result
+                stages[position] = self._finbert.backend_name
+
+        return [
+            build_scored_headline(headline, result, scoring_stage=stage)
+            for headline, result, stage in zip(headlines, results, stages)
+            if result is not None
+        ]
+
+    def close(self) -> None:
+        if self._finbert is not None and hasattr(self._finbert, "close"):
+            self._finbert.close()
+
+    def _lexicon_stage(self, texts: list[str]) -> tuple[list[SentimentResult | None], list[int]]:
+        results, positive, negative = self.lexicon.score_texts_with_term_weights(texts)
+        escalate: list[int] = []
+        for position, result in enumerate(results):
+            if result is None:
+                continue
+            self.cascade_stats.headlines += 1
+            conflicting = bool(positive[position] > 0 and negative[position] > 0)
+            if conflicting:
+                self.cascade_stats.conflicting += 1
+            if conflicting or result.confidence < self.confidence_threshold:
+                escalate.append(position)
+            else:
+                self.cascade_stats.lexicon_accepted += 1
+        return results, escalate
+
+    def _finbert_stage(self, texts: list[str]) -> list[SentimentResult | None]:
+        if not texts:
+            return []
+
+        self.cascade_stats.escalated += len(texts)
+        if self._finbert is None and self._finbert_load_error is None:
+            try:
+                self._finbert = self._finbert_factory()
+            except Exception as error:
+                self._finbert_load_error = error
+                logger.warning(
+                    "FinBERT stage unavailable, keeping lexicon scores for escalated "
+                    "headlines: %s",
+                    error,
+                )
+
+        if self._finbert is None:
+            results: list[SentimentResult | None] = [None] * len(texts)
+        else:
+            try:
+                results = score_texts_with_cache(
+                    texts,
+                    self._finbert.score_texts,
+                    self.score_cache,
+                    backend=self._finbert.backend_name,
+                    model_name=self._finbert.model_name,
+                )
+            except Exception as error:
+                logger.warning(
+                    "FinBERT stage failed, keeping lexicon scores for %s headline(s): %s",
+                    len(texts),
+                    error,
+                )
+                results = [None] * len(texts)
+
+        self.cascade_stats.escalation_failures += sum(1 for result in results if result is None)
+        return results
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from config import settings
+from models.sentiment_result import SentimentResult
+from sentiment.finbert_scorer import MAX_SEQUENCE_TOKENS, FinBERTScorer
+from sentiment.score_cache import SentimentScoreCache
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+LABELS_FILE = "labels.json"
+
+
+def _require_onnxruntime() -> Any:
+    try:
+        import onnxruntime
+    except ImportError as error:
+        raise RuntimeError(
+            "FinBERT ONNX scoring requires the optional onnxruntime dependency. "
+            "Install requirements/full.txt or set SENTIMENT_BACKEND=finbert."
+        ) from error
+
+    return onnxruntime
+
+
+def _require_tokenizer_loader() -> Any:
+    try:
+        from transformers import AutoTokenizer
+    except ImportError as error:
+        raise RuntimeError(
+            "FinBERT ONNX scoring requires the optional transformers dependency "
+            "for tokenization. Install requirements/full.txt or set "
+            "SENTIMENT_BACKEND=lexicon."
+        ) from error
+
+    return AutoTokenizer
+
+
+def onnx_export_dir(model_name: str, base_dir: str | Path | None = None) -> Path:
+    root = Path(base_dir) if base_dir else PROJECT_ROOT / settings.finbert_onnx_dir
+    return root / model_name.replace("/", "__")
+
+
+def export_finbert_onnx(model_name: str, export_dir: Path, quantize: bool) -> Path:
+    """
+    Export a Hugging Face sequence classifier to ONNX once and reuse it.
+
+    The tokenizer and `id2label` mapping are saved next to the graph, so
+    later runs need only onnxruntime and the tokenizer, not PyTorch.
+    Quantization is int8 dynamic (weights only), which needs no calibration
+    data and suits CPU-only nodes.
+    """
+    model_path = export_dir / MODEL_FILE
+    quantized_path = export_dir / QUANTIZED_MODEL_FILE
+
+    if not model_path.exists():
+        try:
+            import torch
+            from transformers import AutoModelForSequenceClassification
+        except ImportError as error:
+            raise RuntimeError(
+                "Exporting FinBERT to ONNX requires torch and transformers. "
+                "Install requirements/full.txt once to build the ONNX model."
+            ) from error
+
+        export_dir.mkdir(parents=True, exist_ok=True)
+        tokenizer = _require_tokenizer_loader().from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+
+        sample = tokenizer(["Quicksilver export sample"], return_tensors="pt")
+        input_names = [
+            name
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+            if name in sample
+        ]
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(model_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes={
+                **{name: {0: "batch", 1: "sequence"} for name in input_names},
+                "logits": {0: "batch"},
+            },
+            opset_version=17,
+            dynamo=False,
+        )
+        tokenizer.save_pretrained(export_dir)
+        (export_dir / LABELS_FILE).write_text(
+            json.dumps({str(index): label for index, label in model.config.id2label.items()})
+        )
+        logger.info("Exported %s to ONNX at %s.", model_name, model_path)
+
+    if not quantize:
+        return model_path
+
+    if not quantized_path.exists():
+        _require_onnxruntime()
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(
+            model_input=str(model_path),
+            model_output=str(quantized_path),
+            weight_type=QuantType.QInt8,
+        )
+        logger.info("Wrote int8 dynamically quantized FinBERT to %s.", quantized_path)
+
+    return quantized_path
+
+
+class OnnxFinBERTClassifier:
+    """
+    ONNX Runtime stand-in for the transformers text-classification pipeline.
+
+    Calls return the pipeline's all-scores shape, a list of
+    `[{"label": ..., "score": ...}, ...]` per text, so FinBERTScorer's label
+    handling is reused unchanged.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        id2label: dict[int, str],
+        max_length: int = MAX_SEQUENCE_TOKENS,
+    ) -> None:
+        self.session = session
+        self.tokenizer = tokenizer
+        self.id2label = id2label
+        self.max_length = max_length
+        self._input_names = [model_input.name for model_input in session.get_inputs()]
+
+    @classmethod
+    def load_or_export(
+        cls,
+        model_name: str,
+        export_dir: Path,
+        quantize: bool,
+        max_length: int = MAX_SEQUENCE_TOKENS,
+        intra_op_threads: int = 0,
+    ) -> OnnxFinBERTClassifier:
+        onnxruntime = _require_onnxruntime()
+        model_path = export_finbert_onnx(model_name, export_dir, quantize)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        session = onnxruntime.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        tokenizer = _require_tokenizer_loader().from_pretrained(export_dir)
+        labels = json.loads((export_dir / LABELS_FILE).read_text())
+        return cls(
+            session=session,
+            tokenizer=tokenizer,
+            id2label={int(index): label for index, label in labels.items()},
+            max_length=max_length,
+        )
+
+    def __call__(
+        self,
+        texts: str | Sequence[str],
+        batch_size: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        text_list = [texts] if isinstance(texts, str) else list(texts)
+        if not text_list:
+            return []
+
+        step = batch_size or len(text_list)
+        results: list[list[dict[str, Any]]] = []
+        for start in range(0, len(text_list), step):
+            results.extend(self._classify(text_list[start : start + step]))
+        return results
+
+    def _classify(self, texts: list[str]) -> list[list[dict[str, Any]]]:
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        feeds = {
+            name: np.asarray(encoded[name], dtype=np.int64)
+            for name in self._input_names
+            if name in encoded
+        }
+        logits = np.asarray(self.session.run(None, feeds)[0], dtype=np.float64)
+        shifted = logits - logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(shifted)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+
+        return [
+            [
+                {"label": self.id2label[index], "score": float(row[index])}
+                for index in range(row.shape[0])
+            ]
+            for row in probabilities
+        ]
+
+
+class FinBERTOnnxScorer(FinBERTScorer):
+    """FinBERTScorer that runs an exported (optionally int8) ONNX graph on CPU."""
+
+    def __init__(
+        self,
+        model_name: str = "ProsusAI/finbert",
+        batch_size: int | None = None,
+        token_budget: int | None = None,
+        score_cache: SentimentScoreCache | None = None,
+        quantize: bool | None = None,
+        export_dir: str | Path | None = None,
+    ) -> None:
+        self.quantize = settings.finbert_onnx_quantize if quantize is None else quantize
+        self.export_dir = onnx_export_dir(model_name, export_dir)
+        self.backend_name = "finbert_onnx_int8" if self.quantize else "finbert_onnx"
+        super().__init__(
+            model_name=model_name,
+            batch_size=batch_size,
+            device=-1,
+            token_budget=token_budget,
+            score_cache=score_cache,
+        )
+
+    def _build_classifier(self, **pipeline_kwargs: Any) -> Any:
+        return OnnxFinBERTClassifier.load_or_export(
+            model_name=pipeline_kwargs["model"],
+            export_dir=self.export_dir,
+            quantize=self.quantize,
+            max_length=pipeline_kwargs.get("max_length", MAX_SEQUENCE_TOKENS),
+        )
+
+
+@dataclass(slots=True)
+class BackendComparison:
+    texts: int
+    reference_seconds: float
+    candidate_seconds: float
+    label_agreement_pct: float
+    mean_abs_compound_diff: float
+    max_abs_compound_diff: float
+
+    @property
+    def reference_texts_per_second(self) -> float:
+        return self.texts / self.reference_seconds if self.reference_seconds else 0.0
+
+    @property
+    def candidate_texts_per_second(self) -> float:
+        return self.texts / self.candidate_seconds if self.candidate_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.candidate_seconds if self.candidate_seconds else 0.0
+
+
+def compare_backends(
+    reference: Callable[[list[str]], list[SentimentResult | None]],
+    candidate: Callable[[list[str]], list[SentimentResult | None]],
+    texts: list[str],
+    warmup_texts: int = 8,
+) -> BackendComparison:
+    """Score the same texts with two backends and compare accuracy and speed."""
+    if warmup_texts:
+        reference(texts[:warmup_texts])
+        candidate(texts[:warmup_texts])
+
+    started = time.perf_counter()
+    reference_results = reference(texts)
+    reference_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    candidate_results = candidate(texts)
+    candidate_seconds = time.perf_counter() - started
+
+    pairs = [
+        (expected, actual)
+        for expected, actual in zip(reference_results, candidate_results)
+        if expected is not None and actual is not None
+    ]
+    differences = [abs(expected.compound_score - actual.compound_score) for expected, actual in pairs]
+    agreements = sum(1 for expected, actual in pairs if expected.label == actual.label)
+
+    return BackendComparison(
+        texts=len(texts),
+        reference_seconds=round(reference_seconds, 4),
+        candidate_seconds=round(candidate_seconds, 4),
+        label_agreement_pct=round(100 * agreements / len(pairs), 2) if pairs else 0.0,
+        mean_abs_compound_diff=(
+            round(sum(differences) / len(differences), 6) if differences else 0.0
+        ),
+        max_abs_compound_diff=round(max(differences), 6) if differences else 0.0,
+    )
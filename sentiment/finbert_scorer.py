@@ -2,13 +2,28 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from typing import Any
-from datetime import datetime, timezone
+from datetime import datetime
 
+from config import settings
 from models.raw_headline import RawHeadline
 from models.sentiment_result import SentimentResult
 from models.scored_headline import ScoredHeadline
+from sentiment.headline_scoring import build_scored_headline, calculate_age_hours
+from sentiment.score_cache import SentimentScoreCache, score_texts_with_cache
 from sentiment.source_quality import classify_source
+from sentiment.summary_chunking import (
+    MAX_SEQUENCE_TOKENS,
+    build_summary_chunker,
+    pool_segment_results,
+    score_headlines_with_summaries,
+)
+from sentiment.token_batching import (
+    TokenBatchStats,
+    padded_token_count,
+    plan_token_batches,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -28,14 +43,25 @@ def pipeline(*args: Any, **kwargs: Any) -> Any:
 
 
 class FinBERTScorer:
+    backend_name = "finbert"
+
     def __init__(
         self,
         model_name: str = "ProsusAI/finbert",
         batch_size: int | None = None,
         device: Any | None = None,
+        token_budget: int | None = None,
+        score_cache: SentimentScoreCache | None = None,
+        score_summaries: bool | None = None,
     ) -> None:
         self.model_name = model_name
+        self.score_cache = score_cache
+        self.score_summaries = (
+            settings.finbert_score_summaries if score_summaries is None else score_summaries
+        )
         self.batch_size = batch_size or self._default_batch_size()
+        self.token_budget = token_budget or self._default_token_budget()
+        self.batch_stats = TokenBatchStats()
         self.device = self._resolve_device() if device is None else device
         self.classifier = self._build_classifier(
             task="text-classification",
@@ -43,9 +69,12 @@ class FinBERTScorer:
             tokenizer=model_name,
             return_all_scores=True,
             truncation=True,
-            max_length=512,
+            max_length=MAX_SEQUENCE_TOKENS,
             device=self.device,
         )
+        self.summary_chunker = build_summary_chunker(
+            tokenizer=getattr(self.classifier, "tokenizer", None),
+        )
 
     @staticmethod
     def _build_classifier(**pipeline_kwargs: Any) -> Any:
@@ -64,6 +93,19 @@ class FinBERTScorer:
 
         return 64
 
+    @staticmethod
+    def _default_token_budget() -> int:
+        configured_budget = os.getenv("FINBERT_TOKEN_BUDGET")
+        if configured_budget:
+            try:
+                return max(MAX_SEQUENCE_TOKENS, int(configured_budget))
+            except ValueError:
+                logger.warning(
+                    "Invalid FINBERT_TOKEN_BUDGET; falling back to 8192 tokens."
+                )
+
+        return 8192
+
     @staticmethod
     def _resolve_device() -> Any:
         try:
@@ -88,10 +130,8 @@ class FinBERTScorer:
     
     @staticmethod
     def _calculate_age_hours(published_at_utc: datetime) -> float:
-        now = datetime.now(timezone.utc)
-        delta = now - published_at_utc
-        return round(delta.total_seconds() / 3600, 2)
-    
+        return calculate_age_hours(published_at_utc)
+
     def score_text(self, text: str) -> SentimentResult:
         if not text or not text.strip():
             raise ValueError("Text for sentiment scoring cannot be empty.")
@@ -132,75 +172,191 @@ class FinBERTScorer:
         )
     
     def score_headline(self, headline: RawHeadline) -> SentimentResult:
-        return self.score_text(headline.headline)
+        if not self.score_summaries:
+            return self.score_text(headline.headline)
+
+        if not headline.headline or not headline.headline.strip():
+            raise ValueError("Text for sentiment scoring cannot be empty.")
+        segments = self.summary_chunker.segments(headline)
+        result = pool_segment_results(
+            self.score_texts(segments),
+            [len(segment) for segment in segments],
+        )
+        if result is None:
+            raise ValueError("FinBERT returned no results.")
+        return result
 
     def _build_scored_headline(
         self,
         headline: RawHeadline,
         result: SentimentResult,
     ) -> ScoredHeadline:
-        return ScoredHeadline(
-            ticker=headline.ticker,
-            headline=headline.headline,
-            source=headline.source,
-            url=headline.url,
-            published_at_utc=headline.published_at_utc,
-            summary=headline.summary,
-            sentiment_label=result.label,
-            positive_score=result.positive_score,
-            neutral_score=result.neutral_score,
-            negative_score=result.negative_score,
-            compound_score=result.compound_score,
-            confidence=result.confidence,
-            headline_age_hours=self._calculate_age_hours(headline.published_at_utc),
-            source_tier=self._classify_source(headline.source),
-            category=headline.category,
-            topic=headline.topic,
-            industry=headline.industry,
-        )
+        return build_scored_headline(headline, result)
 
-    def _score_batch_fast(self, headlines: list[RawHeadline]) -> list[ScoredHeadline] | None:
-        if len(headlines) < self.batch_size:
-            return None
+    def _token_lengths(self, texts: list[str]) -> list[int]:
+        """Token counts from the pipeline tokenizer, or a ~4 chars/token estimate."""
+        tokenizer = getattr(self.classifier, "tokenizer", None)
+        if tokenizer is not None:
+            try:
+                encoded = tokenizer(
+                    texts,
+                    truncation=True,
+                    max_length=MAX_SEQUENCE_TOKENS,
+                )["input_ids"]
+                if isinstance(encoded, list) and len(encoded) == len(texts):
+                    return [len(input_ids) for input_ids in encoded]
+            except Exception as e:
+                logger.debug("Tokenizer length lookup failed, estimating: %s", e)
 
-        raw_results = self.classifier(
-            [headline.headline for headline in headlines],
-            batch_size=self.batch_size,
-        )
+        return [
+            min(MAX_SEQUENCE_TOKENS, len(text) // 4 + 2)
+            for text in texts
+        ]
 
-        if not isinstance(raw_results, list) or len(raw_results) != len(headlines):
-            return None
+    def score_texts(self, texts: list[str]) -> list[SentimentResult | None]:
+        """
+        Score in length-sorted batches that fit `token_budget` padded tokens.
 
-        scored: list[ScoredHeadline] = []
-        for headline, scores in zip(headlines, raw_results):
-            if not isinstance(scores, list):
-                return None
+        Similar-length texts share a batch, so dynamic padding wastes little
+        compute. A batch that raises or returns malformed output is bisected
+        until the bad rows are isolated; those come back as None. Results
+        keep the caller's order.
+        """
+        if not texts:
+            return []
 
-            result = self._sentiment_result_from_scores(scores)
-            scored.append(self._build_scored_headline(headline, result))
+        lengths = self._token_lengths(texts)
+        batches = plan_token_batches(lengths, self.token_budget, self.batch_size)
+        raw_scores: list[list[dict[str, Any]] | None] = [None] * len(texts)
+        started = time.perf_counter()
 
-        return scored
-    
-    def score_batch(self, headlines: list[RawHeadline]) -> list[ScoredHeadline]:
+        for batch in batches:
+            self._score_token_batch(texts, lengths, batch, raw_scores)
+
+        self._record_batch_stats(len(texts), len(batches), time.perf_counter() - started)
+
+        results: list[SentimentResult | None] = []
+        for text, scores in zip(texts, raw_scores):
+            if scores is None:
+                results.append(None)
+                continue
+            try:
+                results.append(self._sentiment_result_from_scores(scores))
+            except Exception as e:
+                logger.warning("Skipping text %r: %s", text[:80], e)
+                results.append(None)
+        return results
+
+    def _score_token_batch(
+        self,
+        texts: list[str],
+        lengths: list[int],
+        batch: list[int],
+        raw_scores: list[list[dict[str, Any]] | None],
+        is_fallback: bool = False,
+    ) -> None:
         try:
-            scored_fast = self._score_batch_fast(headlines)
-            if scored_fast is not None:
-                return scored_fast
+            batch_scores = self._batch_scores(
+                self.classifier(
+                    [texts[index] for index in batch],
+                    batch_size=len(batch),
+                ),
+                len(batch),
+            )
+            error: Exception | None = None
         except Exception as e:
+            batch_scores = None
+            error = e
+
+        if batch_scores is not None:
+            for index, scores in zip(batch, batch_scores):
+                raw_scores[index] = scores
+            self.batch_stats.real_tokens += sum(max(1, lengths[index]) for index in batch)
+            self.batch_stats.padded_tokens += padded_token_count(lengths, [batch])
+            if is_fallback:
+                self.batch_stats.fallback_rows += len(batch)
+            return
+
+        if len(batch) == 1:
+            self.batch_stats.failed_rows += 1
+            if is_fallback:
+                self.batch_stats.fallback_rows += 1
             logger.warning(
-                "Batch scoring failed, falling back to per-headline scoring: %s",
-                e,
+                "Skipping text %r: %s",
+                texts[batch[0]][:80],
+                error or "FinBERT returned malformed results.",
             )
+            return
+
+        self.batch_stats.bisected_batches += 1
+        logger.warning(
+            "FinBERT batch of %s failed, bisecting to isolate bad rows: %s",
+            len(batch),
+            error or "malformed results",
+        )
+        midpoint = len(batch) // 2
+        for half in (batch[:midpoint], batch[midpoint:]):
+            self._score_token_batch(texts, lengths, half, raw_scores, is_fallback=True)
+
+    @staticmethod
+    def _batch_scores(
+        raw_results: Any,
+        expected_rows: int,
+    ) -> list[list[dict[str, Any]]] | None:
+        if not isinstance(raw_results, list) or not raw_results:
+            return None
+        if expected_rows == 1 and isinstance(raw_results[0], dict):
+            return [raw_results]
+        if len(raw_results) != expected_rows:
+            return None
+        if not all(isinstance(scores, list) for scores in raw_results):
+            return None
+        return raw_results
 
-        scored = []
+    def _record_batch_stats(self, texts: int, batches: int, seconds: float) -> None:
+        self.batch_stats.texts += texts
+        self.batch_stats.batches += batches
+        self.batch_stats.seconds += seconds
+        logger.info(
+            "FinBERT scored %s texts in %s batches: %.0f tokens/s, %.1f%% padding waste, "
+            "%.1f%% fallback rate.",
+            texts,
+            batches,
+            self.batch_stats.tokens_per_second,
+            self.batch_stats.padding_waste_pct,
+            self.batch_stats.fallback_rate_pct,
+        )
 
+    def score_batch(self, headlines: list[RawHeadline]) -> list[ScoredHeadline]:
+        if self.score_summaries:
+            return score_headlines_with_summaries(
+                headlines,
+                self.score_texts,
+                self.summary_chunker,
+                self.score_cache,
+                backend=self.backend_name,
+                model_name=self.model_name,
+            )
+
+        scorable: list[RawHeadline] = []
         for headline in headlines:
-            try:
-                result = self.score_headline(headline)
+            if headline.headline and headline.headline.strip():
+                scorable.append(headline)
+            else:
+                logger.warning(
+                    "Skipping headline for %s: Text for sentiment scoring cannot be empty.",
+                    headline.ticker,
+                )
 
-                scored.append(self._build_scored_headline(headline, result))
-            except Exception as e:
-                logger.warning("Skipping headline for %s: %s", headline.ticker, e)
-                continue
-        
-        return scored
+        results = score_texts_with_cache(
+            [headline.headline for headline in scorable],
+            self.score_texts,
+            self.score_cache,
+            backend=self.backend_name,
+            model_name=self.model_name,
+        )
+        return [
+            self._build_scored_headline(headline, result)
+            for headline, result in zip(scorable, results)
+            if result is not None
+        ]
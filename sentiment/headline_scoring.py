@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+import re
+from typing import Callable
+
+import numpy as np
+
+from models.headline_batch import HeadlineBatch, as_headline_list
+from models.raw_headline import RawHeadline
+from models.scored_headline import ScoredHeadline
+from models.sentiment_result import SentimentResult
+from sentiment.source_quality import classify_source
+
+
+def calculate_age_hours(published_at_utc: datetime) -> float:
+    now = datetime.now(timezone.utc)
+    delta = now - published_at_utc
+    return round(delta.total_seconds() / 3600, 2)
+
+
+def build_scored_headline(
+    headline: RawHeadline,
+    result: SentimentResult,
+    scoring_stage: str | None = None,
+) -> ScoredHeadline:
+    """Combine a raw headline with its sentiment result; shared by every backend."""
+    return ScoredHeadline(
+        ticker=headline.ticker,
+        headline=headline.headline,
+        source=headline.source,
+        url=headline.url,
+        published_at_utc=headline.published_at_utc,
+        summary=headline.summary,
+        sentiment_label=result.label,
+        positive_score=result.positive_score,
+        neutral_score=result.neutral_score,
+        negative_score=result.negative_score,
+        compound_score=result.compound_score,
+        confidence=result.confidence,
+        headline_age_hours=calculate_age_hours(headline.published_at_utc),
+        source_tier=classify_source(headline.source),
+        category=headline.category,
+        topic=headline.topic,
+        industry=headline.industry,
+        content_hash=headline.content_hash,
+        scoring_stage=scoring_stage,
+        story_cluster_id=headline.story_cluster_id,
+    )
+
+
+@dataclass(slots=True)
+class TextDedupStats:
+    rows: int = 0
+    unique_texts: int = 0
+
+    @property
+    def unique_ratio(self) -> float:
+        return round(self.unique_texts / self.rows, 4) if self.rows else 1.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "rows": self.rows,
+            "unique_texts": self.unique_texts,
+            "unique_ratio": self.unique_ratio,
+        }
+
+
+def scored_text_key(headline: RawHeadline | ScoredHeadline) -> tuple[str, str]:
+    """Whitespace-normalized headline and summary, the text every backend scores."""
+    return _text_key(headline.headline, headline.summary)
+
+
+def _text_key(headline: str | None, summary: str | None) -> tuple[str, str]:
+    return (
+        re.sub(r"\s+", " ", headline or "").strip(),
+        re.sub(r"\s+", " ", summary or "").strip(),
+    )
+
+
+def score_unique_headlines(
+    headlines: list[RawHeadline] | HeadlineBatch,
+    score_batch: Callable[[list[RawHeadline]], list[ScoredHeadline]],
+    stats: TextDedupStats | None = None,
+) -> list[ScoredHeadline] | HeadlineBatch:
+    """
+    Score each distinct text once and fan the result out to every row.
+
+    Political and policy items are copied into one RawHeadline per affected
+    ticker, so a batch often repeats the same text. Only the first row of
+    each text is sent to `score_batch`; the other rows reuse its result with
+    their own ticker, source, URL and timestamp. Output follows input order,
+    and a text the scorer skips is skipped for every copy.
+
+    A HeadlineBatch in gives a scored HeadlineBatch out: only the
+    representatives are materialized for the scorer, and the fan-out is
+    assembled column by column.
+    """
+    if isinstance(headlines, HeadlineBatch):
+        return _score_unique_batch(headlines, score_batch, stats)
+
+    headlines = as_headline_list(headlines)
+    representatives: dict[tuple[str, str], RawHeadline] = {}
+    for headline in headlines:
+        representatives.setdefault(scored_text_key(headline), headline)
+
+    if stats is not None:
+        stats.rows += len(headlines)
+        stats.unique_texts += len(representatives)
+    if len(representatives) == len(headlines):
+        return score_batch(headlines)
+
+    scored_by_text = {
+        scored_text_key(scored): scored
+        for scored in score_batch(list(representatives.values()))
+    }
+    fanned_out: list[ScoredHeadline] = []
+    for headline in headlines:
+        scored = scored_by_text.get(scored_text_key(headline))
+        if scored is None:
+            continue
+        if representatives[scored_text_key(headline)] is not headline:
+            scored = build_scored_headline(
+                headline,
+                SentimentResult(
+                    label=scored.sentiment_label,
+                    positive_score=scored.positive_score,
+                    neutral_score=scored.neutral_score,
+                    negative_score=scored.negative_score,
+                    compound_score=scored.compound_score,
+                    confidence=scored.confidence,
+                ),
+                scoring_stage=scored.scoring_stage,
+            )
+        fanned_out.append(scored)
+    return fanned_out
+
+
+def _score_unique_batch(
+    headlines: HeadlineBatch,
+    score_batch: Callable[[list[RawHeadline]], list[ScoredHeadline]],
+    stats: TextDedupStats | None,
+) -> HeadlineBatch:
+    keys = [
+        _text_key(headline, summary)
+        for headline, summary in zip(headlines.column("headline"), headlines.column("summary"))
+    ]
+    first_position: dict[tuple[str, str], int] = {}
+    for position, key in enumerate(keys):
+        first_position.setdefault(key, position)
+    if stats is not None:
+        stats.rows += len(keys)
+        stats.unique_texts += len(first_position)
+
+    scored = HeadlineBatch.from_headlines(
+        score_batch(headlines.take(list(first_position.values())).to_headlines()),
+        row_type=ScoredHeadline,
+    )
+    scored_position = {
+        _text_key(headline, summary): position
+        for position, (headline, summary) in enumerate(
+            zip(scored.column("headline"), scored.column("summary"))
+        )
+    }
+    row_positions = np.array(
+        [scored_position.get(key, -1) for key in keys],
+        dtype=np.int64,
+    )
+    kept = np.flatnonzero(row_positions >= 0)
+
+    # Scores and labels come from the representative; everything that
+    # describes the row itself comes from the row.
+    kept_rows = headlines.take(kept)
+    fanned_out = scored.take(row_positions[kept]).with_columns_from(
+        kept_rows,
+        [field.name for field in fields(RawHeadline)],
+    )
+    published = kept_rows.column("published_at_utc")
+    return fanned_out.with_column(
+        "source_tier",
+        [classify_source(source) for source in kept_rows.column("source")],
+    ).with_column(
+        "headline_age_hours",
+        [calculate_age_hours(published_at_utc) for published_at_utc in published],
+    )
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
+import hashlib
+import json
 import logging
 from math import exp
 import re
 
+import numpy as np
+
+from models.headline_batch import HeadlineBatch, as_headline_list
 from models.raw_headline import RawHeadline
 from models.scored_headline import ScoredHeadline
 from models.sentiment_result import SentimentResult
-from sentiment.source_quality import classify_source
+from sentiment.headline_scoring import build_scored_headline, calculate_age_hours
+from sentiment.score_cache import SentimentScoreCache, score_texts_with_cache
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +84,184 @@ NEGATIVE_TERMS: dict[str, float] = {
     "warning": 0.9,
 }
 
+# Cache namespace for lexicon scores; changes whenever either term table does.
+LEXICON_VERSION = "lexicon-" + hashlib.sha256(
+    json.dumps([POSITIVE_TERMS, NEGATIVE_TERMS], sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
+
+WORD_TOKEN_PATTERN = re.compile(r"\w+")
+# Joins a batch into one string. Neither a word nor a space character, so
+# swapping it for "\x01" inside a text changes no match.
+ROW_SEPARATOR = "\x00"
+# ASCII non-word bytes become spaces, leaving only the `\w+` runs.
+ASCII_NON_WORD_BYTES = bytes(
+    code
+    for code in range(128)
+    if not (chr(code).isalnum() or chr(code) == "_" or chr(code) == ROW_SEPARATOR)
+)
+ASCII_TOKEN_TABLE = bytes.maketrans(
+    ASCII_NON_WORD_BYTES,
+    b" " * len(ASCII_NON_WORD_BYTES),
+)
+
+
+class CompiledLexicon:
+    """
+    Positive and negative term tables compiled into one batch matcher.
+
+    A single-word term matches `\\bterm\\b` exactly when it is one of the
+    text's `\\w+` runs. ASCII rows are joined, non-word bytes turned into
+    spaces and split once; the tokens are looked up in the sorted
+    vocabulary with `np.searchsorted` for the whole batch. Non-ASCII rows
+    are tokenized with the Unicode regex. Multi-word terms match across
+    any whitespace run, as the old collapsed-text check did. Weights are
+    summed column by column in table order, so each row adds the same
+    floats in the same order as the per-term loop did.
+    """
+
+    def __init__(self, positive: dict[str, float], negative: dict[str, float]) -> None:
+        self.terms = list(positive) + list(negative)
+        self.weights = list(positive.values()) + list(negative.values())
+        self.positive_columns = range(len(positive))
+        self.negative_columns = range(len(positive), len(self.terms))
+
+        self.word_columns: dict[str, list[int]] = {}
+        self.phrase_patterns: list[tuple[int, re.Pattern[str]]] = []
+        self.pattern_columns: list[tuple[int, re.Pattern[str]]] = []
+        for column, term in enumerate(self.terms):
+            if " " in term:
+                if term != " ".join(term.split()):
+                    raise ValueError(f"Lexicon phrase {term!r} must be single-spaced.")
+                self.phrase_patterns.append(
+                    (column, re.compile(r"\s+".join(map(re.escape, term.split()))))
+                )
+            elif WORD_TOKEN_PATTERN.fullmatch(term):
+                self.word_columns.setdefault(term, []).append(column)
+            else:
+                self.pattern_columns.append((column, re.compile(rf"\b{re.escape(term)}\b")))
+        self.vocabulary = frozenset(self.word_columns)
+        # Sorted fixed-width vocabulary one byte wider than its longest word,
+        # so truncated longer tokens can never compare equal to a term.
+        ascii_words = sorted(word for word in self.word_columns if word.isascii())
+        longest = max((len(word) for word in ascii_words), default=0)
+        self.ascii_vocabulary = np.array(
+            [word.encode("ascii") for word in ascii_words],
+            dtype=f"S{longest + 1}",
+        )
+        self.ascii_first_columns = np.array(
+            [self.word_columns[word][0] for word in ascii_words],
+            dtype=np.int64,
+        )
+        self.ascii_extra_columns = [
+            (word_index, column)
+            for word_index, word in enumerate(ascii_words)
+            for column in self.word_columns[word][1:]
+        ]
+
+    def term_counts(self, texts: list[str]) -> np.ndarray:
+        """Occurrences of every term per text, as a `(texts, terms)` matrix."""
+        width = len(self.terms)
+        folded_texts = [text.casefold() for text in texts]
+        joined = ROW_SEPARATOR.join(folded_texts)
+        if joined.count(ROW_SEPARATOR) != len(texts) - 1:
+            folded_texts = [text.replace(ROW_SEPARATOR, "\x01") for text in folded_texts]
+            joined = ROW_SEPARATOR.join(folded_texts)
+
+        cells: list[np.ndarray] = []
+        ascii_rows = [row for row, folded in enumerate(folded_texts) if folded.isascii()]
+        if ascii_rows:
+            cells.extend(self._ascii_word_cells(folded_texts, ascii_rows, width))
+        if len(ascii_rows) < len(folded_texts):
+            ascii_row_set = set(ascii_rows)
+            for row, folded in enumerate(folded_texts):
+                if row not in ascii_row_set:
+                    tokens = WORD_TOKEN_PATTERN.findall(folded)
+                    cells.append(self._token_cells(row, tokens, width))
+        for column, pattern in self.pattern_columns:
+            for row, folded in enumerate(folded_texts):
+                occurrences = len(pattern.findall(folded))
+                cells.append(np.full(occurrences, row * width + column, dtype=np.int64))
+        if self.phrase_patterns:
+            cells.extend(self._phrase_cells(folded_texts, joined, width))
+
+        counts = np.bincount(
+            np.concatenate(cells) if cells else np.zeros(0, dtype=np.int64),
+            minlength=len(texts) * width,
+        )
+        return counts.reshape(len(texts), width)
+
+    def _token_cells(self, row: int, tokens: list[str], width: int) -> np.ndarray:
+        cells = [
+            row * width + column
+            for word in self.vocabulary.intersection(tokens)
+            for column in self.word_columns[word]
+            for _ in range(tokens.count(word))
+        ]
+        return np.asarray(cells, dtype=np.int64)
+
+    def _ascii_word_cells(
+        self,
+        folded_texts: list[str],
+        ascii_rows: list[int],
+        width: int,
+    ) -> list[np.ndarray]:
+        if not self.ascii_vocabulary.size:
+            return []
+
+        # One split over the translated batch; separators stay as tokens that
+        # become b"" in the fixed-width array and mark where each row ends.
+        buffer = (
+            ROW_SEPARATOR.join(folded_texts[row] for row in ascii_rows)
+            .encode("ascii")
+            .translate(ASCII_TOKEN_TABLE)
+            .replace(ROW_SEPARATOR.encode("ascii"), b" \x00 ")
+        )
+        tokens = np.array(buffer.split(), dtype=self.ascii_vocabulary.dtype)
+        token_rows = np.asarray(ascii_rows, dtype=np.int64)[np.cumsum(tokens == b"")]
+
+        vocabulary_index = np.minimum(
+            np.searchsorted(self.ascii_vocabulary, tokens),
+            self.ascii_vocabulary.size - 1,
+        )
+        hits = np.flatnonzero(self.ascii_vocabulary[vocabulary_index] == tokens)
+        hit_rows = token_rows[hits]
+        hit_words = vocabulary_index[hits]
+
+        cells = [hit_rows * width + self.ascii_first_columns[hit_words]]
+        for word_index, column in self.ascii_extra_columns:
+            cells.append(hit_rows[hit_words == word_index] * width + column)
+        return cells
+
+    def _phrase_cells(self, folded_texts: list[str], joined: str, width: int) -> list[np.ndarray]:
+        """
+        Find multi-word terms in the whole batch at once.
+
+        `term in " ".join(text.split())` holds exactly when the term's words
+        appear separated by any whitespace run, which one regex per term
+        finds in the joined batch without collapsing every row first.
+        """
+        row_starts = np.cumsum([0] + [len(text) + 1 for text in folded_texts[:-1]])
+
+        cells: list[np.ndarray] = []
+        for column, pattern in self.phrase_patterns:
+            positions = [match.start() for match in pattern.finditer(joined)]
+            if positions:
+                rows = np.unique(np.searchsorted(row_starts, positions, side="right") - 1)
+                cells.append(rows * width + column)
+        return cells
+
+    def weighted_scores(self, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        positive = np.zeros(counts.shape[0], dtype=np.float64)
+        negative = np.zeros(counts.shape[0], dtype=np.float64)
+        for column in self.positive_columns:
+            positive += counts[:, column] * self.weights[column]
+        for column in self.negative_columns:
+            negative += counts[:, column] * self.weights[column]
+        return positive, negative
+
+
+COMPILED_LEXICON = CompiledLexicon(POSITIVE_TERMS, NEGATIVE_TERMS)
+
 
 class LexiconSentimentScorer:
     """
@@ -88,19 +272,84 @@ class LexiconSentimentScorer:
     `SENTIMENT_BACKEND=finbert` without changing storage or analytics code.
     """
 
+    backend_name = "lexicon"
+    model_name = LEXICON_VERSION
+
+    def __init__(self, score_cache: SentimentScoreCache | None = None) -> None:
+        self.score_cache = score_cache
+
     def score_text(self, text: str) -> SentimentResult:
         if not text or not text.strip():
             raise ValueError("Text for sentiment scoring cannot be empty.")
 
-        normalized = self._normalize_text(text)
-        positive = self._weighted_term_score(normalized, POSITIVE_TERMS)
-        negative = self._weighted_term_score(normalized, NEGATIVE_TERMS)
+        return self._score_nonempty_texts([text])[0][0]
 
-        if positive == 0 and negative == 0:
-            compound = 0.0
-        else:
-            compound = max(min((positive - negative) / (positive + negative + 1.0), 1), -1)
+    def score_headline(self, headline: RawHeadline) -> SentimentResult:
+        return self.score_text(self.scoring_text(headline))
+
+    def score_texts(self, texts: list[str]) -> list[SentimentResult | None]:
+        return self.score_texts_with_term_weights(texts)[0]
 
+    def score_texts_with_term_weights(
+        self,
+        texts: list[str],
+    ) -> tuple[list[SentimentResult | None], np.ndarray, np.ndarray]:
+        """Scores plus each text's summed positive and negative term weights."""
+        positions: list[int] = []
+        scorable_texts: list[str] = []
+        for position, text in enumerate(texts):
+            if text and not text.isspace():
+                positions.append(position)
+                scorable_texts.append(text)
+            else:
+                logger.warning(
+                    "Skipping text %r: Text for sentiment scoring cannot be empty.",
+                    (text or "")[:80],
+                )
+
+        scored, positive, negative = self._score_nonempty_texts(scorable_texts)
+        results: list[SentimentResult | None] = [None] * len(texts)
+        for position, result in zip(positions, scored):
+            results[position] = result
+
+        positive_weights = np.zeros(len(texts), dtype=np.float64)
+        negative_weights = np.zeros(len(texts), dtype=np.float64)
+        positive_weights[positions] = positive
+        negative_weights[positions] = negative
+        return results, positive_weights, negative_weights
+
+    def _score_nonempty_texts(
+        self,
+        texts: list[str],
+    ) -> tuple[list[SentimentResult], np.ndarray, np.ndarray]:
+        """
+        Score a batch with array math over the term-count matrix.
+
+        Probabilities depend only on the compound, so each distinct compound
+        goes through `_result_values` once; headline batches repeat a few
+        hundred compounds at most. That keeps Python's `exp` and `round`,
+        which NumPy's vectorized versions do not match bit for bit.
+        """
+        if not texts:
+            return [], np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.float64)
+
+        positive, negative = COMPILED_LEXICON.weighted_scores(
+            COMPILED_LEXICON.term_counts(texts)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (positive - negative) / (positive + negative + 1.0)
+        compound = np.where(
+            (positive == 0) & (negative == 0),
+            0.0,
+            np.clip(ratio, -1.0, 1.0),
+        )
+
+        distinct, inverse = np.unique(compound, return_inverse=True)
+        values = [self._result_values(float(value)) for value in distinct]
+        results = [SentimentResult(*values[index]) for index in inverse.tolist()]
+        return results, positive, negative
+
+    def _result_values(self, compound: float) -> tuple[str, float, float, float, float, float]:
         positive_probability = self._sigmoid(compound * 3)
         negative_probability = self._sigmoid(-compound * 3)
         neutral_probability = max(0.05, 1.0 - abs(compound))
@@ -117,46 +366,36 @@ class LexiconSentimentScorer:
         }
         label = max(score_map, key=score_map.get)
 
-        return SentimentResult(
-            label=label,
-            positive_score=round(positive_score, 6),
-            neutral_score=round(neutral_score, 6),
-            negative_score=round(negative_score, 6),
-            compound_score=round(positive_score - negative_score, 6),
-            confidence=round(score_map[label], 6),
+        return (
+            label,
+            round(positive_score, 6),
+            round(neutral_score, 6),
+            round(negative_score, 6),
+            round(positive_score - negative_score, 6),
+            round(score_map[label], 6),
         )
 
-    def score_headline(self, headline: RawHeadline) -> SentimentResult:
-        text = f"{headline.headline}. {headline.summary or ''}"
-        return self.score_text(text)
-
-    def score_batch(self, headlines: list[RawHeadline]) -> list[ScoredHeadline]:
-        scored: list[ScoredHeadline] = []
-        for headline in headlines:
-            try:
-                result = self.score_headline(headline)
-            except Exception as error:
-                logger.warning("Skipping headline for %s: %s", headline.ticker, error)
-                continue
-
-            scored.append(self._build_scored_headline(headline, result))
-
-        return scored
+    def score_batch(
+        self,
+        headlines: list[RawHeadline] | HeadlineBatch,
+    ) -> list[ScoredHeadline]:
+        headlines = as_headline_list(headlines)
+        results = score_texts_with_cache(
+            [self.scoring_text(headline) for headline in headlines],
+            self.score_texts,
+            self.score_cache,
+            backend=self.backend_name,
+            model_name=self.model_name,
+        )
+        return [
+            self._build_scored_headline(headline, result)
+            for headline, result in zip(headlines, results)
+            if result is not None
+        ]
 
     @staticmethod
-    def _normalize_text(text: str) -> str:
-        return re.sub(r"\s+", " ", text.casefold()).strip()
-
-    @staticmethod
-    def _weighted_term_score(text: str, terms: dict[str, float]) -> float:
-        score = 0.0
-        for term, weight in terms.items():
-            if " " in term:
-                if term in text:
-                    score += weight
-            else:
-                score += len(re.findall(rf"\b{re.escape(term)}\b", text)) * weight
-        return score
+    def scoring_text(headline: RawHeadline) -> str:
+        return f"{headline.headline}. {headline.summary or ''}"
 
     @staticmethod
     def _sigmoid(value: float) -> float:
@@ -164,31 +403,11 @@ class LexiconSentimentScorer:
 
     @staticmethod
     def _calculate_age_hours(published_at_utc: datetime) -> float:
-        now = datetime.now(timezone.utc)
-        delta = now - published_at_utc
-        return round(delta.total_seconds() / 3600, 2)
+        return calculate_age_hours(published_at_utc)
 
     def _build_scored_headline(
         self,
         headline: RawHeadline,
         result: SentimentResult,
     ) -> ScoredHeadline:
-        return ScoredHeadline(
-            ticker=headline.ticker,
-            headline=headline.headline,
-            source=headline.source,
-            url=headline.url,
-            published_at_utc=headline.published_at_utc,
-            summary=headline.summary,
-            sentiment_label=result.label,
-            positive_score=result.positive_score,
-            neutral_score=result.neutral_score,
-            negative_score=result.negative_score,
-            compound_score=result.compound_score,
-            confidence=result.confidence,
-            headline_age_hours=self._calculate_age_hours(headline.published_at_utc),
-            source_tier=classify_source(headline.source),
-            category=headline.category,
-            topic=headline.topic,
-            industry=headline.industry,
-        )
+        return build_scored_headline(headline, result)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+from typing import Callable, Sequence
+
+from models.sentiment_result import SentimentResult
+
+
+logger = logging.getLogger(__name__)
+
+SQLITE_MAX_PARAMETERS = 900
+
+
+@dataclass(slots=True)
+class ScoreCacheStats:
+    lookups: int = 0
+    hits: int = 0
+    stored: int = 0
+    evicted: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return round(self.hits / self.lookups, 4) if self.lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "stored": self.stored,
+            "evicted": self.evicted,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+def normalized_text_hash(text: str) -> str:
+    normalized = re.sub(r"\s+", " ", text).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class SentimentScoreCache:
+    """
+    Persistent (backend, model, normalized text hash) -> SentimentResult store.
+
+    Backed by a local SQLite file so identical headlines scored by earlier
+    runs cost a lookup instead of inference. Each hit refreshes the entry's
+    use counter and the least recently used entries are evicted once the
+    table exceeds `max_entries`.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 200_000) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.stats = ScoreCacheStats()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sentiment_scores (
+                cache_key TEXT PRIMARY KEY,
+                label TEXT NOT NULL,
+                positive_score REAL NOT NULL,
+                neutral_score REAL NOT NULL,
+                negative_score REAL NOT NULL,
+                compound_score REAL NOT NULL,
+                confidence REAL NOT NULL,
+                last_used INTEGER NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_sentiment_scores_last_used "
+            "ON sentiment_scores (last_used)"
+        )
+        self._connection.commit()
+        self._clock = int(
+            self._connection.execute(
+                "SELECT COALESCE(MAX(last_used), 0) FROM sentiment_scores"
+            ).fetchone()[0]
+        )
+
+    @staticmethod
+    def cache_key(backend: str, model_name: str, text: str) -> str:
+        return f"{backend}|{model_name}|{normalized_text_hash(text)}"
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, SentimentResult]:
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, SentimentResult] = {}
+
+        with self._lock:
+            for start in range(0, len(unique_keys), SQLITE_MAX_PARAMETERS):
+                chunk = unique_keys[start : start + SQLITE_MAX_PARAMETERS]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._connection.execute(
+                    "SELECT cache_key, label, positive_score, neutral_score, "
+                    "negative_score, compound_score, confidence "
+                    f"FROM sentiment_scores WHERE cache_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for cache_key, *values in rows:
+                    found[cache_key] = SentimentResult(*values)
+
+            if found:
+                self._clock += 1
+                self._connection.executemany(
+                    "UPDATE sentiment_scores SET last_used = ? WHERE cache_key = ?",
+                    [(self._clock, cache_key) for cache_key in found],
+                )
+                self._connection.commit()
+
+            self.stats.lookups += len(keys)
+            self.stats.hits += sum(1 for key in keys if key in found)
+
+        return found
+
+    def put_many(self, results: dict[str, SentimentResult]) -> None:
+        if not results:
+            return
+
+        with self._lock:
+            self._clock += 1
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO sentiment_scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        cache_key,
+                        result.label,
+                        result.positive_score,
+                        result.neutral_score,
+                        result.negative_score,
+                        result.compound_score,
+                        result.confidence,
+                        self._clock,
+                    )
+                    for cache_key, result in results.items()
+                ],
+            )
+            self.stats.stored += len(results)
+            self._evict_least_recently_used()
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _evict_least_recently_used(self) -> None:
+        entry_count = self._connection.execute(
+            "SELECT COUNT(*) FROM sentiment_scores"
+        ).fetchone()[0]
+        overflow = entry_count - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._connection.execute(
+            "DELETE FROM sentiment_scores WHERE cache_key IN ("
+            "SELECT cache_key FROM sentiment_scores ORDER BY last_used LIMIT ?)",
+            (overflow,),
+        )
+        self.stats.evicted += overflow
+
+
+def score_texts_with_cache(
+    texts: Sequence[str],
+    score_texts: Callable[[list[str]], list[SentimentResult | None]],
+    cache: SentimentScoreCache | None,
+    backend: str,
+    model_name: str,
+) -> list[SentimentResult | None]:
+    """Serve cached results and send only the misses to `score_texts`."""
+    if cache is None:
+        return score_texts(list(texts))
+
+    keys = [cache.cache_key(backend, model_name, text) for text in texts]
+    try:
+        cached = cache.get_many(keys)
+    except sqlite3.Error as error:
+        logger.warning("Sentiment score cache unavailable, scoring everything: %s", error)
+        return score_texts(list(texts))
+
+    miss_positions = [position for position, key in enumerate(keys) if key not in cached]
+    results: list[SentimentResult | None] = [cached.get(key) for key in keys]
+    if not miss_positions:
+        return results
+
+    miss_results = score_texts([texts[position] for position in miss_positions])
+    fresh: dict[str, SentimentResult] = {}
+    for position, result in zip(miss_positions, miss_results):
+        results[position] = result
+        if result is not None:
+            fresh[keys[position]] = result
+
+    try:
+        cache.put_many(fresh)
+    except sqlite3.Error as error:
+        logger.warning("Could not store sentiment scores in cache: %s", error)
+    return results
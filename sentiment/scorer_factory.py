@@ -1,38 +1,110 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 
 from config import settings
 from sentiment.lexicon_scorer import LexiconSentimentScorer
+from sentiment.score_cache import SentimentScoreCache
 
 
 logger = logging.getLogger(__name__)
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-def build_sentiment_scorer(backend: str | None = None):
-    selected_backend = (backend or settings.sentiment_backend).lower()
 
-    if selected_backend == "finbert":
+def build_score_cache() -> SentimentScoreCache | None:
+    if not settings.sentiment_cache_path:
+        return None
+
+    try:
+        return SentimentScoreCache(
+            PROJECT_ROOT / settings.sentiment_cache_path,
+            max_entries=settings.sentiment_cache_max_entries,
+        )
+    except Exception as error:
+        logger.warning("Sentiment score cache disabled: %s", error)
+        return None
+
+
+def build_scorer_pool(
+    backend: str,
+    processes: int,
+    score_cache: SentimentScoreCache | None = None,
+):
+    from sentiment.scorer_pool import SentimentScorerPool
+
+    return SentimentScorerPool(
+        backend=backend,
+        model_name=settings.finbert_model_name,
+        processes=processes,
+        chunk_size=settings.sentiment_worker_chunk_size,
+        score_cache=score_cache,
+        start_method=settings.sentiment_worker_start_method or None,
+    )
+
+
+def build_transformer_scorer(
+    backend: str,
+    score_cache: SentimentScoreCache | None = None,
+):
+    if settings.sentiment_workers > 1:
+        return build_scorer_pool(backend, settings.sentiment_workers, score_cache)
+
+    if backend == "finbert":
         from sentiment.finbert_scorer import FinBERTScorer
 
-        return FinBERTScorer(model_name=settings.finbert_model_name)
+        return FinBERTScorer(
+            model_name=settings.finbert_model_name,
+            score_cache=score_cache,
+        )
+
+    if backend == "finbert_onnx":
+        from sentiment.finbert_onnx import FinBERTOnnxScorer
+
+        return FinBERTOnnxScorer(
+            model_name=settings.finbert_model_name,
+            score_cache=score_cache,
+        )
+
+    raise ValueError(
+        f"Unsupported transformer backend {backend!r}; expected finbert or finbert_onnx."
+    )
+
+
+def build_sentiment_scorer(backend: str | None = None):
+    selected_backend = (backend or settings.sentiment_backend).lower()
+    score_cache = build_score_cache()
+
+    if selected_backend in {"finbert", "finbert_onnx"}:
+        return build_transformer_scorer(selected_backend, score_cache)
 
     if selected_backend == "lexicon":
-        return LexiconSentimentScorer()
+        return LexiconSentimentScorer(score_cache=score_cache)
+
+    if selected_backend == "cascade":
+        from sentiment.cascade_scorer import CascadeSentimentScorer
+
+        return CascadeSentimentScorer(
+            finbert_factory=lambda: build_transformer_scorer(
+                settings.sentiment_cascade_backend,
+                score_cache,
+            ),
+            confidence_threshold=settings.sentiment_cascade_confidence_threshold,
+            score_cache=score_cache,
+        )
 
     if selected_backend == "auto":
         try:
-            from sentiment.finbert_scorer import FinBERTScorer
-
-            return FinBERTScorer(model_name=settings.finbert_model_name)
+            return build_transformer_scorer("finbert", score_cache)
         except Exception as error:
             logger.warning(
                 "FinBERT unavailable, falling back to lexicon scorer: %s",
                 error,
             )
-            return LexiconSentimentScorer()
+            return LexiconSentimentScorer(score_cache=score_cache)
 
     raise ValueError(
-        "Unsupported SENTIMENT_BACKEND. Expected lexicon, finbert, or auto; "
-        f"got {selected_backend!r}."
+        "Unsupported SENTIMENT_BACKEND. Expected lexicon, finbert, finbert_onnx, "
+        f"cascade or auto; got {selected_backend!r}."
     )
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+import logging
+import multiprocessing
+import os
+from typing import Any
+
+from models.raw_headline import RawHeadline
+from models.scored_headline import ScoredHeadline
+from config import settings
+from models.sentiment_result import SentimentResult
+from sentiment.headline_scoring import build_scored_headline
+from sentiment.score_cache import SentimentScoreCache, score_texts_with_cache
+from sentiment.summary_chunking import build_summary_chunker, score_headlines_with_summaries
+from sentiment.token_batching import TokenBatchStats
+
+
+logger = logging.getLogger(__name__)
+
+POOL_BACKENDS = ("finbert", "finbert_onnx")
+
+# One scorer per worker process. With the fork start method the parent builds
+# it before the workers exist, so every worker inherits the loaded weights and
+# tokenizer as copy-on-write pages instead of reading the model again. Other
+# start methods load it once per worker in `_initialize_worker`.
+_worker_scorer: Any | None = None
+_worker_key: tuple[str, str] | None = None
+
+
+def _build_worker_scorer(backend: str, model_name: str) -> Any:
+    if backend == "finbert":
+        from sentiment.finbert_scorer import FinBERTScorer
+
+        return FinBERTScorer(model_name=model_name, device=-1)
+
+    if backend == "finbert_onnx":
+        from sentiment.finbert_onnx import FinBERTOnnxScorer
+
+        return FinBERTOnnxScorer(model_name=model_name)
+
+    raise ValueError(
+        f"Unsupported scorer pool backend {backend!r}; expected one of {POOL_BACKENDS}."
+    )
+
+
+def _load_worker_scorer(backend: str, model_name: str) -> Any:
+    global _worker_scorer, _worker_key
+
+    if _worker_scorer is None or _worker_key != (backend, model_name):
+        _worker_scorer = _build_worker_scorer(backend, model_name)
+        _worker_key = (backend, model_name)
+    return _worker_scorer
+
+
+def _limit_worker_threads(threads: int) -> None:
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except Exception:
+        pass
+
+
+def _initialize_worker(backend: str, model_name: str, threads: int) -> None:
+    _limit_worker_threads(threads)
+    _load_worker_scorer(backend, model_name)
+
+
+def _worker_identity(backend: str, model_name: str) -> tuple[str, str]:
+    """Cache-key identity of the worker scorer, e.g. finbert_onnx_int8."""
+    scorer = _load_worker_scorer(backend, model_name)
+    return scorer.backend_name, scorer.model_name
+
+
+def _score_chunk_in_worker(
+    backend: str,
+    model_name: str,
+    texts: list[str],
+) -> tuple[list[SentimentResult | None], TokenBatchStats | None]:
+    scorer = _load_worker_scorer(backend, model_name)
+    if hasattr(scorer, "batch_stats"):
+        scorer.batch_stats = TokenBatchStats()
+    results = scorer.score_texts(texts)
+    return results, getattr(scorer, "batch_stats", None)
+
+
+def default_start_method() -> str:
+    """
+    Forkserver where available, otherwise spawn; never fork by default.
+
+    Forking shares the parent's loaded model copy-on-write, but by the time a
+    pipeline builds the pool it has usually loaded torch and started threads
+    (feed prefetch, Finnhub refresh, scorer warm-up). A child forked while one
+    of those threads holds a lock can deadlock. Forkserver and spawn start
+    workers from a clean process and pay one model load per worker instead;
+    pass `start_method="fork"` only when the pool is built before any threads.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+class SentimentScorerPool:
+    """
+    Spread sentiment inference over worker processes behind the scorer API.
+
+    Each worker holds one scorer for its lifetime. Texts are cut into chunks
+    and queued on a process pool, so an idle worker always takes the next
+    chunk; results are reassembled in the caller's order. The score cache
+    and `ScoredHeadline` assembly stay in the parent, so `score_batch` keeps
+    the single-process contract and cached texts never leave the process.
+    """
+
+    def __init__(
+        self,
+        backend: str = "finbert",
+        model_name: str = "ProsusAI/finbert",
+        processes: int | None = None,
+        chunk_size: int = 256,
+        score_cache: SentimentScoreCache | None = None,
+        start_method: str | None = None,
+        score_summaries: bool | None = None,
+    ) -> None:
+        if backend not in POOL_BACKENDS:
+            raise ValueError(
+                f"Unsupported scorer pool backend {backend!r}; expected one of {POOL_BACKENDS}."
+            )
+
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.score_cache = score_cache
+        self.start_method = start_method or default_start_method()
+        self.batch_stats = TokenBatchStats()
+        self.score_summaries = (
+            settings.finbert_score_summaries if score_summaries is None else score_summaries
+        )
+        self._backend = backend
+        self._worker_model_name = model_name
+
+        parent_scorer = None
+        if self.start_method == "fork":
+            # Load once in the parent; forked workers inherit it copy-on-write.
+            parent_scorer = _load_worker_scorer(backend, model_name)
+        # Summaries are chunked in the parent, with the real tokenizer when the
+        # model is loaded here and by estimate otherwise.
+        self.summary_chunker = (
+            getattr(parent_scorer, "summary_chunker", None) or build_summary_chunker()
+        )
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_initialize_worker,
+            initargs=(
+                backend,
+                model_name,
+                max(1, (os.cpu_count() or 1) // self.processes),
+            ),
+        )
+        self.backend_name, self.model_name = self._executor.submit(
+            _worker_identity,
+            backend,
+            model_name,
+        ).result()
+        logger.info(
+            "Started %s %s scorer worker(s) with the %s start method.",
+            self.processes,
+            backend,
+            self.start_method,
+        )
+
+    def score_texts(self, texts: list[str]) -> list[SentimentResult | None]:
+        if not texts:
+            return []
+
+        chunks = [
+            texts[start : start + self.chunk_size]
+            for start in range(0, len(texts), self.chunk_size)
+        ]
+        futures = [
+            self._executor.submit(
+                _score_chunk_in_worker,
+                self._backend,
+                self._worker_model_name,
+                chunk,
+            )
+            for chunk in chunks
+        ]
+
+        results: list[SentimentResult | None] = []
+        for future in futures:
+            chunk_results, chunk_stats = future.result()
+            results.extend(chunk_results)
+            if chunk_stats is not None:
+                self._merge_batch_stats(chunk_stats)
+        return results
+
+    def score_batch(self, headlines: list[RawHeadline]) -> list[ScoredHeadline]:
+        if self.score_summaries:
+            return score_headlines_with_summaries(
+                headlines,
+                self.score_texts,
+                self.summary_chunker,
+                self.score_cache,
+                backend=self.backend_name,
+                model_name=self.model_name,
+            )
+
+        scorable: list[RawHeadline] = []
+        for headline in headlines:
+            if headline.headline and headline.headline.strip():
+                scorable.append(headline)
+            else:
+                logger.warning(
+                    "Skipping headline for %s: Text for sentiment scoring cannot be empty.",
+                    headline.ticker,
+                )
+
+        results = score_texts_with_cache(
+            [headline.headline for headline in scorable],
+            self.score_texts,
+            self.score_cache,
+            backend=self.backend_name,
+            model_name=self.model_name,
+        )
+        return [
+            build_scored_headline(headline, result)
+            for headline, result in zip(scorable, results)
+            if result is not None
+        ]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> SentimentScorerPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _merge_batch_stats(self, chunk_stats: TokenBatchStats) -> None:
+        for field in fields(TokenBatchStats):
+            setattr(
+                self.batch_stats,
+                field.name,
+                getattr(self.batch_stats, field.name) + getattr(chunk_stats, field.name),
+            )
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from config import settings
+from models.raw_headline import RawHeadline
+from models.scored_headline import ScoredHeadline
+from sentiment.scorer_factory import build_sentiment_scorer
+
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXTS = [
+    "Shares rise after earnings beat expectations",
+    "Regulators open an investigation into the company's accounting practices "
+    "after a whistleblower complaint",
+    "Company maintains full-year guidance",
+    "Stock falls as supply chain disruptions weigh on quarterly margins and "
+    "management withdraws its outlook for the rest of the fiscal year",
+]
+
+
+@dataclass(slots=True)
+class ScorerLoadStats:
+    loads: int = 0
+    load_seconds: float = 0.0
+    warmups: int = 0
+    warmup_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+
+class LazySentimentScorer:
+    """
+    Build a sentiment scorer on first use and keep it for the process lifetime.
+
+    `warm_up_in_background` loads the model and runs a dummy batch on a
+    daemon thread, so the load overlaps ingestion. Scoring waits on the same
+    lock and so never sees a half-built scorer; `stats.wait_seconds` is the
+    startup latency a run actually paid.
+    """
+
+    def __init__(self, build: Callable[[], Any], name: str = "sentiment") -> None:
+        self.name = name
+        self.stats = ScorerLoadStats()
+        self._build = build
+        self._scorer: Any | None = None
+        self._warmed_up = False
+        self._lock = threading.Lock()
+        self._warmup_thread: threading.Thread | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._scorer is not None
+
+    @property
+    def score_cache(self) -> Any | None:
+        return getattr(self._scorer, "score_cache", None)
+
+    @property
+    def batch_stats(self) -> Any | None:
+        return getattr(self._scorer, "batch_stats", None)
+
+    @property
+    def cascade_stats(self) -> Any | None:
+        return getattr(self._scorer, "cascade_stats", None)
+
+    def get(self) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self.stats.wait_seconds += time.perf_counter() - started
+            return self._load_locked()
+
+    def warm_up(self) -> None:
+        with self._lock:
+            scorer = self._load_locked()
+            if self._warmed_up or not hasattr(scorer, "score_texts"):
+                return
+
+            # The dummy batch must not show up in the run's batching, cascade or
+            # cache stats, nor be written to the persistent score cache.
+            run_stats = {
+                name: getattr(scorer, name)
+                for name in ("batch_stats", "cascade_stats")
+                if getattr(scorer, name, None) is not None
+            }
+            for name, stats in run_stats.items():
+                setattr(scorer, name, type(stats)())
+            score_cache = getattr(scorer, "score_cache", None)
+            if score_cache is not None:
+                scorer.score_cache = None
+            started = time.perf_counter()
+            try:
+                scorer.score_texts(list(WARMUP_TEXTS))
+            except Exception as error:
+                logger.warning("Sentiment scorer warm-up failed: %s", error)
+                return
+            finally:
+                for name, stats in run_stats.items():
+                    setattr(scorer, name, stats)
+                if score_cache is not None:
+                    scorer.score_cache = score_cache
+
+            self._warmed_up = True
+            self.stats.warmups += 1
+            self.stats.warmup_seconds += time.perf_counter() - started
+
+    def warm_up_in_background(self) -> threading.Thread | None:
+        if self._warmed_up:
+            return None
+        if self._warmup_thread is not None and self._warmup_thread.is_alive():
+            return self._warmup_thread
+
+        self._warmup_thread = threading.Thread(
+            target=self._warm_up_quietly,
+            name=f"{self.name}-scorer-warmup",
+            daemon=True,
+        )
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def score_batch(self, headlines: list[RawHeadline]) -> list[ScoredHeadline]:
+        return self.get().score_batch(headlines)
+
+    def reset_run_stats(self) -> None:
+        """Start per-run counters; the loaded model itself is kept."""
+        with self._lock:
+            self.stats = ScorerLoadStats()
+            if self._scorer is not None:
+                self._reset_batch_stats(self._scorer)
+                if getattr(self._scorer, "cascade_stats", None) is not None:
+                    self._scorer.cascade_stats = type(self._scorer.cascade_stats)()
+                score_cache = getattr(self._scorer, "score_cache", None)
+                if score_cache is not None:
+                    score_cache.stats = type(score_cache.stats)()
+
+    def close(self) -> None:
+        with self._lock:
+            scorer, self._scorer = self._scorer, None
+            self._warmed_up = False
+        if scorer is not None and hasattr(scorer, "close"):
+            scorer.close()
+
+    def _load_locked(self) -> Any:
+        if self._scorer is None:
+            started = time.perf_counter()
+            self._scorer = self._build()
+            self.stats.loads += 1
+            self.stats.load_seconds += time.perf_counter() - started
+            logger.info(
+                "Loaded %s scorer in %.2fs.",
+                self.name,
+                time.perf_counter() - started,
+            )
+        return self._scorer
+
+    def _warm_up_quietly(self) -> None:
+        try:
+            self.warm_up()
+        except Exception as error:
+            logger.warning("Could not load %s scorer in the background: %s", self.name, error)
+
+    @staticmethod
+    def _reset_batch_stats(scorer: Any) -> None:
+        batch_stats = getattr(scorer, "batch_stats", None)
+        if batch_stats is not None:
+            scorer.batch_stats = type(batch_stats)()
+
+
+_scorers: dict[str, LazySentimentScorer] = {}
+_scorers_lock = threading.Lock()
+
+
+def get_sentiment_scorer(backend: str | None = None) -> LazySentimentScorer:
+    """Process-wide lazy scorer for `backend`, shared across pipeline runs."""
+    selected_backend = (backend or settings.sentiment_backend).lower()
+    with _scorers_lock:
+        scorer = _scorers.get(selected_backend)
+        if scorer is None:
+            scorer = LazySentimentScorer(
+                lambda: build_sentiment_scorer(selected_backend),
+                name=selected_backend,
+            )
+            _scorers[selected_backend] = scorer
+        return scorer
+
+
+def close_sentiment_scorers() -> None:
+    with _scorers_lock:
+        scorers = list(_scorers.values())
+        _scorers.clear()
+    for scorer in scorers:
+        scorer.close()
@@ -1,5 +1,19 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+import time
+
+from config import settings
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 TIER1_SOURCES = {
     "reuters",
@@ -30,10 +44,131 @@ TIER2_SOURCES = {
 }
 
 
+def _compile_sources(sources: set[str]) -> re.Pattern[str] | None:
+    names = {source.strip().lower() for source in sources if source.strip()}
+    if not names:
+        return None
+    # Longest first so the alternation tries specific names before short ones.
+    ordered = sorted(names, key=lambda name: (-len(name), name))
+    return re.compile("|".join(re.escape(name) for name in ordered))
+
+
+class SourceClassifier:
+    """
+    Map a source string to its quality tier with compiled, memoized lookups.
+
+    Each tier is one regex alternation searched as a substring, matching the
+    original `any(name in source)` rules, and tier 1 wins over tier 2. Only a
+    few hundred distinct sources exist, so results are memoized per raw
+    source string and most headlines cost a single dict lookup.
+
+    With `path`, tiers come from a JSON file shaped like
+    `{"tier1": [...], "tier2": [...]}`. The file's modification time is
+    checked at most every `reload_seconds`; a changed file is reloaded and
+    the memo cleared, so new outlets need no code change or restart. A
+    missing or invalid file keeps the tiers already loaded.
+    """
+
+    def __init__(
+        self,
+        tier1_sources: set[str] | None = None,
+        tier2_sources: set[str] | None = None,
+        path: str | Path | None = None,
+        reload_seconds: float = 60.0,
+        memo_size: int = 4096,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._loaded_mtime: float | None = None
+        self._next_check = 0.0
+        self._tier_for_source = lru_cache(maxsize=memo_size)(self._classify_uncached)
+        self._set_tiers(
+            TIER1_SOURCES if tier1_sources is None else tier1_sources,
+            TIER2_SOURCES if tier2_sources is None else tier2_sources,
+        )
+        if self.path is not None:
+            self.reload_if_changed(force=True)
+
+    def classify(self, source: str) -> int:
+        if self.path is not None and time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self._tier_for_source(source or "")
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """Reload tiers if the config file changed; returns True on reload."""
+        if self.path is None:
+            return False
+
+        with self._lock:
+            self._next_check = time.monotonic() + self.reload_seconds
+            try:
+                mtime = self.path.stat().st_mtime
+            except OSError:
+                return False
+            if not force and mtime == self._loaded_mtime:
+                return False
+
+            try:
+                payload = json.loads(self.path.read_text())
+                tier1 = set(payload.get("tier1", []))
+                tier2 = set(payload.get("tier2", []))
+            except (OSError, ValueError, AttributeError, TypeError) as error:
+                logger.warning("Could not load source tiers from %s: %s", self.path, error)
+                return False
+
+            self._loaded_mtime = mtime
+            self._set_tiers(tier1, tier2)
+            logger.info(
+                "Loaded %s tier 1 and %s tier 2 sources from %s.",
+                len(tier1),
+                len(tier2),
+                self.path,
+            )
+            return True
+
+    def memo_info(self) -> dict[str, int]:
+        info = self._tier_for_source.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+    def _set_tiers(self, tier1_sources: set[str], tier2_sources: set[str]) -> None:
+        self.known_sources = frozenset(
+            source.strip().lower() for source in tier1_sources | tier2_sources if source.strip()
+        )
+        self._tier1_pattern = _compile_sources(tier1_sources)
+        self._tier2_pattern = _compile_sources(tier2_sources)
+        self._tier_for_source.cache_clear()
+
+    def _classify_uncached(self, source: str) -> int:
+        source_lower = source.strip().lower()
+        if self._tier1_pattern is not None and self._tier1_pattern.search(source_lower):
+            return 1
+        if self._tier2_pattern is not None and self._tier2_pattern.search(source_lower):
+            return 2
+        return 3
+
+
+_default_classifier: SourceClassifier | None = None
+_default_classifier_lock = threading.Lock()
+
+
+def get_source_classifier() -> SourceClassifier:
+    """Process-wide classifier shared by every sentiment backend."""
+    global _default_classifier
+
+    if _default_classifier is None:
+        with _default_classifier_lock:
+            if _default_classifier is None:
+                _default_classifier = SourceClassifier(
+                    path=(
+                        PROJECT_ROOT / settings.source_tiers_path
+                        if settings.source_tiers_path
+                        else None
+                    ),
+                    reload_seconds=settings.source_tiers_reload_seconds,
+                )
+    return _default_classifier
+
+
 def classify_source(source: str) -> int:
-    source_lower = source.strip().lower()
-    if any(known_source in source_lower for known_source in TIER1_SOURCES):
-        return 1
-    if any(known_source in source_lower for known_source in TIER2_SOURCES):
-        return 2
-    return 3
+    return get_source_classifier().classify(source)
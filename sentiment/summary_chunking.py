@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from config import settings
+from models.raw_headline import RawHeadline
+from models.scored_headline import ScoredHeadline
+from models.sentiment_result import SentimentResult
+from sentiment.headline_scoring import build_scored_headline
+from sentiment.score_cache import SentimentScoreCache, score_texts_with_cache
+
+
+logger = logging.getLogger(__name__)
+
+# Without a tokenizer, windows are cut on words at roughly 0.75 words per token.
+ESTIMATED_WORDS_PER_TOKEN = 0.75
+# FinBERT's position limit; each sequence also carries [CLS] and [SEP].
+MAX_SEQUENCE_TOKENS = 512
+
+
+def overlapping_windows(length: int, window: int, overlap: int) -> list[tuple[int, int]]:
+    """`(start, end)` spans of at most `window` items, each sharing `overlap` with the last."""
+    if length <= 0:
+        return []
+    window = max(1, window)
+    step = max(1, window - max(0, overlap))
+    spans: list[tuple[int, int]] = []
+    start = 0
+    while True:
+        end = min(length, start + window)
+        spans.append((start, end))
+        if end >= length:
+            return spans
+        start += step
+
+
+class SummaryChunker:
+    """
+    Split a headline and its summary into segments that each fit the model.
+
+    The headline is always the first segment. Summaries are cut into
+    overlapping token windows, so a sentence that straddles a boundary is
+    still seen whole by one chunk instead of being lost to truncation.
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = 256,
+        overlap_tokens: int = 64,
+        tokenizer: Any | None = None,
+    ) -> None:
+        self.chunk_tokens = max(1, chunk_tokens)
+        self.overlap_tokens = min(max(0, overlap_tokens), self.chunk_tokens - 1)
+        self.tokenizer = tokenizer
+
+    def segments(self, headline: RawHeadline) -> list[str]:
+        segments = [headline.headline]
+        summary = (headline.summary or "").strip()
+        if summary and summary != headline.headline.strip():
+            segments.extend(self.chunk_text(summary))
+        return segments
+
+    def chunk_text(self, text: str) -> list[str]:
+        if self.tokenizer is not None:
+            try:
+                return self._chunk_with_tokenizer(text)
+            except Exception as e:
+                logger.debug("Tokenizer chunking failed, splitting on words: %s", e)
+        return self._chunk_on_words(text)
+
+    def _chunk_with_tokenizer(self, text: str) -> list[str]:
+        input_ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+        chunks = [
+            self.tokenizer.decode(input_ids[start:end], skip_special_tokens=True).strip()
+            for start, end in overlapping_windows(
+                len(input_ids),
+                self.chunk_tokens,
+                self.overlap_tokens,
+            )
+        ]
+        return [chunk for chunk in chunks if chunk]
+
+    def _chunk_on_words(self, text: str) -> list[str]:
+        words = text.split()
+        return [
+            " ".join(words[start:end])
+            for start, end in overlapping_windows(
+                len(words),
+                max(1, int(self.chunk_tokens * ESTIMATED_WORDS_PER_TOKEN)),
+                int(self.overlap_tokens * ESTIMATED_WORDS_PER_TOKEN),
+            )
+        ]
+
+
+def build_summary_chunker(tokenizer: Any | None = None) -> SummaryChunker:
+    """
+    The configured chunker, capped so a chunk plus special tokens fits the model.
+
+    Shared by the single-process scorers and the scorer pool, so both cut
+    summaries into the same windows.
+    """
+    return SummaryChunker(
+        chunk_tokens=min(settings.finbert_summary_chunk_tokens, MAX_SEQUENCE_TOKENS - 2),
+        overlap_tokens=settings.finbert_summary_chunk_overlap,
+        tokenizer=tokenizer,
+    )
+
+
+def pool_segment_results(
+    segment_results: list[SentimentResult | None],
+    segment_weights: list[int],
+) -> SentimentResult | None:
+    """
+    Pool a headline result with its summary chunk results.
+
+    Chunk probabilities are averaged by chunk length, then the summary as a
+    whole counts as much as the headline, so a long summary refines the
+    headline's score without drowning it out. Without a usable headline
+    result the item is skipped, as in headline-only scoring.
+    """
+    headline_result = segment_results[0] if segment_results else None
+    if headline_result is None:
+        return None
+
+    chunks = [
+        (result, max(1, weight))
+        for result, weight in zip(segment_results[1:], segment_weights[1:])
+        if result is not None
+    ]
+    if not chunks:
+        return headline_result
+
+    total_weight = sum(weight for _, weight in chunks)
+    scores = {}
+    for label, attribute in (
+        ("positive", "positive_score"),
+        ("neutral", "neutral_score"),
+        ("negative", "negative_score"),
+    ):
+        summary_score = (
+            sum(getattr(result, attribute) * weight for result, weight in chunks) / total_weight
+        )
+        scores[label] = (getattr(headline_result, attribute) + summary_score) / 2
+
+    return SentimentResult(
+        label=max(scores, key=scores.get),
+        positive_score=scores["positive"],
+        neutral_score=scores["neutral"],
+        negative_score=scores["negative"],
+        compound_score=round(scores["positive"] - scores["negative"], 6),
+        confidence=round(max(scores.values()), 6),
+    )
+
+
+def score_headlines_with_summaries(
+    headlines: list[RawHeadline],
+    score_texts: Callable[[list[str]], list[SentimentResult | None]],
+    chunker: SummaryChunker,
+    score_cache: SentimentScoreCache | None,
+    backend: str,
+    model_name: str,
+) -> list[ScoredHeadline]:
+    """
+    Score headlines and summary chunks in one call, then pool per headline.
+
+    Every segment of every headline goes through `score_texts` together, so
+    the chunks share the length-sorted token batches with the headlines and
+    chunking adds rows to existing forward passes rather than new calls.
+    Segments are cached as ordinary texts.
+    """
+    segments: list[str] = []
+    spans: list[tuple[RawHeadline, int, int]] = []
+    for headline in headlines:
+        if not headline.headline or not headline.headline.strip():
+            logger.warning(
+                "Skipping headline for %s: Text for sentiment scoring cannot be empty.",
+                headline.ticker,
+            )
+            continue
+        headline_segments = chunker.segments(headline)
+        spans.append((headline, len(segments), len(segments) + len(headline_segments)))
+        segments.extend(headline_segments)
+
+    results = score_texts_with_cache(
+        segments,
+        score_texts,
+        score_cache,
+        backend=backend,
+        model_name=model_name,
+    )
+
+    scored: list[ScoredHeadline] = []
+    for headline, start, end in spans:
+        result = pool_segment_results(
+            results[start:end],
+            [len(segment) for segment in segments[start:end]],
+        )
+        if result is not None:
+            scored.append(build_scored_headline(headline, result))
+    return scored
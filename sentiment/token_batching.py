@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass(slots=True)
+class TokenBatchStats:
+    texts: int = 0
+    batches: int = 0
+    real_tokens: int = 0
+    padded_tokens: int = 0
+    seconds: float = 0.0
+    bisected_batches: int = 0
+    fallback_rows: int = 0
+    failed_rows: int = 0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.real_tokens / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def padding_waste_pct(self) -> float:
+        if not self.padded_tokens:
+            return 0.0
+        return round(100 * (self.padded_tokens - self.real_tokens) / self.padded_tokens, 2)
+
+    @property
+    def fallback_rate_pct(self) -> float:
+        """Share of texts scored outside their planned batch after a failure."""
+        if not self.texts:
+            return 0.0
+        return round(100 * self.fallback_rows / self.texts, 2)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "texts": self.texts,
+            "batches": self.batches,
+            "real_tokens": self.real_tokens,
+            "padded_tokens": self.padded_tokens,
+            "seconds": round(self.seconds, 4),
+            "tokens_per_second": round(self.tokens_per_second, 1),
+            "padding_waste_pct": self.padding_waste_pct,
+            "bisected_batches": self.bisected_batches,
+            "fallback_rows": self.fallback_rows,
+            "failed_rows": self.failed_rows,
+            "fallback_rate_pct": self.fallback_rate_pct,
+        }
+
+
+def plan_token_batches(
+    lengths: Sequence[int],
+    token_budget: int,
+    max_batch_size: int | None = None,
+) -> list[list[int]]:
+    """
+    Group text indices into batches whose padded size fits `token_budget`.
+
+    Indices are sorted by token length so each batch pads to a similar
+    length. A batch costs `rows * longest_row` tokens, which is what the
+    model computes after dynamic padding. A single text longer than the
+    budget still gets its own batch.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_longest = 0
+
+    for index in sorted(range(len(lengths)), key=lambda position: lengths[position]):
+        length = max(1, lengths[index])
+        longest = max(current_longest, length)
+        over_budget = current and longest * (len(current) + 1) > token_budget
+        over_rows = max_batch_size is not None and len(current) >= max_batch_size
+        if over_budget or over_rows:
+            batches.append(current)
+            current, longest = [], length
+        current.append(index)
+        current_longest = longest
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def padded_token_count(lengths: Sequence[int], batches: list[list[int]]) -> int:
+    return sum(
+        len(batch) * max(max(1, lengths[index]) for index in batch)
+        for batch in batches
+        if batch
+    )
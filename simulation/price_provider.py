@@ -11,6 +11,7 @@ import pandas as pd
 import requests
 
 from config import settings
+from ingestion.http_sessions import shared_http_session
 
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ class PolygonPriceProvider:
     ) -> None:
         self.api_key = api_key if api_key is not None else settings.polygon_api_key
         self.timeout_seconds = timeout_seconds
-        self._session = session or requests.Session()
+        self._session = session or shared_http_session()
         self._missing_key_logged = False
         self._service_unavailable = False
 
@@ -153,7 +154,7 @@ class AlphaVantagePriceProvider:
     ) -> None:
         self.api_key = api_key if api_key is not None else settings.alpha_vantage_api_key
         self.timeout_seconds = timeout_seconds
-        self._session = session or requests.Session()
+        self._session = session or shared_http_session()
         self._missing_key_logged = False
         self._service_unavailable = False
 
@@ -286,8 +287,13 @@ class CachedPriceProvider:
 class YahooChartPriceProvider:
     """Fetches daily equity closes from Yahoo's public chart endpoint."""
 
-    def __init__(self, timeout_seconds: int = 20) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int = 20,
+        session: requests.Session | None = None,
+    ) -> None:
         self.timeout_seconds = timeout_seconds
+        self._session = session or shared_http_session()
         self._service_unavailable = False
 
     def fetch_latest_close(
@@ -308,7 +314,7 @@ class YahooChartPriceProvider:
         )
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 timeout=self.timeout_seconds,
                 headers={"User-Agent": "Mozilla/5.0 Quicksilver/1.0"},
@@ -384,8 +390,13 @@ class YahooChartPriceProvider:
 class StooqPriceProvider:
     """Fetches daily US equity closes from Stooq without API credentials."""
 
-    def __init__(self, timeout_seconds: int = 20) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int = 20,
+        session: requests.Session | None = None,
+    ) -> None:
         self.timeout_seconds = timeout_seconds
+        self._session = session or shared_http_session()
         self._service_unavailable = False
         self._missing_data_logged = False
 
@@ -405,7 +416,7 @@ class StooqPriceProvider:
         )
 
         try:
-            response = requests.get(url, timeout=self.timeout_seconds)
+            response = self._session.get(url, timeout=self.timeout_seconds)
             response.raise_for_status()
         except requests.RequestException as error:
             if self._is_service_error(error):
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import fields
 from datetime import date, datetime, timedelta, timezone
 import json
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 import pandas as pd
 from sqlalchemy import (
@@ -18,11 +18,13 @@ from sqlalchemy import (
 from sqlalchemy.exc import IntegrityError
 
 from config import settings
+from models.headline_batch import HeadlineBatch
 from models.insight import Insight
 from models.raw_headline import RawHeadline
 from models.scored_headline import ScoredHeadline
 from storage.local_schema import define_local_tables
-from transformations.headline_normalizer import HeadlineNormalizer
+from transformations.headline_normalizer import HeadlineNormalizer, content_hash
+from transformations.normalize_headlines import HEADLINE_COLUMNS
 
 
 class LocalMySQLStorage:
@@ -52,25 +54,32 @@ class LocalMySQLStorage:
     def save_raw_headline(self, headline: RawHeadline) -> None:
         self.save_raw_headlines([headline])
 
-    def save_raw_headlines(self, headlines: list[RawHeadline]) -> None:
+    def save_raw_headlines(self, headlines: list[RawHeadline] | HeadlineBatch) -> None:
         if not headlines:
             return
 
-        rows = [
-            {
-                "ticker": headline.ticker,
-                "headline": headline.headline,
-                "source": headline.source,
-                "url": headline.url,
-                "published_at_utc": headline.published_at_utc,
-                "summary": headline.summary,
-                "category": headline.category,
-                "topic": headline.topic,
-                "industry": headline.industry,
-                "content_hash": self._raw_content_hash(headline),
-            }
-            for headline in headlines
-        ]
+        if isinstance(headlines, HeadlineBatch):
+            rows = self._batch_rows(
+                headlines,
+                (*HEADLINE_COLUMNS, "content_hash", "story_cluster_id"),
+            )
+        else:
+            rows = [
+                {
+                    "ticker": headline.ticker,
+                    "headline": headline.headline,
+                    "source": headline.source,
+                    "url": headline.url,
+                    "published_at_utc": headline.published_at_utc,
+                    "summary": headline.summary,
+                    "category": headline.category,
+                    "topic": headline.topic,
+                    "industry": headline.industry,
+                    "content_hash": self._raw_content_hash(headline),
+                    "story_cluster_id": headline.story_cluster_id,
+                }
+                for headline in headlines
+            ]
 
         with self.engine.begin() as connection:
             self._insert_ignore(
@@ -83,33 +92,38 @@ class LocalMySQLStorage:
     def save_scored_headline(self, headline: ScoredHeadline) -> None:
         self.save_scored_headlines([headline])
 
-    def save_scored_headlines(self, headlines: list[ScoredHeadline]) -> None:
+    def save_scored_headlines(self, headlines: list[ScoredHeadline] | HeadlineBatch) -> None:
         if not headlines:
             return
 
-        rows = [
-            {
-                "ticker": headline.ticker,
-                "headline": headline.headline,
-                "source": headline.source,
-                "url": headline.url,
-                "published_at_utc": headline.published_at_utc,
-                "sentiment_label": headline.sentiment_label,
-                "positive_score": headline.positive_score,
-                "neutral_score": headline.neutral_score,
-                "negative_score": headline.negative_score,
-                "compound_score": headline.compound_score,
-                "confidence": headline.confidence,
-                "headline_age_hours": headline.headline_age_hours,
-                "source_tier": headline.source_tier,
-                "summary": headline.summary,
-                "category": headline.category,
-                "topic": headline.topic,
-                "industry": headline.industry,
-                "content_hash": self._scored_content_hash(headline),
-            }
-            for headline in headlines
-        ]
+        if isinstance(headlines, HeadlineBatch):
+            rows = self._batch_rows(headlines, headlines.field_names)
+        else:
+            rows = [
+                {
+                    "ticker": headline.ticker,
+                    "headline": headline.headline,
+                    "source": headline.source,
+                    "url": headline.url,
+                    "published_at_utc": headline.published_at_utc,
+                    "sentiment_label": headline.sentiment_label,
+                    "positive_score": headline.positive_score,
+                    "neutral_score": headline.neutral_score,
+                    "negative_score": headline.negative_score,
+                    "compound_score": headline.compound_score,
+                    "confidence": headline.confidence,
+                    "headline_age_hours": headline.headline_age_hours,
+                    "source_tier": headline.source_tier,
+                    "summary": headline.summary,
+                    "category": headline.category,
+                    "topic": headline.topic,
+                    "industry": headline.industry,
+                    "content_hash": self._scored_content_hash(headline),
+                    "story_cluster_id": headline.story_cluster_id,
+                    "scoring_stage": headline.scoring_stage,
+                }
+                for headline in headlines
+            ]
 
         with self.engine.begin() as connection:
             self._insert_ignore(
@@ -664,24 +678,18 @@ class LocalMySQLStorage:
                 )
 
     def _raw_content_hash(self, headline: RawHeadline) -> str:
-        return self._normalizer.build_content_hash(headline)
+        return headline.content_hash or self._normalizer.build_content_hash(headline)
 
     def _scored_content_hash(self, headline: ScoredHeadline) -> str:
-        if headline.content_hash:
-            return headline.content_hash
-
-        raw_headline = RawHeadline(
-            ticker=headline.ticker,
-            headline=headline.headline,
-            source=headline.source,
-            url=headline.url,
-            published_at_utc=headline.published_at_utc,
-            summary=headline.summary,
-            category=headline.category,
-            topic=headline.topic,
-            industry=headline.industry,
-        )
-        return self._raw_content_hash(raw_headline)
+        return headline.content_hash or self._normalizer.build_content_hash(headline)
+
+    @staticmethod
+    def _batch_rows(batch: HeadlineBatch, columns: Sequence[str]) -> list[dict[str, Any]]:
+        rows = batch.to_records(columns)
+        for row in rows:
+            if not row["content_hash"]:
+                row["content_hash"] = content_hash(*(row[name] for name in HEADLINE_COLUMNS))
+        return rows
 
     def _insert_ignore(
         self,
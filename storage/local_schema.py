@@ -50,6 +50,7 @@ def define_local_tables(metadata: MetaData) -> LocalTables:
         Column("topic", String(128)),
         Column("industry", String(128)),
         Column("content_hash", String(64), nullable=False),
+        Column("story_cluster_id", String(64)),
         Column("inserted_at_utc", DateTime(timezone=True), server_default=func.now()),
         UniqueConstraint("content_hash", name="uq_raw_headlines_content_hash"),
         Index("ix_raw_headlines_ticker_published", "ticker", "published_at_utc"),
@@ -78,6 +79,8 @@ def define_local_tables(metadata: MetaData) -> LocalTables:
         Column("topic", String(128)),
         Column("industry", String(128)),
         Column("content_hash", String(64), nullable=False),
+        Column("story_cluster_id", String(64)),
+        Column("scoring_stage", String(32)),
         Column("inserted_at_utc", DateTime(timezone=True), server_default=func.now()),
         UniqueConstraint("content_hash", name="uq_scored_headlines_content_hash"),
         Index("ix_scored_headlines_ticker_published", "ticker", "published_at_utc"),
@@ -166,24 +166,10 @@ class SnowflakeStorage:
             )
 
     def _raw_content_hash(self, headline: RawHeadline) -> str:
-        return self._normalizer.build_content_hash(headline)
+        return headline.content_hash or self._normalizer.build_content_hash(headline)
 
     def _scored_content_hash(self, headline: ScoredHeadline) -> str:
-        if headline.content_hash:
-            return headline.content_hash
-
-        raw_headline = RawHeadline(
-            ticker=headline.ticker,
-            headline=headline.headline,
-            source=headline.source,
-            url=headline.url,
-            published_at_utc=headline.published_at_utc,
-            summary=headline.summary,
-            category=headline.category,
-            topic=headline.topic,
-            industry=headline.industry,
-        )
-        return self._raw_content_hash(raw_headline)
+        return headline.content_hash or self._normalizer.build_content_hash(headline)
 
     def _temporary_stage_name(self, prefix: str) -> str:
         return self._quote_identifier(f"{prefix}_{uuid4().hex}")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+from ingestion.async_news_client import AsyncFinnhubClient, AsyncPublicNewsClient
+from ingestion.public_news_client import PublicNewsClient
+from tests.test_public_news_client import FakeSession
+
+
+class FakeAsyncResponse:
+    def __init__(self, content: bytes = b"", payload: object = None) -> None:
+        self.content = content
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> object:
+        return self._payload
+
+
+class FakeAsyncClient:
+    def __init__(self, content: bytes = b"", payload: object = None) -> None:
+        self.content = content
+        self.payload = payload
+        self.requests: list[tuple[str, dict | None]] = []
+
+    async def get(self, url: str, params: dict | None = None, timeout: float = 0):
+        self.requests.append((url, params))
+        await asyncio.sleep(0)
+        return FakeAsyncResponse(self.content, self.payload)
+
+
+def test_async_public_news_client_matches_thread_based_client():
+    published = format_datetime(datetime.now(timezone.utc))
+    xml = f"""
+    <rss><channel>
+      <item>
+        <title>Nvidia chips investment grows after export control relief</title>
+        <link>https://example.com/nvda</link>
+        <pubDate>{published}</pubDate>
+      </item>
+    </channel></rss>
+    """
+    tickers = ["NVDA", "AAPL"]
+    expected = PublicNewsClient(session=FakeSession(xml)).fetch_headlines(
+        tickers=tickers,
+        lookback_days=1,
+    )
+    client = FakeAsyncClient(content=xml.encode("utf-8"))
+
+    headlines = asyncio.run(
+        AsyncPublicNewsClient(client=client).fetch_headlines_async(
+            tickers=tickers,
+            lookback_days=1,
+        )
+    )
+
+    assert headlines == expected
+    requested_urls = [url for url, _ in client.requests]
+    assert len(requested_urls) == len(set(requested_urls))
+
+
+def test_async_finnhub_client_fetches_company_news_for_each_ticker():
+    payload = [
+        {
+            "headline": "Apple beats expectations",
+            "datetime": 1767225600,
+            "source": "Reuters",
+            "url": "https://example.com/aapl",
+        },
+        {"headline": "", "datetime": 1767225600},
+    ]
+    client = FakeAsyncClient(payload=payload)
+    finnhub = AsyncFinnhubClient(api_key="test-key", client=client, max_concurrency=2)
+
+    headlines = asyncio.run(
+        finnhub.fetch_batch_news(["AAPL", "MSFT"], "2026-01-01", "2026-01-02")
+    )
+
+    assert [headline.ticker for headline in headlines] == ["AAPL", "MSFT"]
+    assert {params["symbol"] for _, params in client.requests} == {"AAPL", "MSFT"}
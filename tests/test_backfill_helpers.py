@@ -1,11 +1,18 @@
 from datetime import date, datetime, timezone
 from types import SimpleNamespace
 
+from ingestion.backfill_checkpoints import BackfillCheckpointStore
+from ingestion.finnhub_client import FinnhubClient, FinnhubRateLimitError
+from ingestion.rate_limiter import TokenBucket
+from models.raw_headline import RawHeadline
 from pipelines.backfill_historical_headlines import (
+    BackfillStats,
     build_parser,
     date_windows,
+    main,
     resolve_tickers,
     run_historical_recommendation_backtest,
+    schedule_backfill_windows,
 )
 from models.scored_headline import ScoredHeadline
 from simulation.price_provider import PriceQuote
@@ -28,6 +35,156 @@ def test_date_windows_chunks_inclusive_ranges():
     ]
 
 
+class FakeFinnhubClient:
+    def __init__(self, counts: dict[tuple[str, str, str], int], rate_limited_once=()):
+        self.counts = counts
+        self.rate_limited = set(rate_limited_once)
+        self.calls: list[tuple[str, str, str]] = []
+
+    def fetch_company_news(self, ticker: str, from_date: str, to_date: str):
+        key = (ticker, from_date, to_date)
+        self.calls.append(key)
+        if key in self.rate_limited:
+            self.rate_limited.discard(key)
+            raise FinnhubRateLimitError(retry_after_seconds=0.0)
+        return [
+            RawHeadline(
+                ticker=ticker,
+                headline=f"{ticker} {from_date} {index}",
+                source="Reuters",
+                url="",
+                published_at_utc=0,
+            )
+            for index in range(self.counts.get(key, 1))
+        ]
+
+
+def test_scheduler_splits_busy_windows_and_retries_rate_limits():
+    client = FakeFinnhubClient(
+        counts={("AAPL", "2026-01-01", "2026-01-04"): 5},
+        rate_limited_once=[("MSFT", "2026-01-01", "2026-01-04")],
+    )
+    stats = BackfillStats()
+    rate_limiter = TokenBucket(rate_per_second=1000, capacity=1000)
+
+    results = list(
+        schedule_backfill_windows(
+            client=client,
+            tickers=["AAPL", "MSFT"],
+            windows=[(date(2026, 1, 1), date(2026, 1, 4))],
+            retry_attempts=2,
+            retry_sleep_seconds=0.0,
+            split_threshold=5,
+            stats=stats,
+            rate_limiter=rate_limiter,
+            max_workers=4,
+        )
+    )
+
+    assert sorted((ticker, start, end) for ticker, start, end, _ in results) == [
+        ("AAPL", date(2026, 1, 1), date(2026, 1, 2)),
+        ("AAPL", date(2026, 1, 3), date(2026, 1, 4)),
+        ("MSFT", date(2026, 1, 1), date(2026, 1, 4)),
+    ]
+    assert stats.requests_attempted == 4
+    assert stats.failed_requests == 0
+    assert stats.rate_limited_responses == 1
+    assert stats.requests_per_second > 0
+
+
+def test_scheduler_stops_queueing_windows_at_max_requests():
+    client = FakeFinnhubClient(counts={})
+    stats = BackfillStats()
+
+    results = list(
+        schedule_backfill_windows(
+            client=client,
+            tickers=["AAPL", "MSFT", "NVDA"],
+            windows=list(date_windows(date(2026, 1, 1), date(2026, 1, 14), 7)),
+            retry_attempts=1,
+            retry_sleep_seconds=0.0,
+            split_threshold=0,
+            stats=stats,
+            max_workers=2,
+            max_requests=3,
+        )
+    )
+
+    assert len(results) == 3
+    assert len(client.calls) == 3
+
+
+def test_resume_skips_windows_covered_by_checkpoints_including_splits(tmp_path):
+    path = tmp_path / "checkpoints.jsonl"
+    first_run = BackfillCheckpointStore(path)
+    first_run.mark_complete("AAPL", date(2026, 1, 1), date(2026, 1, 2), 3)
+    first_run.mark_complete("AAPL", date(2026, 1, 3), date(2026, 1, 4), 2)
+    first_run.mark_complete("MSFT", date(2026, 1, 1), date(2026, 1, 2), 1)
+    with path.open("a") as checkpoint_file:
+        checkpoint_file.write('{"ticker": "MSFT", "window_st')
+
+    client = FakeFinnhubClient(counts={("MSFT", "2026-01-01", "2026-01-04"): 5})
+    stats = BackfillStats()
+    results = list(
+        schedule_backfill_windows(
+            client=client,
+            tickers=["AAPL", "MSFT"],
+            windows=[(date(2026, 1, 1), date(2026, 1, 4))],
+            retry_attempts=1,
+            retry_sleep_seconds=0.0,
+            split_threshold=5,
+            stats=stats,
+            checkpoints=BackfillCheckpointStore(path, resume=True),
+        )
+    )
+
+    assert client.calls == [
+        ("MSFT", "2026-01-01", "2026-01-04"),
+        ("MSFT", "2026-01-03", "2026-01-04"),
+    ]
+    assert [(ticker, start, end) for ticker, start, end, _ in results] == [
+        ("MSFT", date(2026, 1, 3), date(2026, 1, 4)),
+    ]
+    assert stats.windows_resumed == 2
+    first_run.mark_complete("MSFT", date(2026, 1, 3), date(2026, 1, 4), 5)
+    assert BackfillCheckpointStore(path).is_complete("MSFT", date(2026, 1, 1), date(2026, 1, 4))
+
+
+def test_checkpoints_start_fresh_without_resume(tmp_path):
+    path = tmp_path / "checkpoints.jsonl"
+    BackfillCheckpointStore(path).mark_complete("AAPL", date(2026, 1, 1), date(2026, 1, 7), 4)
+
+    store = BackfillCheckpointStore(path, resume=False)
+
+    assert not store.is_complete("AAPL", date(2026, 1, 1), date(2026, 1, 7))
+    assert not path.exists()
+
+
+def test_plan_only_runs_with_an_existing_checkpoint_file(tmp_path, monkeypatch):
+    path = tmp_path / "checkpoints.jsonl"
+    BackfillCheckpointStore(path).mark_complete("AAPL", date(2026, 1, 1), date(2026, 1, 7), 4)
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "backfill_historical_headlines.py",
+            "--plan-only",
+            "--tickers",
+            "AAPL",
+            "--checkpoint-path",
+            str(path),
+        ],
+    )
+
+    main()
+
+    assert path.exists()
+
+
+def test_retry_after_seconds_accepts_delta_seconds():
+    assert FinnhubClient.retry_after_seconds("12") == 12.0
+    assert FinnhubClient.retry_after_seconds(None) is None
+
+
 def test_resolve_tickers_uses_sp500_alias_watchlist():
     args = SimpleNamespace(
         large_cap_50=True,
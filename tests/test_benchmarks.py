@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+import os
+import time
+
+import pandas as pd
+
+import pytest
+
+from config.news_topics import classify_policy_impact
+from config.watchlist import get_default_watchlist
+from ingestion.policy_matcher import PolicyKeywordMatcher
+from ingestion.ticker_matcher import TickerMatcher
+from models.headline_batch import HeadlineBatch
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+from transformations.headline_normalizer import HeadlineNormalizer
+from transformations.normalize_headlines import normalize_headlines
+from tests.test_headline_batch import object_nbytes
+from tests.test_lexicon_scorer import legacy_score_text, sample_headlines
+from tests.test_normalize_headlines import legacy_normalize_and_hash, sample_raw_headlines
+from tests.test_policy_matcher import legacy_policy_topics, sample_policy_texts
+from tests.test_ticker_matcher import legacy_match_tickers, sample_texts
+
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_BENCHMARKS", "false").lower() != "true",
+    reason="Benchmarks are opt-in. Set RUN_BENCHMARKS=true.",
+)
+
+
+def best_of(runs: int, function) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_ticker_matcher_benchmark_against_legacy_rules():
+    tickers = get_default_watchlist()
+    texts = sample_texts(2_000)
+    matcher = TickerMatcher(tickers)
+
+    legacy_seconds = best_of(3, lambda: [legacy_match_tickers(text, tickers) for text in texts])
+    compiled_seconds = best_of(3, lambda: [matcher.match(text) for text in texts])
+
+    print(
+        f"ticker matching, {len(texts)} items x {len(tickers)} tickers: "
+        f"legacy={legacy_seconds:.3f}s compiled={compiled_seconds:.3f}s "
+        f"speedup={legacy_seconds / compiled_seconds:.1f}x"
+    )
+    assert compiled_seconds < legacy_seconds
+
+
+def test_policy_matcher_benchmark_against_legacy_scan():
+    texts = sample_policy_texts(2_000)
+    matcher = PolicyKeywordMatcher()
+
+    legacy_seconds = best_of(
+        3,
+        lambda: [
+            (legacy_policy_topics(text), classify_policy_impact(text))
+            for text in texts
+        ],
+    )
+    compiled_seconds = best_of(3, lambda: [matcher.scan(text) for text in texts])
+
+    print(
+        f"policy topic matching, {len(texts)} items: "
+        f"legacy={legacy_seconds:.3f}s compiled={compiled_seconds:.3f}s "
+        f"speedup={legacy_seconds / compiled_seconds:.1f}x"
+    )
+    assert compiled_seconds < legacy_seconds
+
+
+def test_lexicon_batch_scoring_benchmark_against_legacy_scorer():
+    texts = sample_headlines(100_000)
+    scorer = LexiconSentimentScorer()
+
+    legacy_seconds = best_of(1, lambda: [legacy_score_text(text) for text in texts])
+    batch_seconds = best_of(3, lambda: scorer.score_texts(texts))
+
+    print(
+        f"lexicon scoring, {len(texts)} headlines: "
+        f"legacy={legacy_seconds:.3f}s batch={batch_seconds:.3f}s "
+        f"speedup={legacy_seconds / batch_seconds:.1f}x"
+    )
+    assert legacy_seconds / batch_seconds >= 20
+
+
+def test_bulk_normalization_benchmark_on_one_million_headlines():
+    headlines = sample_raw_headlines(1_000_000)
+
+    def legacy_pipeline():
+        # Normalize per object, then hash again for raw and scored storage rows.
+        hashed = legacy_normalize_and_hash(headlines)
+        normalizer = HeadlineNormalizer()
+        return [normalizer.build_content_hash(headline) for headline, _ in hashed]
+
+    legacy_seconds = best_of(1, legacy_pipeline)
+    bulk_seconds = best_of(1, lambda: normalize_headlines(headlines))
+
+    print(
+        f"normalization, {len(headlines)} headlines: "
+        f"legacy={legacy_seconds:.3f}s bulk={bulk_seconds:.3f}s "
+        f"speedup={legacy_seconds / bulk_seconds:.1f}x"
+    )
+    assert bulk_seconds < legacy_seconds
+
+
+def test_headline_batch_benchmark_against_dataclass_lists():
+    raw = normalize_headlines(sample_raw_headlines(100_000))
+    scored = LexiconSentimentScorer().score_batch(raw)
+    batch = HeadlineBatch.from_headlines(scored)
+    columns = [name for name in batch.field_names if name != "scoring_stage"]
+
+    def dataclass_conversions():
+        rows = [
+            {name: getattr(headline, name) for name in columns}
+            for headline in scored
+        ]
+        return rows, pd.DataFrame([asdict(headline) for headline in scored])
+
+    legacy_seconds = best_of(3, dataclass_conversions)
+    batch_seconds = best_of(3, lambda: (batch.to_records(columns), batch.to_frame()))
+    legacy_bytes = object_nbytes(scored)
+
+    print(
+        f"headline batch, {len(scored)} scored headlines: "
+        f"bytes/headline {legacy_bytes / len(scored):.0f} -> {batch.nbytes / len(batch):.0f}, "
+        f"conversions legacy={legacy_seconds:.3f}s batch={batch_seconds:.3f}s "
+        f"speedup={legacy_seconds / batch_seconds:.1f}x"
+    )
+    assert batch.nbytes < 0.6 * legacy_bytes
+    assert batch_seconds < legacy_seconds
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+
+from models.raw_headline import RawHeadline
+from models.sentiment_result import SentimentResult
+from sentiment.cascade_scorer import CascadeSentimentScorer
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+from sentiment.score_cache import SentimentScoreCache
+from sentiment.scorer_registry import LazySentimentScorer
+
+
+class FakeFinBERT:
+    backend_name = "finbert"
+    model_name = "fake/finbert"
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.scored: list[list[str]] = []
+
+    def score_texts(self, texts):
+        if self.fail:
+            raise RuntimeError("model missing")
+        self.scored.append(list(texts))
+        return [
+            SentimentResult("negative", 0.05, 0.15, 0.8, -0.75, 0.8)
+            for _ in texts
+        ]
+
+
+def make_headline(text: str, summary: str | None = None) -> RawHeadline:
+    return RawHeadline(
+        ticker="AAPL",
+        headline=text,
+        source="Reuters",
+        url=f"https://example.com/{abs(hash(text))}",
+        published_at_utc=datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc),
+        summary=summary,
+    )
+
+
+def build_cascade(finbert: FakeFinBERT, **kwargs) -> tuple[CascadeSentimentScorer, list[int]]:
+    builds: list[int] = []
+
+    def factory():
+        builds.append(1)
+        return finbert
+
+    return CascadeSentimentScorer(finbert_factory=factory, **kwargs), builds
+
+
+def test_confident_headlines_stay_on_lexicon_without_loading_finbert():
+    cascade, builds = build_cascade(FakeFinBERT())
+
+    scored = cascade.score_batch([make_headline("Apple beats estimates and raises guidance")])
+
+    assert builds == []
+    assert [item.scoring_stage for item in scored] == ["lexicon"]
+    assert scored[0].sentiment_label == "positive"
+    assert cascade.cascade_stats.lexicon_accepted == 1
+
+
+def test_uncertain_and_conflicting_headlines_escalate_to_finbert():
+    finbert = FakeFinBERT()
+    cascade, builds = build_cascade(finbert, confidence_threshold=0.55)
+    headlines = [
+        make_headline("Apple beats estimates and raises guidance"),
+        make_headline("Apple holds annual shareholder meeting"),
+        make_headline("Apple wins approval despite antitrust probe"),
+    ]
+
+    scored = cascade.score_batch(headlines)
+
+    assert builds == [1]
+    assert finbert.scored == [
+        ["Apple holds annual shareholder meeting", "Apple wins approval despite antitrust probe"]
+    ]
+    assert [item.scoring_stage for item in scored] == ["lexicon", "finbert", "finbert"]
+    assert scored[1].sentiment_label == "negative"
+    assert cascade.cascade_stats.as_dict() == {
+        "headlines": 3,
+        "lexicon_accepted": 1,
+        "escalated": 2,
+        "conflicting": 1,
+        "escalation_failures": 0,
+        "escalation_rate_pct": 66.67,
+    }
+
+
+def test_finbert_failure_keeps_lexicon_scores():
+    cascade, _ = build_cascade(FakeFinBERT(fail=True))
+    headline = make_headline("Apple holds annual shareholder meeting")
+
+    scored = cascade.score_batch([headline])
+    expected = LexiconSentimentScorer().score_batch([headline])[0]
+
+    assert [item.scoring_stage for item in scored] == ["lexicon"]
+    assert scored[0].compound_score == expected.compound_score
+    assert cascade.cascade_stats.escalation_failures == 1
+
+
+def test_escalated_scores_are_cached_under_the_finbert_backend(tmp_path):
+    cache = SentimentScoreCache(tmp_path / "scores.sqlite")
+    finbert = FakeFinBERT()
+    cascade, _ = build_cascade(finbert, score_cache=cache)
+    headlines = [make_headline("Apple holds annual shareholder meeting")]
+
+    cascade.score_batch(headlines)
+    cascade.score_batch(headlines)
+
+    assert len(finbert.scored) == 1
+    assert cache.stats.hits == 1
+
+
+def test_failed_finbert_load_is_not_retried_every_batch():
+    def factory():
+        builds.append(1)
+        raise RuntimeError("torch is not installed")
+
+    builds: list[int] = []
+    cascade = CascadeSentimentScorer(finbert_factory=factory)
+    headline = make_headline("Apple holds annual shareholder meeting")
+
+    cascade.score_batch([headline])
+    scored = cascade.score_batch([headline])
+
+    assert builds == [1]
+    assert [item.scoring_stage for item in scored] == ["lexicon"]
+    assert cascade.cascade_stats.escalation_failures == 2
+
+
+def test_warm_up_leaves_cascade_and_cache_stats_and_cache_untouched(tmp_path):
+    cache = SentimentScoreCache(tmp_path / "scores.sqlite")
+    finbert = FakeFinBERT()
+    cascade, _ = build_cascade(finbert, score_cache=cache)
+    lazy = LazySentimentScorer(lambda: cascade)
+
+    lazy.warm_up()
+    cascade.score_batch([make_headline("Apple holds annual shareholder meeting")])
+
+    assert lazy.stats.warmups == 1
+    assert finbert.scored[0] != ["Apple holds annual shareholder meeting"]
+    assert cascade.cascade_stats.headlines == 1
+    assert cache.stats.hits == 0
+    assert cache.stats.stored == 1
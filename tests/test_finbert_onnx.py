@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from models.sentiment_result import SentimentResult
+from sentiment.finbert_onnx import OnnxFinBERTClassifier, compare_backends
+
+
+class FakeTokenizer:
+    def __call__(self, texts, **kwargs):
+        width = max(len(text.split()) for text in texts)
+        return {
+            "input_ids": np.ones((len(texts), width), dtype=np.int64),
+            "attention_mask": np.ones((len(texts), width), dtype=np.int64),
+            "token_type_ids": np.zeros((len(texts), width), dtype=np.int64),
+        }
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.feeds: list[dict[str, np.ndarray]] = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, feeds):
+        self.feeds.append(feeds)
+        rows = feeds["input_ids"].shape[0]
+        return [np.tile(np.array([[2.0, 0.0, 1.0]]), (rows, 1))]
+
+
+def test_onnx_classifier_returns_pipeline_shaped_scores():
+    session = FakeSession()
+    classifier = OnnxFinBERTClassifier(
+        session=session,
+        tokenizer=FakeTokenizer(),
+        id2label={0: "positive", 1: "negative", 2: "neutral"},
+    )
+
+    results = classifier(["Apple beats", "Chips rally on demand", "Fraud probe"], batch_size=2)
+
+    assert len(results) == 3
+    assert [item["label"] for item in results[0]] == ["positive", "negative", "neutral"]
+    assert sum(item["score"] for item in results[0]) == pytest.approx(1.0)
+    assert results[0][0]["score"] == pytest.approx(0.665241, abs=1e-6)
+    assert [feed["input_ids"].shape[0] for feed in session.feeds] == [2, 1]
+    assert set(session.feeds[0]) == {"input_ids", "attention_mask"}
+
+
+def make_result(label: str, compound: float) -> SentimentResult:
+    return SentimentResult(label, 0.5, 0.3, 0.2, compound, 0.5)
+
+
+def test_compare_backends_reports_agreement_and_drift():
+    reference = lambda texts: [make_result("positive", 0.5) for _ in texts]  # noqa: E731
+    candidate = lambda texts: [  # noqa: E731
+        make_result("positive" if index else "neutral", 0.45) for index, _ in enumerate(texts)
+    ]
+
+    comparison = compare_backends(reference, candidate, ["a", "b", "c", "d"], warmup_texts=0)
+
+    assert comparison.texts == 4
+    assert comparison.label_agreement_pct == 75.0
+    assert comparison.mean_abs_compound_diff == pytest.approx(0.05)
+    assert comparison.max_abs_compound_diff == pytest.approx(0.05)
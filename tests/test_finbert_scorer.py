@@ -307,9 +307,11 @@ class TestScoreBatch:
 
     def test_failed_headline_is_skipped(self, scorer):
         # Simulate one headline causing an exception inside scoring.
-        # score_batch should skip it and continue — not crash.
+        # score_batch should bisect the failed batch, skip the bad row
+        # and continue — not crash.
         scorer.classifier.side_effect = [
-            Exception("model exploded"),   # first headline fails
+            Exception("model exploded"),   # whole batch fails
+            Exception("model exploded"),   # first headline fails on its own
             FAKE_FINBERT_OUTPUT_POSITIVE,  # second headline succeeds
         ]
         headlines = [make_raw_headline(), make_raw_headline(ticker="MSFT")]
@@ -318,6 +320,8 @@ class TestScoreBatch:
         # Only 1 result because the first was skipped
         assert len(results) == 1
         assert results[0].ticker == "MSFT"
+        assert scorer.batch_stats.failed_rows == 1
+        assert scorer.batch_stats.fallback_rate_pct == 100.0
 
     def test_empty_list_returns_empty(self, scorer):
         results = scorer.score_batch([])
@@ -328,4 +332,166 @@ class TestScoreBatch:
         headline = make_raw_headline()
         results = scorer.score_batch([headline])
         # compound = 0.02 - 0.87 = -0.85
-        assert results[0].compound_score == pytest.approx(-0.85, abs=1e-4)
\ No newline at end of file
+        assert results[0].compound_score == pytest.approx(-0.85, abs=1e-4)
+
+# ---------------------------------------------------------------------------
+# TESTS: length-sorted token batching
+# ---------------------------------------------------------------------------
+
+class TestTokenBatching:
+    """Batches are planned by padded tokens and results keep input order."""
+
+    def test_plan_groups_similar_lengths_under_budget(self):
+        from sentiment.token_batching import plan_token_batches
+
+        batches = plan_token_batches([40, 5, 38, 6, 700], token_budget=80)
+
+        assert batches == [[1, 3], [2, 0], [4]]
+
+    def test_fast_path_restores_original_order_and_reports_waste(self, scorer):
+        scorer.token_budget = 40
+        texts = [
+            "Apple beats " + "strong demand " * 6,
+            "Fraud probe",
+            "Company files quarterly report as expected",
+            "Chip rally",
+        ]
+        scorer.classifier.tokenizer.return_value = {
+            "input_ids": [[0] * (len(text.split()) + 2) for text in texts]
+        }
+
+        def classify(batch, batch_size):
+            assert len(batch) == batch_size
+            return [
+                FAKE_FINBERT_OUTPUT_NEGATIVE[0]
+                if "Fraud" in text
+                else FAKE_FINBERT_OUTPUT_POSITIVE[0]
+                for text in batch
+            ]
+
+        scorer.classifier.side_effect = classify
+        headlines = [
+            make_raw_headline(ticker=ticker, headline=text)
+            for ticker, text in zip(["AAPL", "XYZ", "MSFT", "NVDA"], texts)
+        ]
+
+        results = scorer.score_batch(headlines)
+
+        assert [result.ticker for result in results] == ["AAPL", "XYZ", "MSFT", "NVDA"]
+        assert [result.sentiment_label for result in results] == [
+            "positive",
+            "negative",
+            "positive",
+            "positive",
+        ]
+        assert scorer.batch_stats.batches == 2
+        assert scorer.batch_stats.real_tokens == 32
+        assert scorer.batch_stats.padded_tokens == 40
+        assert scorer.batch_stats.padding_waste_pct == 20.0
+
+    def test_small_batches_use_one_classifier_call(self, scorer):
+        scorer.classifier.side_effect = lambda batch, batch_size: [
+            FAKE_FINBERT_OUTPUT_POSITIVE[0] for _ in batch
+        ]
+        headlines = [make_raw_headline(ticker=ticker) for ticker in ("AAPL", "MSFT", "NVDA")]
+
+        results = scorer.score_batch(headlines)
+
+        assert [result.ticker for result in results] == ["AAPL", "MSFT", "NVDA"]
+        assert scorer.classifier.call_count == 1
+        assert scorer.batch_stats.fallback_rows == 0
+
+    def test_bisection_isolates_bad_rows(self, scorer):
+        def classify(batch, batch_size):
+            if any("corrupt" in text for text in batch):
+                raise RuntimeError("bad input")
+            return [FAKE_FINBERT_OUTPUT_POSITIVE[0] for _ in batch]
+
+        scorer.classifier.side_effect = classify
+        headlines = [
+            make_raw_headline(ticker=f"T{index}", headline=f"Headline {index:02d} text")
+            for index in range(8)
+        ]
+        headlines[5].headline = "Headline corrupt text"
+
+        results = scorer.score_batch(headlines)
+
+        assert [result.ticker for result in results] == [
+            "T0", "T1", "T2", "T3", "T4", "T6", "T7",
+        ]
+        assert scorer.batch_stats.failed_rows == 1
+        assert scorer.batch_stats.bisected_batches == 3
+        assert scorer.batch_stats.fallback_rows == 8
+
+
+# ---------------------------------------------------------------------------
+# TESTS: summary-aware chunked scoring
+# ---------------------------------------------------------------------------
+
+class TestSummaryChunking:
+    """Summaries are chunked, scored with their headlines and pooled."""
+
+    @pytest.fixture
+    def summary_scorer(self, scorer):
+        from sentiment.summary_chunking import SummaryChunker
+
+        scorer.score_summaries = True
+        scorer.summary_chunker = SummaryChunker(chunk_tokens=8, overlap_tokens=4)
+        scorer.classifier.side_effect = lambda batch, batch_size: [
+            FAKE_FINBERT_OUTPUT_NEGATIVE[0]
+            if "recall" in text
+            else FAKE_FINBERT_OUTPUT_POSITIVE[0]
+            for text in batch
+        ]
+        return scorer
+
+    def test_overlapping_windows_share_overlap_and_cover_the_tail(self):
+        from sentiment.summary_chunking import overlapping_windows
+
+        assert overlapping_windows(10, window=4, overlap=1) == [(0, 4), (3, 7), (6, 10)]
+        assert overlapping_windows(3, window=4, overlap=1) == [(0, 3)]
+        assert overlapping_windows(0, window=4, overlap=1) == []
+
+    def test_chunk_size_is_capped_to_the_model_sequence_limit(self, monkeypatch):
+        from sentiment.summary_chunking import MAX_SEQUENCE_TOKENS, build_summary_chunker
+
+        monkeypatch.setattr("config.settings.finbert_summary_chunk_tokens", 1024)
+
+        assert build_summary_chunker().chunk_tokens == MAX_SEQUENCE_TOKENS - 2
+
+    def test_long_summary_is_chunked_into_the_same_classifier_call(self, summary_scorer):
+        summary = " ".join(f"word{index}" for index in range(14))
+        headline = make_raw_headline(summary=summary)
+
+        assert summary_scorer.summary_chunker.segments(headline) == [
+            headline.headline,
+            " ".join(f"word{index}" for index in range(0, 6)),
+            " ".join(f"word{index}" for index in range(3, 9)),
+            " ".join(f"word{index}" for index in range(6, 12)),
+            " ".join(f"word{index}" for index in range(9, 14)),
+        ]
+
+        results = summary_scorer.score_batch([headline, make_raw_headline(ticker="MSFT")])
+
+        assert [result.ticker for result in results] == ["AAPL", "MSFT"]
+        assert summary_scorer.classifier.call_count == 1
+        assert summary_scorer.batch_stats.texts == 6
+
+    def test_summary_chunks_are_pooled_with_the_headline(self, summary_scorer):
+        headline = make_raw_headline(
+            headline="Apple beats earnings expectations",
+            summary="Apple announced a product recall",
+        )
+
+        results = summary_scorer.score_batch([headline])
+        single = summary_scorer.score_headline(headline)
+
+        assert results[0].positive_score == pytest.approx((0.91 + 0.02) / 2)
+        assert results[0].negative_score == pytest.approx((0.02 + 0.87) / 2)
+        assert results[0].compound_score == pytest.approx(0.02)
+        assert single.compound_score == results[0].compound_score
+
+    def test_headlines_without_summaries_score_as_before(self, summary_scorer):
+        results = summary_scorer.score_batch([make_raw_headline(summary=None)])
+
+        assert results[0].compound_score == pytest.approx(0.89)
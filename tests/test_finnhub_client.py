@@ -1,4 +1,8 @@
+from datetime import datetime, timezone
+
 from ingestion.finnhub_client import FinnhubClient
+from ingestion.ingestion_cursors import IngestionCursorStore
+from models.raw_headline import RawHeadline
 
 
 def test_extract_news_sentiment_score_prefers_bullish_minus_bearish():
@@ -15,3 +19,50 @@ def test_extract_news_sentiment_score_prefers_bullish_minus_bearish():
 
 def test_extract_news_sentiment_score_falls_back_to_company_score():
     assert FinnhubClient.extract_news_sentiment_score({"companyNewsScore": -0.25}) == -0.25
+
+
+def test_new_headlines_only_drops_items_before_ticker_cursor(tmp_path):
+    store = IngestionCursorStore(tmp_path / "cursors.json")
+    store.advance("finnhub", "AAPL", datetime(2026, 1, 2, tzinfo=timezone.utc))
+    store.commit()
+    headlines = [
+        RawHeadline(
+            ticker="AAPL",
+            headline=f"Headline {epoch}",
+            source="Reuters",
+            url="",
+            published_at_utc=epoch,
+        )
+        for epoch in (1767225600, 1767398400)
+    ]
+
+    fresh = FinnhubClient.new_headlines_only("AAPL", headlines, store)
+
+    assert [headline.published_at_utc for headline in fresh] == [1767398400]
+
+
+def test_cursor_keeps_distinct_items_that_share_its_timestamp(tmp_path):
+    published = datetime(2026, 1, 2, 9, 30, tzinfo=timezone.utc)
+
+    def headline(title: str) -> RawHeadline:
+        return RawHeadline(
+            ticker="AAPL",
+            headline=title,
+            source="Reuters",
+            url=f"https://example.com/{title.replace(' ', '-')}",
+            published_at_utc=published,
+        )
+
+    first_store = IngestionCursorStore(tmp_path / "cursors.json")
+    FinnhubClient.new_headlines_only("AAPL", [headline("Apple beats")], first_store)
+    first_store.commit()
+
+    second_store = IngestionCursorStore(tmp_path / "cursors.json")
+    fresh = FinnhubClient.new_headlines_only(
+        "AAPL",
+        [headline("Apple beats"), headline("Apple raises guidance")],
+        second_store,
+    )
+
+    assert [item.headline for item in fresh] == ["Apple raises guidance"]
+    assert second_store.stats.fetched_items == 2
@@ -0,0 +1,118 @@
+import threading
+
+import requests
+
+from ingestion.finnhub_client import FinnhubClient, FinnhubRateLimitError
+from ingestion.finnhub_sentiment import FinnhubSentimentCollector
+from ingestion.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSentimentClient:
+    def __init__(self, scores: dict[str, float | None]) -> None:
+        self.scores = dict(scores)
+        self.calls: list[str] = []
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def fetch_news_sentiment_score(self, ticker: str) -> float | None:
+        with self._lock:
+            self.calls.append(ticker)
+        if ticker in self.failing:
+            raise FinnhubRateLimitError(retry_after_seconds=0.0)
+        return self.scores[ticker]
+
+
+def test_collector_serves_fresh_scores_from_cache():
+    client = FakeSentimentClient({"AAPL": 0.4, "MSFT": None, "NVDA": -0.2})
+    clock = FakeClock()
+    collector = FinnhubSentimentCollector(client, ttl_seconds=60, max_workers=4, clock=clock)
+
+    first = collector.collect(["aapl", "MSFT", "NVDA"])
+    clock.now = 30
+    second = collector.collect(["AAPL", "MSFT", "NVDA"])
+
+    assert first == second == {"AAPL": 0.4, "NVDA": -0.2}
+    assert sorted(client.calls) == ["AAPL", "MSFT", "NVDA"]
+    assert collector.stats.fresh_hits == 3
+
+
+def test_collector_returns_stale_scores_while_refreshing_in_background():
+    client = FakeSentimentClient({"AAPL": 0.4})
+    clock = FakeClock()
+    collector = FinnhubSentimentCollector(client, ttl_seconds=60, clock=clock)
+    collector.collect(["AAPL"])
+    client.scores["AAPL"] = -0.1
+    clock.now = 120
+
+    stale = collector.collect(["AAPL"])
+    collector.close()
+    refreshed = collector.collect(["AAPL"])
+
+    assert stale == {"AAPL": 0.4}
+    assert refreshed == {"AAPL": -0.1}
+    assert collector.stats.stale_hits == 1
+    assert collector.stats.background_refreshes == 1
+
+
+def test_collector_refetches_expired_scores_without_stale_mode_and_skips_failures():
+    client = FakeSentimentClient({"AAPL": 0.4, "MSFT": 0.1})
+    clock = FakeClock()
+    collector = FinnhubSentimentCollector(
+        client,
+        ttl_seconds=60,
+        stale_while_revalidate=False,
+        clock=clock,
+    )
+    client.failing.add("MSFT")
+    collector.collect(["AAPL", "MSFT"])
+    client.failing.clear()
+    client.scores["AAPL"] = 0.5
+    clock.now = 120
+
+    assert collector.collect(["AAPL", "MSFT"]) == {"AAPL": 0.5, "MSFT": 0.1}
+    assert collector.stats.failed_requests == 1
+    assert client.calls.count("AAPL") == 2
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self) -> dict:
+        return {}
+
+
+class RateLimitedSession:
+    def get(self, url: str, params: dict, timeout: float) -> FakeResponse:
+        return FakeResponse(429, {"Retry-After": "7"})
+
+
+def test_collector_pauses_the_token_bucket_on_http_429():
+    clock = FakeClock()
+    rate_limiter = TokenBucket(rate_per_second=10.0, clock=clock, sleep=lambda _: None)
+    collector = FinnhubSentimentCollector(
+        FinnhubClient(api_key="test", session=RateLimitedSession()),
+        rate_limiter=rate_limiter,
+        clock=clock,
+    )
+
+    assert collector.collect(["AAPL"]) == {}
+    assert rate_limiter.pauses == 1
+    assert rate_limiter.acquire() >= 7.0
+    assert collector.stats.failed_requests == 1
+
+    collector.reset_run_stats()
+    assert collector.stats.failed_requests == 0
@@ -0,0 +1,108 @@
+from dataclasses import asdict
+from datetime import date, datetime, timezone
+import sys
+
+import pandas as pd
+
+from analytics.insight_engine import InsightEngine
+from models.headline_batch import HeadlineBatch
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+from storage.local_mysql_storage import LocalMySQLStorage
+from tests.test_normalize_headlines import sample_raw_headlines
+from transformations.normalize_headlines import normalize_headline_batch, normalize_headlines
+
+
+def object_nbytes(headlines) -> int:
+    """Dataclass objects plus every distinct value object they reference."""
+    seen: dict[int, int] = {}
+    for headline in headlines:
+        for name in type(headline).__dataclass_fields__:
+            value = getattr(headline, name)
+            seen.setdefault(id(value), sys.getsizeof(value))
+    return sum(sys.getsizeof(headline) for headline in headlines) + sum(seen.values())
+
+
+def test_batch_round_trips_raw_and_scored_headlines():
+    raw = normalize_headlines(sample_raw_headlines(300))
+    scored = LexiconSentimentScorer().score_batch(raw)
+
+    raw_batch = HeadlineBatch.from_headlines(raw)
+    scored_batch = HeadlineBatch.from_headlines(scored)
+
+    assert list(raw_batch) == raw
+    assert list(scored_batch) == scored
+    assert raw_batch[-1] == raw[-1]
+    assert list(scored_batch[10:20]) == scored[10:20]
+    assert normalize_headline_batch(sample_raw_headlines(300)).to_headlines() == raw
+
+
+def test_repeated_strings_are_dictionary_encoded():
+    headlines = sample_raw_headlines(1_000)
+    batch = normalize_headline_batch(headlines)
+    frame = batch.to_frame()
+
+    assert len(frame["source"].cat.categories) == 5
+    assert str(frame["published_at_utc"].dtype) == "datetime64[us, UTC]"
+    assert frame["content_hash"].tolist() == batch.column("content_hash")
+    assert batch.nbytes < 0.6 * object_nbytes(normalize_headlines(headlines))
+
+
+def test_storage_saves_batches_like_lists(tmp_path):
+    raw = normalize_headlines(sample_raw_headlines(50))
+    scored = LexiconSentimentScorer().score_batch(raw)
+    for headline in scored[:5]:
+        headline.content_hash = None
+    list_storage = LocalMySQLStorage(f"sqlite:///{tmp_path / 'list.sqlite'}")
+    batch_storage = LocalMySQLStorage(f"sqlite:///{tmp_path / 'batch.sqlite'}")
+    for storage in (list_storage, batch_storage):
+        storage.create_tables()
+
+    list_storage.save_raw_headlines(raw)
+    list_storage.save_scored_headlines(scored)
+    batch_storage.save_raw_headlines(HeadlineBatch.from_headlines(raw))
+    batch_storage.save_scored_headlines(HeadlineBatch.from_headlines(scored))
+
+    for table in ("raw_headlines", "scored_headlines"):
+        # inserted_at_utc is the wall clock at insert time, so it is not compared.
+        expected = list_storage.fetch_dashboard_table(table).drop(columns="inserted_at_utc")
+        actual = batch_storage.fetch_dashboard_table(table).drop(columns="inserted_at_utc")
+        assert len(actual) == 50
+        assert actual.equals(expected)
+
+
+def test_storage_persists_scoring_stage_from_lists_and_batches(tmp_path):
+    scored = LexiconSentimentScorer().score_batch(normalize_headlines(sample_raw_headlines(6)))
+    for position, headline in enumerate(scored):
+        headline.scoring_stage = ("lexicon", "finbert", None)[position % 3]
+    list_storage = LocalMySQLStorage(f"sqlite:///{tmp_path / 'list.sqlite'}")
+    batch_storage = LocalMySQLStorage(f"sqlite:///{tmp_path / 'batch.sqlite'}")
+    for storage in (list_storage, batch_storage):
+        storage.create_tables()
+
+    list_storage.save_scored_headlines(scored)
+    batch_storage.save_scored_headlines(HeadlineBatch.from_headlines(scored))
+
+    expected = [headline.scoring_stage for headline in scored]
+    for storage in (list_storage, batch_storage):
+        stages = storage.fetch_dashboard_table("scored_headlines")["scoring_stage"]
+        assert [stage if pd.notna(stage) else None for stage in stages] == expected
+
+
+def test_insight_engine_accepts_batches():
+    published = datetime.now(timezone.utc)
+    raw = normalize_headlines(sample_raw_headlines(200))
+    for headline in raw:
+        headline.published_at_utc = published
+    scored = LexiconSentimentScorer().score_batch(raw)
+    batch = HeadlineBatch.from_headlines(scored)
+
+    from_batch = InsightEngine().generate_insights(batch, as_of_date=date.today())
+    from_frame = InsightEngine().generate_insights(
+        pd.DataFrame([asdict(headline) for headline in scored]),
+        as_of_date=date.today(),
+    )
+
+    assert [insight.signal_score for insight in from_batch] == [
+        insight.signal_score for insight in from_frame
+    ]
+    assert from_batch
@@ -0,0 +1,86 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from models.headline_batch import HeadlineBatch
+from models.raw_headline import RawHeadline
+from sentiment.headline_scoring import TextDedupStats, score_unique_headlines
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+
+
+def make_headline(ticker: str, text: str, summary: str | None = None) -> RawHeadline:
+    return RawHeadline(
+        ticker=ticker,
+        headline=text,
+        source="Google News",
+        url=f"https://example.com/{ticker}",
+        published_at_utc=datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc),
+        summary=summary,
+        category="political",
+    )
+
+
+def test_copies_of_one_text_are_scored_once_and_fanned_out():
+    scorer = LexiconSentimentScorer()
+    scored_rows: list[int] = []
+
+    def score_batch(headlines):
+        scored_rows.append(len(headlines))
+        return scorer.score_batch(headlines)
+
+    tariff = "New tariffs hit chip exports  as probe widens"
+    headlines = [
+        make_headline("NVDA", tariff, "Export curbs expand."),
+        make_headline("AMD", "Chipmaker beats estimates"),
+        make_headline("INTC", tariff.replace("  ", " "), "Export curbs expand."),
+        make_headline("AVGO", tariff, "Different summary, scored separately."),
+        make_headline("QCOM", ""),
+    ]
+    stats = TextDedupStats()
+
+    scored = score_unique_headlines(headlines, score_batch, stats=stats)
+
+    assert scored_rows == [4]
+    assert [item.ticker for item in scored] == ["NVDA", "AMD", "INTC", "AVGO", "QCOM"]
+    assert [item.url for item in scored][2] == "https://example.com/INTC"
+    assert scored[2].compound_score == scored[0].compound_score
+    assert scored == scorer.score_batch(headlines)
+    assert stats.as_dict() == {"rows": 5, "unique_texts": 4, "unique_ratio": 0.8}
+
+
+def test_batches_without_repeats_pass_straight_through():
+    headlines = [make_headline("AAPL", "Apple beats"), make_headline("MSFT", "Microsoft falls")]
+    calls: list[list[RawHeadline]] = []
+
+    def score_batch(batch):
+        calls.append(batch)
+        return []
+
+    score_unique_headlines(headlines, score_batch)
+
+    assert calls == [headlines]
+
+
+def test_batches_fan_out_column_wise_and_match_list_scoring():
+    scorer = LexiconSentimentScorer()
+    scored_rows: list[int] = []
+
+    def score_batch(headlines):
+        scored_rows.append(len(headlines))
+        return scorer.score_batch(headlines)
+
+    tariff = "New tariffs hit chip exports as probe widens"
+    headlines = [
+        make_headline("NVDA", tariff, "Export curbs expand."),
+        make_headline("AMD", ""),
+        make_headline("INTC", tariff, "Export curbs expand."),
+    ]
+    headlines[2].source = "Reuters"
+
+    scored = score_unique_headlines(HeadlineBatch.from_headlines(headlines), score_batch)
+
+    assert isinstance(scored, HeadlineBatch)
+    assert scored_rows == [2]
+    # Age is computed at call time, so it is left out of the comparison.
+    assert [replace(item, headline_age_hours=0.0) for item in scored] == [
+        replace(item, headline_age_hours=0.0) for item in scorer.score_batch(headlines)
+    ]
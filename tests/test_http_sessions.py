@@ -0,0 +1,39 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+from ingestion.http_sessions import build_pooled_session, connection_stats_summary
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_pooled_session_reuses_connections_per_host():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = build_pooled_session(pool_maxsize=2, retries=0, timeout_seconds=5)
+
+    try:
+        for ticker in ("AAPL", "MSFT", "NVDA", "AMZN"):
+            response = session.get(f"http://127.0.0.1:{server.server_port}/news?symbol={ticker}")
+            assert response.json() == []
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert connection_stats_summary(session) == {
+        "127.0.0.1": {"requests": 4, "new_connections": 1, "reused_connections": 3}
+    }
@@ -72,3 +72,38 @@ def test_insight_engine_blends_optional_finnhub_score():
 
     assert insights[0].signal_score > 0
     assert "Finnhub ticker score" in insights[0].rationale
+
+
+def test_near_duplicate_copies_count_as_one_story():
+    def row(headline: str, content_hash: str, story_cluster_id: str | None) -> dict:
+        return {
+            "ticker": "AAPL",
+            "headline": headline,
+            "published_at_utc": datetime.now(timezone.utc),
+            "compound_score": 0.5,
+            "confidence": 0.8,
+            "source_tier": 1,
+            "category": "financial",
+            "content_hash": content_hash,
+            "story_cluster_id": story_cluster_id,
+        }
+
+    single = pd.DataFrame([row("Apple beats estimates", "a", "a")])
+    syndicated = pd.DataFrame(
+        [
+            row("Apple beats estimates", "a", "a"),
+            row("Apple beats estimates - Reuters", "b", "a"),
+            row("Apple Beats Estimates!", "c", "a"),
+            row("Apple opens new campus", "d", None),
+        ]
+    )
+
+    single_insight = InsightEngine().generate_insights(single)[0]
+    syndicated_insight = InsightEngine().generate_insights(
+        syndicated.iloc[:3]
+    )[0]
+    mixed_insight = InsightEngine().generate_insights(syndicated)[0]
+
+    assert syndicated_insight.headline_count == 1
+    assert syndicated_insight.signal_score == single_insight.signal_score
+    assert mixed_insight.headline_count == 2
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from math import exp
+import random
+import re
+
+from models.sentiment_result import SentimentResult
+from sentiment.lexicon_scorer import (
+    NEGATIVE_TERMS,
+    POSITIVE_TERMS,
+    LexiconSentimentScorer,
+)
+
+
+def legacy_weighted_term_score(text: str, terms: dict[str, float]) -> float:
+    score = 0.0
+    for term, weight in terms.items():
+        if " " in term:
+            if term in text:
+                score += weight
+        else:
+            score += len(re.findall(rf"\b{re.escape(term)}\b", text)) * weight
+    return score
+
+
+def legacy_score_text(text: str) -> SentimentResult:
+    """Per-term regex scorer used before the compiled batch lexicon."""
+    normalized = re.sub(r"\s+", " ", text.casefold()).strip()
+    positive = legacy_weighted_term_score(normalized, POSITIVE_TERMS)
+    negative = legacy_weighted_term_score(normalized, NEGATIVE_TERMS)
+
+    if positive == 0 and negative == 0:
+        compound = 0.0
+    else:
+        compound = max(min((positive - negative) / (positive + negative + 1.0), 1), -1)
+
+    positive_probability = 1.0 / (1.0 + exp(-compound * 3))
+    negative_probability = 1.0 / (1.0 + exp(compound * 3))
+    neutral_probability = max(0.05, 1.0 - abs(compound))
+    total = positive_probability + neutral_probability + negative_probability
+
+    score_map = {
+        "positive": positive_probability / total,
+        "neutral": neutral_probability / total,
+        "negative": negative_probability / total,
+    }
+    label = max(score_map, key=score_map.get)
+    return SentimentResult(
+        label=label,
+        positive_score=round(score_map["positive"], 6),
+        neutral_score=round(score_map["neutral"], 6),
+        negative_score=round(score_map["negative"], 6),
+        compound_score=round(score_map["positive"] - score_map["negative"], 6),
+        confidence=round(score_map[label], 6),
+    )
+
+
+def sample_headlines(count: int, seed: int = 7) -> list[str]:
+    generator = random.Random(seed)
+    terms = list(POSITIVE_TERMS) + list(NEGATIVE_TERMS)
+    variants = [
+        "beats", "beat", "beaten", "pre-approval", "recalls", "fine-tuned",
+        "higher rates", "HIGHER", "cuts  rates", "tariffs,", "fraud.", "Risk",
+        "haircuts rates", "probe—fraud", "Déal", "ﬁne", "recall\x00ban", "cuts\nrates",
+    ]
+    filler = ["Shares", "of", "the", "company", "after", "quarter", "said", "on", "Monday"]
+    texts: list[str] = []
+    for _ in range(count):
+        words = [generator.choice(filler) for _ in range(generator.randint(3, 14))]
+        for _ in range(generator.randint(0, 5)):
+            word = generator.choice(terms if generator.random() < 0.7 else variants)
+            words.insert(
+                generator.randint(0, len(words)),
+                word.upper() if generator.random() < 0.15 else word,
+            )
+        texts.append(" ".join(words))
+    return texts
+
+
+def test_batch_scores_are_bit_identical_to_legacy_scorer():
+    texts = sample_headlines(5_000)
+    scorer = LexiconSentimentScorer()
+
+    assert scorer.score_texts(texts) == [legacy_score_text(text) for text in texts]
+
+
+def test_single_text_and_repeated_terms_match_legacy_scorer():
+    scorer = LexiconSentimentScorer()
+
+    for text in [
+        "Apple beats, beats and BEATS estimates; raises guidance",
+        "Regulators\tprobe fraud  and   export controls",
+        "Chipmaker wins deal despite tariff risk",
+        "Company reports results",
+        "\x00cuts rates\x00",
+        "Straße wins «approval» after tariff  ",
+    ]:
+        assert scorer.score_text(text) == legacy_score_text(text)
+
+
+def test_empty_texts_are_skipped_in_place():
+    results = LexiconSentimentScorer().score_texts(["Profit surge", "  ", "Lawsuit"])
+
+    assert results[1] is None
+    assert results[0].label == "positive"
+    assert results[2].label == "negative"
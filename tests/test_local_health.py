@@ -39,3 +39,18 @@ def test_health_monitor_flags_failures():
     assert len(alerts) == 1
     assert alerts[0].severity == "critical"
     assert alerts[0].alert_type == "pipeline_failed"
+
+
+def test_health_monitor_counts_items_filtered_by_cursors_as_coverage(monkeypatch):
+    monkeypatch.setattr("config.settings.health_min_raw_headlines_per_run", 10)
+    monkeypatch.setattr("config.settings.health_min_insights_per_run", 0)
+
+    alerts = LocalPipelineHealthMonitor().evaluate_success(
+        {
+            "run_id": "run-3",
+            "raw_headlines_fetched": 40,
+            "raw_headlines_collected": 0,
+        }
+    )
+
+    assert "low_headline_coverage" not in {alert.alert_type for alert in alerts}
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+from models.raw_headline import RawHeadline
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+from transformations.near_duplicates import (
+    NearDuplicateIndex,
+    cluster_headline_batch,
+    story_text,
+)
+from transformations.normalize_headlines import normalize_headline_batch
+
+PUBLISHED = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+
+
+def make_headline(ticker: str, text: str, minutes: int = 0, source: str = "Reuters"):
+    return RawHeadline(
+        ticker=ticker,
+        headline=text,
+        source=source,
+        url=f"https://example.com/{ticker}/{abs(hash(text))}",
+        published_at_utc=PUBLISHED + timedelta(minutes=minutes),
+    )
+
+
+def test_story_text_drops_source_tags_and_punctuation():
+    assert story_text("Apple beats estimates, raises guidance - Reuters", "Reuters") == (
+        "apple beats estimates raises guidance"
+    )
+    assert story_text(
+        "Apple beats estimates, raises guidance | WSJ",
+        known_outlets=frozenset({"wsj"}),
+    ) == "apple beats estimates raises guidance"
+    assert story_text("Apple stock outlook - analysts turn bearish", "Reuters") == (
+        "apple stock outlook analysts turn bearish"
+    )
+    assert story_text("[Bloomberg] Apple Beats Estimates; Raises Guidance") == (
+        "apple beats estimates raises guidance"
+    )
+    assert story_text("Fed holds - Reuters", "Reuters") == "fed holds reuters"
+
+
+def test_syndicated_titles_share_a_cluster_per_ticker():
+    batch = normalize_headline_batch(
+        [
+            make_headline("AAPL", "Apple beats estimates, raises full-year guidance"),
+            make_headline("AAPL", "Apple beats estimates, raises full-year guidance - Reuters", 5),
+            make_headline("AAPL", "Apple Beats Estimates; Raises Full-Year Guidance | Yahoo Finance", 9),
+            make_headline("AAPL", "Apple faces antitrust probe in Europe", 12),
+            make_headline("MSFT", "Apple beats estimates, raises full-year guidance", 3),
+        ]
+    )
+    index = NearDuplicateIndex()
+
+    clustered, representatives = cluster_headline_batch(batch, index)
+
+    cluster_ids = clustered.column("story_cluster_id")
+    hashes = clustered.column("content_hash")
+    assert cluster_ids[:3] == [hashes[0]] * 3
+    assert cluster_ids[3:] == hashes[3:]
+    assert representatives.column("ticker") == ["AAPL", "AAPL", "MSFT"]
+    assert index.stats.as_dict() == {
+        "headlines": 5,
+        "clusters": 3,
+        "near_duplicates": 2,
+        "duplicate_ratio": 0.4,
+        "evicted": 0,
+    }
+
+    scored = LexiconSentimentScorer().score_batch(representatives)
+    assert [item.story_cluster_id for item in scored] == [hashes[0], hashes[3], hashes[4]]
+
+
+def test_same_prefix_with_opposite_sentiment_stays_separate():
+    index = NearDuplicateIndex()
+
+    cluster_ids, representative = index.assign(
+        ["AAPL"] * 4,
+        [
+            "Apple stock outlook - analysts turn bullish",
+            "Apple stock outlook - analysts turn bearish",
+            "Apple shares rise on strong iPhone demand",
+            "Apple shares fall on strong iPhone demand",
+        ],
+        [PUBLISHED + timedelta(minutes=minutes) for minutes in range(4)],
+        ["bullish", "bearish", "rise", "fall"],
+        sources=["Reuters"] * 4,
+    )
+
+    assert cluster_ids == ["bullish", "bearish", "rise", "fall"]
+    assert representative == [True] * 4
+
+
+def test_copies_outside_the_window_start_a_new_story():
+    index = NearDuplicateIndex(window_hours=6)
+    title = "Tesla recalls vehicles over software fault"
+
+    first_ids, _ = index.assign(["TSLA"], [title], [PUBLISHED], ["first"])
+    later_ids, representative = index.assign(
+        ["TSLA", "TSLA"],
+        [title + " - Reuters", title],
+        [PUBLISHED + timedelta(hours=2), PUBLISHED + timedelta(hours=9)],
+        ["second", "third"],
+    )
+
+    assert first_ids == ["first"]
+    assert later_ids == ["first", "third"]
+    assert representative == [False, True]
+
+    index.assign(["TSLA"], [title], [PUBLISHED + timedelta(hours=20)], ["fourth"])
+
+    assert index.stats.evicted == 3
+    assert len(index) == 1
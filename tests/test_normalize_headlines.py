@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+import random
+
+import pandas as pd
+
+from models.raw_headline import RawHeadline
+from storage.local_mysql_storage import LocalMySQLStorage
+from transformations.headline_normalizer import HeadlineNormalizer
+from transformations.normalize_headlines import normalize_headline_frame, normalize_headlines
+
+
+def legacy_normalize_and_hash(headlines: list[RawHeadline]) -> list[tuple[RawHeadline, str]]:
+    """The original per-object path: a fresh normalizer, then a separate hash pass."""
+    normalizer = HeadlineNormalizer()
+    normalized = [
+        RawHeadline(
+            ticker=normalizer._clean_text(headline.ticker).upper(),
+            headline=normalizer._clean_text(headline.headline),
+            source=normalizer._clean_text(headline.source) or "unknown",
+            published_at_utc=normalizer._normalize_timestamp(headline.published_at_utc),
+            summary=normalizer._clean_optional_text(headline.summary),
+            url=normalizer._clean_text(headline.url),
+            category=normalizer._clean_text(headline.category).lower() or "financial",
+            topic=normalizer._clean_optional_text(headline.topic),
+            industry=normalizer._clean_optional_text(headline.industry),
+        )
+        for headline in headlines
+    ]
+    return [(headline, normalizer.build_content_hash(headline)) for headline in normalized]
+
+
+def sample_raw_headlines(count: int, seed: int = 11) -> list[RawHeadline]:
+    rng = random.Random(seed)
+    tickers = ["aapl", " MSFT", "nvda ", "Tsla", "amzn"]
+    sources = ["Reuters", "  Bloomberg ", "", "Yahoo\tFinance", "Seeking Alpha"]
+    words = ["Stock", "beats", "falls", "guidance", "tariff", "probe", "record", "sales"]
+    started = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+    timestamps = [
+        started,
+        started.replace(tzinfo=None),
+        int(started.timestamp()),
+        "2026-01-05T09:30:00-05:00",
+        "1767623400",
+    ]
+    return [
+        RawHeadline(
+            ticker=rng.choice(tickers),
+            headline="  ".join(rng.choice(words) for _ in range(rng.randint(3, 10))),
+            source=rng.choice(sources),
+            url=f" https://example.com/{index} ",
+            published_at_utc=(
+                started + timedelta(minutes=index)
+                if index % 2
+                else rng.choice(timestamps)
+            ),
+            summary=rng.choice([None, "", "  Shares\nmoved  after the report. "]),
+            category=rng.choice(["Financial", "POLITICAL ", ""]),
+            topic=rng.choice([None, " trade  policy "]),
+            industry=rng.choice([None, "Semiconductors"]),
+        )
+        for index in range(count)
+    ]
+
+
+def _fields(headline: RawHeadline) -> dict:
+    return {name: getattr(headline, name) for name in RawHeadline.__dataclass_fields__}
+
+
+def test_batch_normalization_matches_per_object_normalizer():
+    headlines = sample_raw_headlines(500)
+    normalizer = HeadlineNormalizer()
+
+    normalized = normalize_headlines(headlines)
+
+    assert normalized == [normalizer.normalize(headline) for headline in headlines]
+
+    assert normalized == [
+        RawHeadline(**{**_fields(legacy), "content_hash": legacy_hash})
+        for legacy, legacy_hash in legacy_normalize_and_hash(headlines)
+    ]
+
+
+def test_frame_normalization_matches_list_normalization():
+    headlines = sample_raw_headlines(200)
+    frame = pd.DataFrame([_fields(headline) for headline in headlines]).drop(
+        columns=["content_hash", "industry"]
+    )
+    for headline in headlines:
+        headline.industry = None
+
+    normalized = normalize_headline_frame(frame)
+
+    assert normalized["content_hash"].tolist() == [
+        headline.content_hash for headline in normalize_headlines(headlines)
+    ]
+
+
+def test_storage_and_scoring_reuse_the_normalization_hash(tmp_path):
+    from sentiment.lexicon_scorer import LexiconSentimentScorer
+
+    headline = normalize_headlines(sample_raw_headlines(1))[0]
+    scored = LexiconSentimentScorer().score_batch([headline])[0]
+    storage = LocalMySQLStorage(f"sqlite:///{tmp_path / 'quicksilver.sqlite'}")
+
+    assert scored.content_hash == headline.content_hash
+    assert storage._scored_content_hash(scored) == headline.content_hash
+    headline.content_hash = None
+    assert storage._raw_content_hash(headline) == scored.content_hash
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+
+from config.news_topics import (
+    POLICY_RESTRICTIVE_KEYWORDS,
+    POLICY_SUPPORTIVE_KEYWORDS,
+    POLITICAL_INDUSTRY_TOPICS,
+    classify_policy_impact,
+)
+from ingestion.policy_matcher import PolicyKeywordMatcher
+
+
+def legacy_policy_topics(text: str) -> list[dict[str, object]]:
+    """Per-topic keyword scan used before the shared keyword automaton."""
+    search_text = text.casefold()
+    return [
+        topic
+        for topic in POLITICAL_INDUSTRY_TOPICS
+        if any(str(keyword).casefold() in search_text for keyword in topic.get("keywords", ()))
+    ]
+
+
+def sample_policy_texts(count: int, seed: int = 11) -> list[str]:
+    generator = random.Random(seed)
+    keywords = [
+        str(keyword)
+        for topic in POLITICAL_INDUSTRY_TOPICS
+        for keyword in topic.get("keywords", ())
+    ]
+    keywords += list(POLICY_SUPPORTIVE_KEYWORDS) + list(POLICY_RESTRICTIVE_KEYWORDS)
+    filler = ["Congress", "weighs", "new", "rules", "as", "markets", "react", "today."]
+    texts: list[str] = []
+    for _ in range(count):
+        words = [generator.choice(filler) for _ in range(generator.randint(4, 16))]
+        for _ in range(generator.randint(0, 4)):
+            keyword = generator.choice(keywords)
+            words.insert(
+                generator.randint(0, len(words)),
+                keyword.upper() if generator.random() < 0.2 else keyword,
+            )
+        texts.append(" ".join(words))
+    return texts
+
+
+def test_policy_matcher_matches_legacy_topics_and_impact():
+    matcher = PolicyKeywordMatcher()
+
+    for text in sample_policy_texts(300) + [""]:
+        scan = matcher.scan(text)
+        assert list(scan.topics) == legacy_policy_topics(text), text
+        assert scan.impact == classify_policy_impact(text), text
@@ -67,6 +67,11 @@ class FakeHttpResponse:
             raise requests.HTTPError("not found", response=self)
 
 
+class FakeSession:
+    def __init__(self, handler) -> None:
+        self.get = handler
+
+
 def test_yahoo_symbol_overrides_use_usd_resolvable_symbols():
     assert YahooChartPriceProvider._yahoo_symbol("BRK.B") == "BRK-B"
     assert YahooChartPriceProvider._yahoo_symbol("FI") == "FISV"
@@ -181,7 +186,7 @@ def test_resilient_price_provider_skips_external_lookup_for_synthetic_only_ticke
     assert secondary.calls == 0
 
 
-def test_yahoo_provider_suppresses_repeated_service_outage_logs(monkeypatch, caplog):
+def test_yahoo_provider_suppresses_repeated_service_outage_logs(caplog):
     calls = 0
 
     def fail_request(*args, **kwargs):
@@ -189,8 +194,7 @@ def test_yahoo_provider_suppresses_repeated_service_outage_logs(monkeypatch, cap
         calls += 1
         raise requests.ConnectionError("DNS unavailable")
 
-    monkeypatch.setattr(requests, "get", fail_request)
-    provider = YahooChartPriceProvider()
+    provider = YahooChartPriceProvider(session=FakeSession(fail_request))
 
     with caplog.at_level(logging.WARNING):
         assert provider.fetch_latest_close("AAPL", date(2026, 1, 5)) is None
@@ -200,7 +204,7 @@ def test_yahoo_provider_suppresses_repeated_service_outage_logs(monkeypatch, cap
     assert caplog.text.count("Yahoo price provider unavailable") == 1
 
 
-def test_stooq_provider_suppresses_repeated_service_outage_logs(monkeypatch, caplog):
+def test_stooq_provider_suppresses_repeated_service_outage_logs(caplog):
     calls = 0
 
     def fail_request(*args, **kwargs):
@@ -208,8 +212,7 @@ def test_stooq_provider_suppresses_repeated_service_outage_logs(monkeypatch, cap
         calls += 1
         raise requests.ConnectionError("DNS unavailable")
 
-    monkeypatch.setattr(requests, "get", fail_request)
-    provider = StooqPriceProvider()
+    provider = StooqPriceProvider(session=FakeSession(fail_request))
 
     with caplog.at_level(logging.WARNING):
         assert provider.fetch_latest_close("AAPL", date(2026, 1, 5)) is None
@@ -219,7 +222,7 @@ def test_stooq_provider_suppresses_repeated_service_outage_logs(monkeypatch, cap
     assert caplog.text.count("Stooq price provider unavailable") == 1
 
 
-def test_stooq_provider_suppresses_repeated_missing_data_logs(monkeypatch, caplog):
+def test_stooq_provider_suppresses_repeated_missing_data_logs(caplog):
     calls = 0
 
     def not_found_request(*args, **kwargs):
@@ -227,8 +230,7 @@ def test_stooq_provider_suppresses_repeated_missing_data_logs(monkeypatch, caplo
         calls += 1
         return FakeHttpResponse(404)
 
-    monkeypatch.setattr(requests, "get", not_found_request)
-    provider = StooqPriceProvider()
+    provider = StooqPriceProvider(session=FakeSession(not_found_request))
 
     with caplog.at_level(logging.INFO):
         assert provider.fetch_latest_close("AAPL", date(2026, 1, 5)) is None
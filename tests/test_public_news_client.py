@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
+import threading
+import time
+from urllib.parse import urlsplit
 
+from ingestion.feed_cache import FeedValidatorCache
+from ingestion.ingestion_cursors import IngestionCursorStore
 from ingestion.public_news_client import PublicNewsClient
+from ingestion.ticker_matcher import TickerMatcher
 
 
 class FakeResponse:
@@ -67,4 +73,174 @@ def test_short_ticker_symbols_do_not_false_match_common_words():
         },
     )()
 
-    assert PublicNewsClient._match_tickers(item, ["T", "C"]) == []
+    assert PublicNewsClient._match_tickers(item, TickerMatcher(["T", "C"])) == []
+
+
+class ConcurrencyTrackingSession(FakeSession):
+    def __init__(self, xml: str) -> None:
+        super().__init__(xml)
+        self._lock = threading.Lock()
+        self.in_flight: dict[str, int] = {}
+        self.max_in_flight: dict[str, int] = {}
+
+    def get(self, url: str, timeout: int):
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.max_in_flight[host] = max(
+                self.max_in_flight.get(host, 0),
+                self.in_flight[host],
+            )
+        time.sleep(0.005)
+        with self._lock:
+            self.in_flight[host] -= 1
+        return super().get(url, timeout)
+
+
+def test_concurrent_fetch_matches_serial_order_and_caps_per_host():
+    published = format_datetime(datetime.now(timezone.utc))
+    xml = f"""
+    <rss><channel>
+      <item>
+        <title>Apple and Microsoft expand chips investment under tariff relief</title>
+        <link>https://example.com/apple-msft</link>
+        <pubDate>{published}</pubDate>
+      </item>
+    </channel></rss>
+    """
+    tickers = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL"]
+    serial = PublicNewsClient(session=FakeSession(xml)).fetch_headlines(
+        tickers=tickers,
+        lookback_days=1,
+    )
+    session = ConcurrencyTrackingSession(xml)
+    concurrent = PublicNewsClient(
+        session=session,
+        max_workers=8,
+        max_requests_per_host=2,
+    ).fetch_headlines(tickers=tickers, lookback_days=1)
+
+    assert concurrent == serial
+    assert len(session.urls) == len(set(session.urls))
+    assert max(session.max_in_flight.values()) <= 2
+
+
+class ConditionalResponse(FakeResponse):
+    def __init__(self, content: bytes, status_code: int, headers: dict[str, str]) -> None:
+        super().__init__(content)
+        self.status_code = status_code
+        self.headers = headers
+
+
+class ConditionalSession:
+    def __init__(self, xml: str) -> None:
+        self.xml = xml
+        self.conditional_requests = 0
+
+    def get(self, url: str, timeout: int, headers: dict[str, str] | None = None):
+        if headers and headers.get("If-None-Match") == '"v1"':
+            self.conditional_requests += 1
+            return ConditionalResponse(b"", 304, {"ETag": '"v1"'})
+        return ConditionalResponse(self.xml.encode("utf-8"), 200, {"ETag": '"v1"'})
+
+
+def test_validator_cache_reuses_items_on_not_modified(tmp_path):
+    published = format_datetime(datetime.now(timezone.utc))
+    xml = f"""
+    <rss><channel>
+      <item>
+        <title>Apple beats expectations</title>
+        <link>https://example.com/aapl</link>
+        <pubDate>{published}</pubDate>
+      </item>
+    </channel></rss>
+    """
+    cache_path = tmp_path / "feed_validators.json"
+    session = ConditionalSession(xml)
+    first_cache = FeedValidatorCache(cache_path)
+    first = PublicNewsClient(session=session, validator_cache=first_cache).fetch_headlines(
+        tickers=["AAPL"],
+        lookback_days=1,
+        include_political=False,
+    )
+    first_cache.save()
+
+    second_cache = FeedValidatorCache(cache_path)
+    second = PublicNewsClient(session=session, validator_cache=second_cache).fetch_headlines(
+        tickers=["AAPL"],
+        lookback_days=1,
+        include_political=False,
+    )
+
+    assert first and second == first
+    assert session.conditional_requests == second_cache.stats.responses
+    assert second_cache.stats.not_modified == second_cache.stats.responses
+    assert second_cache.stats.bytes_saved > 0
+    assert second_cache.stats.bytes_downloaded == 0
+
+
+def test_ingestion_cursor_only_emits_items_newer_than_last_commit(tmp_path):
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def feed(*titles_and_ages: tuple[str, int]) -> str:
+        items = "".join(
+            f"""
+            <item>
+              <title>{title}</title>
+              <link>https://example.com/{age}</link>
+              <pubDate>{format_datetime(now - timedelta(minutes=age))}</pubDate>
+            </item>
+            """
+            for title, age in titles_and_ages
+        )
+        return f"<rss><channel>{items}</channel></rss>"
+
+    cursor_path = tmp_path / "cursors.json"
+    first_store = IngestionCursorStore(cursor_path)
+    first = PublicNewsClient(
+        session=FakeSession(feed(("Apple beats expectations", 30))),
+        cursor_store=first_store,
+    ).fetch_headlines(tickers=["AAPL"], lookback_days=1, include_political=False)
+    first_store.commit()
+
+    second_store = IngestionCursorStore(cursor_path)
+    second = PublicNewsClient(
+        session=FakeSession(
+            feed(("Apple raises guidance", 5), ("Apple beats expectations", 30))
+        ),
+        cursor_store=second_store,
+    ).fetch_headlines(tickers=["AAPL"], lookback_days=1, include_political=False)
+
+    assert [headline.headline for headline in first] == ["Apple beats expectations"]
+    assert [headline.headline for headline in second] == ["Apple raises guidance"]
+    assert second_store.stats.skipped_items > 0
+
+
+def test_streaming_parser_handles_atom_and_stops_after_max_items():
+    now = datetime.now(timezone.utc)
+    entries = "".join(
+        f"""
+        <entry>
+          <title>Entry {index}</title>
+          <link href="https://example.com/{index}" />
+          <updated>{(now - timedelta(hours=index)).isoformat()}</updated>
+        </entry>
+        """
+        for index in range(3)
+    )
+    atom = (
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"{entries}<entry><title>never reached"
+    )
+    client = PublicNewsClient(session=FakeSession(""), max_items_per_feed=3)
+
+    items = client._parse_feed_items(
+        atom.encode("utf-8"),
+        url="https://example.com/atom",
+        fallback_source="Atom Wire",
+        since=now - timedelta(hours=1, minutes=30),
+    )
+
+    assert [item.title for item in items] == ["Entry 0", "Entry 1"]
+    assert items[0].link == "https://example.com/0"
+    assert items[0].source == "Atom Wire"
@@ -0,0 +1,34 @@
+from ingestion.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_paces_requests_after_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+    assert clock.now == 1.0
+
+
+def test_token_bucket_pause_delays_next_request():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=1, capacity=1, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+
+    bucket.pause(10)
+    bucket.acquire()
+
+    assert clock.now == 11.0
+    assert bucket.pauses == 1
@@ -3,10 +3,16 @@ from __future__ import annotations
 from argparse import Namespace
 
 from pipelines.run_local_pipeline import resolve_tickers, run_once
+from sentiment.scorer_registry import close_sentiment_scorers
 from storage.local_mysql_storage import LocalMySQLStorage
 
 
-def test_run_local_pipeline_smoke_with_demo_seed(tmp_path):
+def test_run_local_pipeline_smoke_with_demo_seed(tmp_path, monkeypatch):
+    # Keep the run's local state out of the repository's .data directory.
+    monkeypatch.setattr("config.settings.sentiment_cache_path", str(tmp_path / "scores.sqlite"))
+    monkeypatch.setattr("config.settings.ingestion_cursor_path", str(tmp_path / "cursors.json"))
+    monkeypatch.setattr("config.settings.feed_cache_path", str(tmp_path / "feeds.json"))
+    close_sentiment_scorers()
     database_url = f"sqlite:///{tmp_path / 'pipeline.db'}"
     args = Namespace(
         database_url=database_url,
@@ -18,6 +24,7 @@ def test_run_local_pipeline_smoke_with_demo_seed(tmp_path):
         include_finnhub=False,
         skip_public_news=True,
         skip_political_news=False,
+        async_ingestion=False,
         sentiment_backend="lexicon",
         skip_simulation=True,
         skip_evaluation=True,
@@ -31,7 +38,10 @@ def test_run_local_pipeline_smoke_with_demo_seed(tmp_path):
         log_level="INFO",
     )
 
-    summary = run_once(args)
+    try:
+        summary = run_once(args)
+    finally:
+        close_sentiment_scorers()
 
     assert summary["raw_headlines_collected"] == 2
     assert summary["scored_headlines_saved_attempted"] == 2
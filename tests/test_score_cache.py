@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+
+from models.raw_headline import RawHeadline
+from models.sentiment_result import SentimentResult
+from sentiment.lexicon_scorer import LexiconSentimentScorer
+from sentiment.score_cache import SentimentScoreCache, score_texts_with_cache
+
+
+def make_result(score: float) -> SentimentResult:
+    return SentimentResult(
+        label="positive",
+        positive_score=score,
+        neutral_score=0.1,
+        negative_score=0.0,
+        compound_score=score,
+        confidence=score,
+    )
+
+
+def test_cache_serves_repeated_text_without_rescoring(tmp_path):
+    cache = SentimentScoreCache(tmp_path / "scores.sqlite")
+    scored_batches: list[list[str]] = []
+
+    def score_texts(texts):
+        scored_batches.append(texts)
+        return [make_result(0.5) for _ in texts]
+
+    score_texts_with_cache(["Apple beats", "Chip rally"], score_texts, cache, "finbert", "m")
+    results = score_texts_with_cache(
+        ["Apple  beats ", "New story"],
+        score_texts,
+        cache,
+        "finbert",
+        "m",
+    )
+
+    assert scored_batches == [["Apple beats", "Chip rally"], ["New story"]]
+    assert results[0] == make_result(0.5)
+    assert cache.stats.hit_ratio == 0.25
+
+
+def test_cache_keys_are_scoped_by_backend_and_model(tmp_path):
+    cache = SentimentScoreCache(tmp_path / "scores.sqlite")
+    cache.put_many({cache.cache_key("finbert", "a", "Same text"): make_result(0.9)})
+
+    assert cache.get_many([cache.cache_key("finbert", "b", "Same text")]) == {}
+    assert cache.get_many([cache.cache_key("lexicon", "a", "Same text")]) == {}
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    path = tmp_path / "scores.sqlite"
+    cache = SentimentScoreCache(path, max_entries=2)
+    first, second, third = (cache.cache_key("lexicon", "v1", text) for text in "abc")
+    cache.put_many({first: make_result(0.1)})
+    cache.put_many({second: make_result(0.2)})
+    cache.get_many([first])
+    cache.put_many({third: make_result(0.3)})
+    cache.close()
+
+    reopened = SentimentScoreCache(path, max_entries=2)
+    assert set(reopened.get_many([first, second, third])) == {first, third}
+    assert reopened.stats.hits == 2
+
+
+def test_lexicon_scorer_results_match_with_cache(tmp_path):
+    headlines = [
+        RawHeadline(
+            ticker=ticker,
+            headline="Regulators open antitrust probe into chipmaker",
+            source="Reuters",
+            url="",
+            published_at_utc=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        for ticker in ("NVDA", "AMD")
+    ]
+    uncached = LexiconSentimentScorer().score_batch(headlines)
+    cached_scorer = LexiconSentimentScorer(
+        score_cache=SentimentScoreCache(tmp_path / "scores.sqlite"),
+    )
+
+    first_run = cached_scorer.score_batch(headlines)
+    second_run = cached_scorer.score_batch(headlines)
+
+    assert [row.compound_score for row in first_run] == [
+        row.compound_score for row in uncached
+    ]
+    assert [row.ticker for row in second_run] == ["NVDA", "AMD"]
+    assert cached_scorer.score_cache.stats.hits == 2
@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from models.raw_headline import RawHeadline
+from sentiment import scorer_pool
+from sentiment.finbert_scorer import FinBERTScorer
+from sentiment.score_cache import SentimentScoreCache
+from sentiment.scorer_pool import SentimentScorerPool, default_start_method
+
+
+class KeywordClassifier:
+    """Deterministic stand-in for the transformers pipeline; fork-inherited."""
+
+    tokenizer = None
+
+    def __call__(self, texts, batch_size=None):
+        results = []
+        for text in texts:
+            positive = 0.8 if "beats" in text or "record" in text else 0.1
+            negative = 0.8 if "fall" in text or "recall" in text else 0.1
+            results.append(
+                [
+                    {"label": "positive", "score": positive},
+                    {"label": "negative", "score": negative},
+                    {"label": "neutral", "score": round(1 - positive - negative, 6)},
+                ]
+            )
+        return results
+
+
+def make_headline(ticker: str, text: str) -> RawHeadline:
+    return RawHeadline(
+        ticker=ticker,
+        headline=text,
+        source="Reuters",
+        url=f"https://example.com/{ticker}",
+        published_at_utc=datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc),
+    )
+
+
+HEADLINES = [
+    make_headline("AAPL", "Apple beats earnings and raises guidance"),
+    make_headline("MSFT", "Microsoft shares fall after weak cloud outlook"),
+    make_headline("NVDA", ""),
+    make_headline("TSLA", "Tesla recalls vehicles over safety probe"),
+    make_headline("AMZN", "Amazon announces record holiday sales"),
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_finbert(monkeypatch):
+    monkeypatch.setattr(
+        "sentiment.finbert_scorer.pipeline",
+        lambda **kwargs: KeywordClassifier(),
+    )
+    monkeypatch.setattr(scorer_pool, "_worker_scorer", None)
+    monkeypatch.setattr(scorer_pool, "_worker_key", None)
+
+
+def test_pool_matches_single_process_scorer_in_order():
+    expected = FinBERTScorer(model_name="fake/finbert", device=-1).score_batch(HEADLINES)
+
+    with SentimentScorerPool(
+        model_name="fake/finbert",
+        processes=2,
+        chunk_size=1,
+        start_method="fork",
+    ) as pool:
+        scored = pool.score_batch(HEADLINES)
+
+    assert (pool.backend_name, pool.model_name) == ("finbert", "fake/finbert")
+    assert [item.ticker for item in scored] == ["AAPL", "MSFT", "TSLA", "AMZN"]
+    assert [item.compound_score for item in scored] == [
+        item.compound_score for item in expected
+    ]
+    assert pool.batch_stats.texts == 4
+    assert pool.batch_stats.batches == 4
+
+
+def test_pool_serves_cached_texts_without_workers(tmp_path):
+    cache = SentimentScoreCache(tmp_path / "scores.sqlite")
+    with SentimentScorerPool(
+        model_name="fake/finbert",
+        processes=1,
+        score_cache=cache,
+        start_method="fork",
+    ) as pool:
+        pool.score_batch(HEADLINES)
+        pool.score_batch(HEADLINES)
+
+    assert cache.stats.lookups == 8
+    assert cache.stats.hits == 4
+    assert pool.batch_stats.texts == 4
+
+
+def test_pool_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        SentimentScorerPool(backend="lexicon", processes=1)
+
+
+def test_default_start_method_never_forks():
+    assert default_start_method() in {"forkserver", "spawn"}
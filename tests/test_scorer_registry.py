@@ -0,0 +1,84 @@
+import threading
+
+from sentiment import scorer_registry
+from sentiment.scorer_registry import LazySentimentScorer, get_sentiment_scorer
+from sentiment.token_batching import TokenBatchStats
+
+
+class RecordingScorer:
+    def __init__(self):
+        self.batch_stats = TokenBatchStats()
+        self.scored_texts: list[list[str]] = []
+        self.closed = False
+
+    def score_texts(self, texts):
+        self.scored_texts.append(texts)
+        self.batch_stats.texts += len(texts)
+        return [None for _ in texts]
+
+    def score_batch(self, headlines):
+        self.batch_stats.texts += len(headlines)
+        return list(headlines)
+
+    def close(self):
+        self.closed = True
+
+
+def test_scorer_is_built_on_first_use_and_kept():
+    built: list[RecordingScorer] = []
+
+    def build():
+        built.append(RecordingScorer())
+        return built[-1]
+
+    lazy = LazySentimentScorer(build)
+    assert not lazy.loaded
+    assert built == []
+
+    lazy.score_batch(["a"])
+    lazy.reset_run_stats()
+    lazy.score_batch(["b", "c"])
+
+    assert len(built) == 1
+    assert lazy.stats.loads == 0
+    assert lazy.batch_stats.texts == 2
+
+
+def test_background_warm_up_loads_and_runs_dummy_batch():
+    release = threading.Event()
+    scorer = RecordingScorer()
+
+    def build():
+        release.wait(timeout=5)
+        return scorer
+
+    lazy = LazySentimentScorer(build)
+    thread = lazy.warm_up_in_background()
+    release.set()
+    lazy.score_batch(["headline"])
+    thread.join(timeout=5)
+
+    assert scorer.scored_texts == [scorer_registry.WARMUP_TEXTS]
+    assert lazy.stats.loads == 1
+    assert lazy.stats.warmups == 1
+    assert lazy.batch_stats.texts == 1
+    assert lazy.warm_up_in_background() is None
+
+
+def test_registry_shares_one_scorer_per_backend(monkeypatch):
+    monkeypatch.setattr(scorer_registry, "_scorers", {})
+    monkeypatch.setattr(
+        scorer_registry,
+        "build_sentiment_scorer",
+        lambda backend: RecordingScorer(),
+    )
+
+    lexicon = get_sentiment_scorer("lexicon")
+    assert get_sentiment_scorer("LEXICON") is lexicon
+    assert get_sentiment_scorer("finbert") is not lexicon
+
+    loaded = lexicon.get()
+    scorer_registry.close_sentiment_scorers()
+
+    assert loaded.closed
+    assert scorer_registry._scorers == {}
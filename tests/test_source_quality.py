@@ -0,0 +1,68 @@
+import json
+import os
+
+from sentiment.source_quality import TIER1_SOURCES, TIER2_SOURCES, SourceClassifier
+
+
+def legacy_classify_source(source: str) -> int:
+    """The original per-call substring scan, kept as the reference behaviour."""
+    source_lower = source.strip().lower()
+    if any(known_source in source_lower for known_source in TIER1_SOURCES):
+        return 1
+    if any(known_source in source_lower for known_source in TIER2_SOURCES):
+        return 2
+    return 3
+
+
+def test_compiled_classifier_matches_substring_scan():
+    classifier = SourceClassifier()
+    sources = [
+        "Reuters",
+        "  BLOOMBERG  ",
+        "Microsoft Blog",
+        "Seeking Alpha",
+        "Yahoo Finance via AP",
+        "Google News",
+        "Some Random Blog",
+        "",
+        "Nasdaq / FT",
+    ]
+
+    assert [classifier.classify(source) for source in sources] == [
+        legacy_classify_source(source) for source in sources
+    ]
+
+
+def test_repeated_sources_are_memoized():
+    classifier = SourceClassifier()
+
+    for _ in range(3):
+        classifier.classify("Benzinga")
+
+    assert classifier.memo_info() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_config_file_changes_are_hot_reloaded(tmp_path):
+    path = tmp_path / "source_tiers.json"
+    path.write_text(json.dumps({"tier1": ["reuters"], "tier2": []}))
+    classifier = SourceClassifier(path=path, reload_seconds=0)
+
+    assert classifier.classify("Barron's") == 3
+
+    path.write_text(json.dumps({"tier1": ["reuters"], "tier2": ["barron's"]}))
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert classifier.classify("Barron's") == 2
+
+
+def test_invalid_config_keeps_loaded_tiers(tmp_path):
+    path = tmp_path / "source_tiers.json"
+    path.write_text(json.dumps({"tier1": ["reuters"], "tier2": []}))
+    classifier = SourceClassifier(path=path, reload_seconds=0)
+
+    path.write_text("{not json")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert classifier.classify("Reuters") == 1
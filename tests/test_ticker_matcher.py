@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+
+from config.news_topics import TICKER_COMPANY_NAMES
+from config.watchlist import get_default_watchlist
+from ingestion.keyword_matcher import build_trie_pattern
+from ingestion.ticker_matcher import TickerMatcher
+
+
+def legacy_match_tickers(search_text: str, tickers: list[str]) -> list[str]:
+    """Per-ticker substring rules used before the compiled matcher."""
+    matched: list[str] = []
+    for ticker in tickers:
+        company_name = TICKER_COMPANY_NAMES.get(ticker, ticker)
+        normalized_ticker = ticker.lower()
+        compact_ticker = normalized_ticker.replace(".", "")
+        if len(compact_ticker) <= 2:
+            symbol_mentioned = f"${compact_ticker}" in search_text
+        else:
+            symbol_mentioned = (
+                f" {normalized_ticker} " in f" {search_text} "
+                or f"${compact_ticker}" in search_text
+            )
+        if (
+            company_name.lower() in search_text
+            or symbol_mentioned
+            or (len(compact_ticker) > 2 and f" {compact_ticker} " in f" {search_text} ")
+        ):
+            matched.append(ticker)
+    return matched
+
+
+def sample_texts(count: int, seed: int = 7) -> list[str]:
+    generator = random.Random(seed)
+    tickers = get_default_watchlist()
+    names = list(TICKER_COMPANY_NAMES.values())
+    filler = ["markets", "rally", "as", "investors", "weigh", "earnings,", "the", "outlook."]
+    texts: list[str] = []
+    for _ in range(count):
+        words = [generator.choice(filler) for _ in range(generator.randint(4, 20))]
+        for _ in range(generator.randint(0, 3)):
+            position = generator.randint(0, len(words))
+            choice = generator.random()
+            if choice < 0.4:
+                words.insert(position, generator.choice(names))
+            elif choice < 0.7:
+                words.insert(position, generator.choice(tickers))
+            else:
+                words.insert(position, "$" + generator.choice(tickers).replace(".", ""))
+        texts.append(" ".join(words).lower())
+    return texts
+
+
+def test_ticker_matcher_matches_legacy_rules_on_sp500_universe():
+    tickers = get_default_watchlist()
+    matcher = TickerMatcher(tickers)
+    texts = sample_texts(300) + [
+        "intuitive surgical beats as intuit slips",
+        "brk.b and $brkb rally",
+        "$t and $c move",
+        "",
+    ]
+
+    for text in texts:
+        assert matcher.match(text) == legacy_match_tickers(text, tickers), text
+
+
+def test_build_trie_pattern_prefers_longest_phrase():
+    import re
+
+    pattern = re.compile(build_trie_pattern(["intuit", "intuitive surgical", "ibm"]))
+
+    assert pattern.match("intuitive surgical rises").group(0) == "intuitive surgical"
+    assert pattern.match("intuit falls").group(0) == "intuit"
@@ -2,8 +2,37 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import hashlib
 import re
+from typing import Any
 from models.raw_headline import RawHeadline
 
+
+def content_hash(
+    ticker: str,
+    headline: str,
+    source: str,
+    url: str,
+    published_at_utc: datetime,
+    summary: str | None,
+    category: str,
+    topic: str | None,
+    industry: str | None,
+) -> str:
+    hash_input = "||".join(
+        [
+            ticker,
+            headline,
+            source,
+            url,
+            published_at_utc.isoformat(),
+            summary or "",
+            category,
+            topic or "",
+            industry or "",
+        ]
+    )
+    return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+
+
 class HeadlineNormalizer:
     @staticmethod
     def _clean_text(value: str | None) -> str:
@@ -40,7 +69,7 @@ class HeadlineNormalizer:
         raise TypeError(f"Unsupported timestamp type: {type(value)}")
     
     def normalize(self, headline: RawHeadline) -> RawHeadline:
-        return RawHeadline(
+        normalized = RawHeadline(
             ticker=self._clean_text(headline.ticker).upper(),
             headline=self._clean_text(headline.headline),
             source=self._clean_text(headline.source) or "unknown",
@@ -51,20 +80,20 @@ class HeadlineNormalizer:
             topic=self._clean_optional_text(headline.topic),
             industry=self._clean_optional_text(headline.industry),
         )
+        normalized.content_hash = self.build_content_hash(normalized)
+        return normalized
     
     @staticmethod
-    def build_content_hash(headline: RawHeadline) -> str:
-        hash_input = "||".join(
-            [
-                headline.ticker,
-                headline.headline,
-                headline.source,
-                headline.url,
-                headline.published_at_utc.isoformat(),
-                headline.summary or "",
-                headline.category,
-                headline.topic or "",
-                headline.industry or "",
-            ]
+    def build_content_hash(headline: Any) -> str:
+        """Hash of a RawHeadline or ScoredHeadline's identifying fields."""
+        return content_hash(
+            headline.ticker,
+            headline.headline,
+            headline.source,
+            headline.url,
+            headline.published_at_utc,
+            headline.summary,
+            headline.category,
+            headline.topic,
+            headline.industry,
         )
-        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
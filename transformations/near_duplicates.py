@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import re
+from typing import Iterable, Sequence
+import zlib
+
+import numpy as np
+
+from models.headline_batch import HeadlineBatch
+from sentiment.source_quality import get_source_classifier
+
+
+# Universal hashing modulo 2**31 - 1: with a, b, x below the prime,
+# a * x + b stays inside uint64.
+MINHASH_PRIME = (1 << 31) - 1
+SHINGLE_SIZE = 4
+
+BRACKETED_TAG_PATTERN = re.compile(r"^\s*(?:\[[^\]]{1,40}\]|\([^)]{1,40}\))\s*")
+# " - Reuters", " | Bloomberg", " — WSJ": a short trailing segment that is
+# stripped only when it names the row's source or a known outlet.
+TRAILING_SEGMENT_PATTERN = re.compile(r"\s+[-–—|:]\s+(\S+(?:\s+\S+){0,3})\s*$")
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def outlet_key(name: str) -> str:
+    """Casefolded outlet name with punctuation collapsed, as compared to title tails."""
+    return NON_WORD_PATTERN.sub(" ", name.casefold()).strip()
+
+
+def story_text(
+    title: str,
+    source: str | None = None,
+    known_outlets: frozenset[str] = frozenset(),
+) -> str:
+    """
+    Title with source tags and punctuation removed, as compared for near-duplicates.
+
+    A trailing " - X" is dropped only when X is the row's `source` or one of
+    `known_outlets` (keys from `outlet_key`), so "Outlook - analysts turn
+    bearish" keeps the words that carry its sentiment.
+    """
+    text = BRACKETED_TAG_PATTERN.sub("", title.casefold())
+    match = TRAILING_SEGMENT_PATTERN.search(text)
+    if match is not None:
+        tail = outlet_key(match.group(1))
+        is_outlet = tail in known_outlets or (source is not None and tail == outlet_key(source))
+        stripped = text[: match.start()]
+        # Keep titles that are nothing but "X - Y" intact rather than emptying them.
+        if is_outlet and len(stripped.split()) >= 3:
+            text = stripped
+    return NON_WORD_PATTERN.sub(" ", text).strip()
+
+
+def title_shingles(
+    title: str,
+    source: str | None = None,
+    known_outlets: frozenset[str] = frozenset(),
+) -> np.ndarray:
+    """CRC32 of each character 4-gram of the story text, as uint64."""
+    text = story_text(title, source, known_outlets)
+    if len(text) <= SHINGLE_SIZE:
+        grams = {text}
+    else:
+        grams = {
+            text[start : start + SHINGLE_SIZE]
+            for start in range(len(text) - SHINGLE_SIZE + 1)
+        }
+    return np.fromiter(
+        (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+
+
+@dataclass(slots=True)
+class NearDuplicateStats:
+    headlines: int = 0
+    clusters: int = 0
+    near_duplicates: int = 0
+    evicted: int = 0
+
+    @property
+    def duplicate_ratio(self) -> float:
+        return round(self.near_duplicates / self.headlines, 4) if self.headlines else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "headlines": self.headlines,
+            "clusters": self.clusters,
+            "near_duplicates": self.near_duplicates,
+            "duplicate_ratio": self.duplicate_ratio,
+            "evicted": self.evicted,
+        }
+
+
+@dataclass(slots=True)
+class _IndexedStory:
+    cluster_id: str
+    signature: np.ndarray
+    published_at_utc: datetime
+    bucket_keys: list[tuple[str, int, bytes]] = field(default_factory=list)
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures in an LSH index over a sliding publication window.
+
+    Titles are reduced to character 4-gram shingles after source tags and
+    punctuation are stripped, so "Apple beats estimates - Reuters" and
+    "Apple Beats Estimates" share a signature. A trailing tag is stripped
+    only when it names the row's source or a known outlet; by default those
+    are the source-tier outlets, which follow the hot-reloaded tier file.
+    Signatures are split into `bands` bands; stories that collide in any
+    band for the same ticker are
+    candidates, and a candidate joins the cluster when the estimated Jaccard
+    similarity reaches `threshold` and both were published within
+    `window_hours`. The index lives across pipeline runs, so a syndicated
+    copy that arrives an hour later still finds its cluster.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        window_hours: float = 24.0,
+        num_perm: int = 128,
+        bands: int = 32,
+        seed: int = 7,
+        known_outlets: Iterable[str] | None = None,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+
+        self.threshold = threshold
+        self.known_outlets = (
+            None
+            if known_outlets is None
+            else frozenset(outlet_key(name) for name in known_outlets)
+        )
+        self._tier_outlets: tuple[frozenset[str], frozenset[str]] | None = None
+        self.window = timedelta(hours=window_hours)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.stats = NearDuplicateStats()
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MINHASH_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, MINHASH_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        # Each bucket keeps the newest story per cluster: older members of the
+        # same story add nothing a candidate could not already match.
+        self._buckets: dict[tuple[str, int, bytes], dict[str, _IndexedStory]] = {}
+        self._stories: list[_IndexedStory] = []
+
+    def __len__(self) -> int:
+        return len(self._stories)
+
+    def signature(
+        self,
+        title: str,
+        source: str | None = None,
+        known_outlets: frozenset[str] | None = None,
+    ) -> np.ndarray:
+        if known_outlets is None:
+            known_outlets = self._outlets()
+        prime = np.uint64(MINHASH_PRIME)
+        shingles = title_shingles(title, source, known_outlets) % prime
+        return ((self._a * shingles + self._b) % prime).min(axis=1)
+
+    def assign(
+        self,
+        tickers: Sequence[str],
+        titles: Sequence[str],
+        published_at_utc: Sequence[datetime],
+        content_hashes: Sequence[str | None],
+        sources: Sequence[str | None] | None = None,
+    ) -> tuple[list[str], list[bool]]:
+        """
+        Cluster ids per row, and whether each row represents a new story.
+
+        The first row of a story becomes its representative and its content
+        hash becomes the cluster id; later near-duplicates reuse that id.
+        """
+        if sources is None:
+            sources = [None] * len(tickers)
+        rows = list(zip(tickers, titles, published_at_utc, content_hashes, sources))
+        if rows:
+            # Nothing older than the batch's oldest row minus the window can match.
+            self._evict_older_than(min(row[2] for row in rows) - self.window)
+
+        known_outlets = self._outlets()
+        cluster_ids: list[str] = []
+        representative: list[bool] = []
+        for position, (ticker, title, published, content_hash, source) in enumerate(rows):
+            signature = self.signature(title, source, known_outlets)
+            bucket_keys = self._bucket_keys(ticker, signature)
+            match = self._best_match(bucket_keys, signature, published)
+            if match is None:
+                cluster_id = content_hash or f"story-{len(self._stories)}-{position}"
+                self.stats.clusters += 1
+            else:
+                cluster_id = match.cluster_id
+                self.stats.near_duplicates += 1
+
+            story = _IndexedStory(cluster_id, signature, published, bucket_keys)
+            self._stories.append(story)
+            for key in bucket_keys:
+                self._buckets.setdefault(key, {})[cluster_id] = story
+            cluster_ids.append(cluster_id)
+            representative.append(match is None)
+
+        self.stats.headlines += len(rows)
+        return cluster_ids, representative
+
+    def _outlets(self) -> frozenset[str]:
+        if self.known_outlets is not None:
+            return self.known_outlets
+        sources = get_source_classifier().known_sources
+        if self._tier_outlets is None or self._tier_outlets[0] is not sources:
+            self._tier_outlets = (sources, frozenset(outlet_key(name) for name in sources))
+        return self._tier_outlets[1]
+
+    def _bucket_keys(self, ticker: str, signature: np.ndarray) -> list[tuple[str, int, bytes]]:
+        return [
+            (ticker, band, signature[start : start + self.rows_per_band].tobytes())
+            for band, start in enumerate(range(0, len(signature), self.rows_per_band))
+        ]
+
+    def _best_match(
+        self,
+        bucket_keys: list[tuple[str, int, bytes]],
+        signature: np.ndarray,
+        published: datetime,
+    ) -> _IndexedStory | None:
+        candidates: dict[int, _IndexedStory] = {}
+        for key in bucket_keys:
+            for candidate in self._buckets.get(key, {}).values():
+                if abs(candidate.published_at_utc - published) <= self.window:
+                    candidates[id(candidate)] = candidate
+        if not candidates:
+            return None
+
+        stories = list(candidates.values())
+        similarities = np.count_nonzero(
+            np.stack([story.signature for story in stories]) == signature,
+            axis=1,
+        ) / len(signature)
+        best = int(np.argmax(similarities))
+        return stories[best] if similarities[best] >= self.threshold else None
+
+    def _evict_older_than(self, cutoff: datetime) -> None:
+        expired = [story for story in self._stories if story.published_at_utc < cutoff]
+        if not expired:
+            return
+
+        expired_ids = {id(story) for story in expired}
+        self._stories = [story for story in self._stories if id(story) not in expired_ids]
+        for story in expired:
+            for key in story.bucket_keys:
+                bucket = self._buckets.get(key)
+                if bucket is None or bucket.get(story.cluster_id) is not story:
+                    continue
+                del bucket[story.cluster_id]
+                if not bucket:
+                    del self._buckets[key]
+        self.stats.evicted += len(expired)
+
+
+def cluster_headline_batch(
+    batch: HeadlineBatch,
+    index: NearDuplicateIndex,
+) -> tuple[HeadlineBatch, HeadlineBatch]:
+    """
+    Tag every row with its story cluster and pick the rows worth scoring.
+
+    Returns the batch with `story_cluster_id` filled in, for raw storage,
+    and the subset of rows that start a new story, for scoring.
+    """
+    cluster_ids, representative = index.assign(
+        batch.column("ticker"),
+        batch.column("headline"),
+        batch.column("published_at_utc"),
+        batch.column("content_hash"),
+        batch.column("source"),
+    )
+    clustered = batch.with_column("story_cluster_id", cluster_ids)
+    return clustered, clustered.take(np.flatnonzero(representative))
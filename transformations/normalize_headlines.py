@@ -1,8 +1,121 @@
 from __future__ import annotations
-from typing import Iterable, List
+
+from typing import Any, Iterable, List, Mapping, Sequence
+
+import pandas as pd
+
+from models.headline_batch import HeadlineBatch
 from models.raw_headline import RawHeadline
-from transformations.headline_normalizer import HeadlineNormalizer
+from transformations.headline_normalizer import HeadlineNormalizer, content_hash
+
+HEADLINE_COLUMNS = (
+    "ticker",
+    "headline",
+    "source",
+    "url",
+    "published_at_utc",
+    "summary",
+    "category",
+    "topic",
+    "industry",
+)
+OPTIONAL_COLUMN_DEFAULTS: dict[str, Any] = {
+    "summary": None,
+    "category": "financial",
+    "topic": None,
+    "industry": None,
+}
+
+
+def _clean_column(values: Sequence[Any]) -> list[str]:
+    # str.split() splits on exactly the characters re's \s matches, so this is
+    # the normalizer's re.sub(r"\s+", " ", value).strip() without the regex.
+    return [" ".join(value.split()) if value else "" for value in values]
+
+
+def _clean_optional_column(values: Sequence[Any]) -> list[str | None]:
+    return [cleaned or None for cleaned in _clean_column(values)]
+
+
+def normalize_headline_columns(columns: Mapping[str, Sequence[Any]]) -> dict[str, list[Any]]:
+    """
+    Normalize headline fields column by column and hash each row once.
+
+    `columns` maps field names to equal-length sequences; optional fields may
+    be omitted. Cleaning rules match `HeadlineNormalizer.normalize`, and the
+    returned columns include `content_hash`, so storage never hashes again.
+    """
+    row_count = len(columns["ticker"])
+
+    def column(name: str) -> Sequence[Any]:
+        if name in columns:
+            return columns[name]
+        return [OPTIONAL_COLUMN_DEFAULTS[name]] * row_count
+
+    normalized: dict[str, list[Any]] = {
+        "ticker": [value.upper() for value in _clean_column(column("ticker"))],
+        "headline": _clean_column(column("headline")),
+        "source": [value or "unknown" for value in _clean_column(column("source"))],
+        "url": _clean_column(column("url")),
+        "published_at_utc": [
+            HeadlineNormalizer._normalize_timestamp(value)
+            for value in column("published_at_utc")
+        ],
+        "summary": _clean_optional_column(column("summary")),
+        "category": [
+            value.lower() or "financial" for value in _clean_column(column("category"))
+        ],
+        "topic": _clean_optional_column(column("topic")),
+        "industry": _clean_optional_column(column("industry")),
+    }
+    normalized["content_hash"] = [
+        content_hash(*row) for row in zip(*(normalized[name] for name in HEADLINE_COLUMNS))
+    ]
+    return normalized
+
 
 def normalize_headlines(headlines: Iterable[RawHeadline]) -> List[RawHeadline]:
-    normalizer = HeadlineNormalizer()
-    return [normalizer.normalize(headline) for headline in headlines]
\ No newline at end of file
+    headline_list = list(headlines)
+    normalized = normalize_headline_columns(
+        {
+            name: [getattr(headline, name) for headline in headline_list]
+            for name in HEADLINE_COLUMNS
+        }
+    )
+    # Positional construction: HEADLINE_COLUMNS + content_hash is the field order.
+    return [
+        RawHeadline(*row)
+        for row in zip(*(normalized[name] for name in (*HEADLINE_COLUMNS, "content_hash")))
+    ]
+
+
+def normalize_headline_batch(headlines: Iterable[RawHeadline]) -> HeadlineBatch:
+    """Columnar form of `normalize_headlines`; no per-row objects are built."""
+    headline_list = list(headlines)
+    return HeadlineBatch.from_columns(
+        normalize_headline_columns(
+            {
+                name: [getattr(headline, name) for headline in headline_list]
+                for name in HEADLINE_COLUMNS
+            }
+        ),
+        row_type=RawHeadline,
+    )
+
+
+def normalize_headline_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame form of `normalize_headlines`, with a `content_hash` column added."""
+    normalized = normalize_headline_columns(
+        {
+            name: _frame_column_values(frame[name])
+            for name in HEADLINE_COLUMNS
+            if name in frame.columns
+        }
+    )
+    return pd.DataFrame(normalized, index=frame.index)
+
+
+def _frame_column_values(series: pd.Series) -> list[Any]:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return list(series.dt.to_pydatetime())
+    return series.astype(object).where(series.notna(), None).tolist()